@@ -0,0 +1,73 @@
+from typing import Optional
+
+import pytest
+from requests import Response, Session
+
+from trade.utils import HistoryStore, ResponseCache, SessionPool
+from trade.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def local_stores(tmp_path, monkeypatch):
+    """Keep the on disk stores, on by default, out of the user's cache dir."""
+
+    store = HistoryStore()
+    monkeypatch.setattr(store, "history_dir", tmp_path / "history")
+    monkeypatch.setattr(ResponseCache(), "cache_dir", tmp_path / "responses")
+    store._manifests.clear()
+    yield
+    store._manifests.clear()
+
+
+@pytest.fixture
+def make_response():
+    """Factory of canned `requests.Response`, an empty JSON 200 by default."""
+
+    def make_response(
+        status_code: int = 200,
+        content: bytes = b"{}",
+        url: Optional[str] = None,
+        headers: Optional[dict] = None,
+    ) -> Response:
+        response = Response()
+        response.status_code = status_code
+        response.url = url
+        response._content = content
+        response.headers.update(headers or dict())
+        return response
+
+    return make_response
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Session pool & rate limiter reset around the test, with short back offs."""
+
+    pool, limiter = SessionPool(), RateLimiter()
+    pool.close()
+    limiter.reset()
+    monkeypatch.setattr(limiter, "backoff_base", 0.001)
+    yield pool
+    pool.close()
+    limiter.reset()
+
+
+@pytest.fixture
+def mock_get(pool, monkeypatch, make_response):
+    """
+    Patches `Session.get` to answer with `respond(url)` (an empty JSON
+    200 by default) after setting a cookie, returns the requested urls.
+    """
+
+    calls = list()
+
+    def patch(respond=None):
+        def get(self, url, **kwargs):
+            calls.append(url)
+            self.cookies.set("nsit", "cookie")
+            return make_response(url=url) if respond is None else respond(url)
+
+        monkeypatch.setattr(Session, "get", get)
+        return calls
+
+    return patch
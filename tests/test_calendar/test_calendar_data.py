@@ -1,6 +1,8 @@
+import pickle
 from datetime import datetime, timedelta
 
 import pytest
+from pandas.tseries.offsets import BDay
 
 from trade.calendar.calendar_data import (
     WEEKDAY_TO_ISO,
@@ -67,7 +69,8 @@ def test_date_obj_str(given_date):
 @pytest.mark.parametrize("given_date", ["28-Apr-2024", "01-Jan-2024"])
 def test_date_obj_eq(given_date):
     date_obj = DateObj(given_date, date_fmt=DATE_FMT)
-    assert date_obj == given_date
+    assert date_obj == DateObj(given_date, date_fmt=DATE_FMT)
+    assert date_obj != given_date and date_obj.as_str == given_date
 
 
 @pytest.mark.parametrize("given_date", ["28-Apr-2024", "01-Jan-2024"])
@@ -102,6 +105,37 @@ def test_date_obj_lt(given_date):
     assert date_obj < next_day
 
 
+@pytest.mark.parametrize("given_date", ["28-Apr-2024", "1-Nov-2024"])
+def test_date_obj_value_semantics(given_date):
+    date_obj = DateObj(given_date, date_fmt=DATE_FMT)
+    as_date = datetime.strptime(given_date, DATE_FMT).date()
+
+    assert date_obj.raw_date == given_date
+    assert date_obj.as_str == as_date.strftime(DATE_FMT)
+    assert date_obj.as_weekday_iso == as_date.isoweekday()
+    assert hash(date_obj) == hash(as_date)
+    assert len({date_obj, DateObj(date_obj.as_str, DATE_FMT), as_date}) == 1
+    assert date_obj != datetime.combine(as_date, datetime.min.time())
+    assert date_obj <= as_date and date_obj >= as_date
+
+    with pytest.raises(TypeError):
+        date_obj <= given_date
+    assert sorted([date_obj + 1, date_obj - 1, date_obj]) == [
+        date_obj - 1,
+        date_obj,
+        date_obj + 1,
+    ]
+    assert (date_obj + BDay()).as_date == (as_date + BDay()).date()
+    assert pickle.loads(pickle.dumps(date_obj)) == date_obj
+
+
+def test_date_obj_from_date_formats_lazily():
+    date_obj = DateObj.from_date(datetime(2024, 4, 28, 10, 30), DATE_FMT)
+    assert date_obj._as_str is None
+    assert date_obj.as_str == date_obj.raw_date == "28-Apr-2024"
+    assert repr(date_obj) == "DateObj(raw_date='28-Apr-2024', date_fmt='%d-%b-%Y')"
+
+
 # Test the DayOfWeek class
 @pytest.mark.parametrize(
     "weekday, week_iso", [(k, v) for k, v in WEEKDAY_TO_ISO.items()]
@@ -136,9 +170,9 @@ def test_market_holidays_creation():
     holidays_dict = HOLIDAYS_DICT
     market_holidays = MarketHolidays(holidays_dict=holidays_dict, date_fmt=DATE_FMT)
     assert len(market_holidays) == len(holidays_dict)
-    assert market_holidays.next_working == holidays_dict[-1]["trade_day"]
-    assert market_holidays.next_holiday == holidays_dict[1]["trade_day"]
-    assert market_holidays.prev_holiday == holidays_dict[0]["trade_day"]
+    assert market_holidays.next_working.as_str == holidays_dict[-1]["trade_day"]
+    assert market_holidays.next_holiday.as_str == holidays_dict[1]["trade_day"]
+    assert market_holidays.prev_holiday.as_str == holidays_dict[0]["trade_day"]
     assert market_holidays.prev_working is None
 
 
@@ -185,8 +219,8 @@ def test_working_day_date(given_date, next_date, prev_date):
     )
     previous_day = working_date_obj.previous_business_day
     next_day = working_date_obj.next_business_day
-    assert next_day == next_date
-    assert previous_day == prev_date
+    assert next_day == DateObj(next_date, DATE_FMT)
+    assert previous_day == DateObj(prev_date, DATE_FMT)
 
 
 @pytest.mark.freeze_time("2024-04-29 5:10")
@@ -205,8 +239,8 @@ def test_working_day_today_1(given_date, next_date, prev_date):
     next_day = working_date_obj.next_business_day
     prev_day = working_date_obj.previous_business_day
 
-    assert next_day == next_date
-    assert prev_day == prev_date
+    assert next_day == DateObj(next_date, DATE_FMT)
+    assert prev_day == DateObj(prev_date, DATE_FMT)
 
 
 @pytest.mark.freeze_time("2024-04-29 10:40")
@@ -225,5 +259,5 @@ def test_working_day_today_2(given_date, next_date, prev_date):
     next_day = working_date_obj.next_business_day
     prev_day = working_date_obj.previous_business_day
 
-    assert next_day == next_date
-    assert prev_day == prev_date
+    assert next_day == DateObj(next_date, DATE_FMT)
+    assert prev_day == DateObj(prev_date, DATE_FMT)
@@ -0,0 +1,122 @@
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from trade.calendar.expiries import FUTURES, OPTIONS, STOCK_EXPIRY, ExpiryCalendar
+from trade.calendar.sessions import TradingSessions
+
+DATE_FMT = "%d-%b-%Y"
+CONFIG_FILE = Path(__file__).parent.parent.parent / Path("configs/nse.json")
+EXPIRY_RULES = json.loads(CONFIG_FILE.read_text())["MARKET"]["NSE"]["EXPIRY-RULES"]
+
+
+@pytest.fixture
+def expiry_calendar():
+    sessions = TradingSessions(
+        holidays=[
+            date(2024, 5, 1),
+            date(2024, 6, 27),
+            date(2024, 8, 15),
+            date(2024, 12, 25),
+        ],
+        start=date(2015, 1, 1),
+        end=date(2026, 12, 31),
+    )
+    return ExpiryCalendar(sessions, EXPIRY_RULES, DATE_FMT)
+
+
+@pytest.mark.parametrize(
+    "key, year, month, expiry",
+    [
+        (STOCK_EXPIRY, 2024, 4, date(2024, 4, 25)),
+        (STOCK_EXPIRY, 2024, 6, date(2024, 6, 26)),
+        ("NIFTY", 2025, 9, date(2025, 9, 30)),
+        ("BANKNIFTY", 2023, 8, date(2023, 8, 31)),
+        # Weeklies moved to Wednesday, the monthly stayed on Thursday.
+        ("BANKNIFTY", 2023, 10, date(2023, 10, 26)),
+        ("BANKNIFTY", 2024, 2, date(2024, 2, 29)),
+        # The monthly moved to Wednesday too, up to the end of 2024.
+        ("BANKNIFTY", 2024, 3, date(2024, 3, 27)),
+        ("BANKNIFTY", 2024, 11, date(2024, 11, 27)),
+        ("BANKNIFTY", 2024, 12, date(2024, 12, 24)),
+        ("BANKNIFTY", 2025, 1, date(2025, 1, 30)),
+        ("FINNIFTY", 2024, 7, date(2024, 7, 30)),
+    ],
+)
+def test_monthly_expiry(expiry_calendar, key, year, month, expiry):
+    assert expiry_calendar.monthly_expiry(key, year, month) == expiry
+
+
+def test_weekly_expiries_shift_on_holidays(expiry_calendar):
+    assert expiry_calendar.expiries_between(
+        "NIFTY", date(2024, 8, 1), date(2024, 8, 31)
+    ) == [
+        date(2024, 8, 1),
+        date(2024, 8, 8),
+        date(2024, 8, 14),
+        date(2024, 8, 22),
+        date(2024, 8, 29),
+    ]
+    assert expiry_calendar.expiries_between(
+        "NIFTY", date(2024, 8, 1), date(2024, 8, 31), kind=FUTURES
+    ) == [date(2024, 8, 29)]
+
+
+def test_weekly_expiries_follow_rule_changes(expiry_calendar):
+    assert expiry_calendar.expiries_between(
+        "BANKNIFTY", date(2023, 8, 28), date(2023, 9, 14)
+    ) == [date(2023, 8, 31), date(2023, 9, 6), date(2023, 9, 13)]
+    assert expiry_calendar.expiries_between(
+        "BANKNIFTY", date(2024, 11, 20), date(2024, 12, 31)
+    ) == [date(2024, 11, 27), date(2024, 12, 24)]
+    assert expiry_calendar.expiries_between(
+        "BANKNIFTY", date(2024, 3, 1), date(2024, 3, 31)
+    ) == [date(2024, 3, 6), date(2024, 3, 13), date(2024, 3, 20), date(2024, 3, 27)]
+
+
+def test_upcoming(expiry_calendar):
+    expiries = expiry_calendar.upcoming("NIFTY", date(2024, 4, 24))
+
+    assert expiries[FUTURES] == ["25-Apr-2024", "30-May-2024", "26-Jun-2024"]
+    assert expiries[OPTIONS] == [
+        "25-Apr-2024",
+        "02-May-2024",
+        "09-May-2024",
+        "16-May-2024",
+        "23-May-2024",
+        "30-May-2024",
+        "26-Jun-2024",
+    ]
+    assert expiry_calendar.upcoming(STOCK_EXPIRY, date(2024, 4, 26))[OPTIONS] == [
+        "30-May-2024",
+        "26-Jun-2024",
+        "25-Jul-2024",
+    ]
+
+
+def test_reconcile(expiry_calendar):
+    today = date(2024, 4, 26)
+    assert expiry_calendar.needs_reconcile(STOCK_EXPIRY, today)
+
+    expiry_calendar.reconcile(
+        STOCK_EXPIRY,
+        futures=["30-May-2024", "27-Jun-2024", "25-Jul-2024"],
+        options=["30-May-2024", "27-Jun-2024", "25-Jul-2024", "26-Sep-2024"],
+        today=today,
+    )
+
+    assert not expiry_calendar.needs_reconcile(STOCK_EXPIRY, today)
+    assert expiry_calendar.needs_reconcile(STOCK_EXPIRY, date(2024, 4, 29))
+    assert expiry_calendar.upcoming(STOCK_EXPIRY, today) == {
+        FUTURES: ["30-May-2024", "27-Jun-2024", "25-Jul-2024"],
+        OPTIONS: ["30-May-2024", "27-Jun-2024", "25-Jul-2024", "26-Sep-2024"],
+    }
+    assert expiry_calendar.expiries_between(
+        STOCK_EXPIRY, date(2024, 6, 1), date(2024, 6, 30), kind=FUTURES
+    ) == [date(2024, 6, 27)]
+    # Queries from before the reconciliation only follow the rules.
+    assert expiry_calendar.expiries_between(
+        STOCK_EXPIRY, date(2024, 4, 1), date(2024, 6, 30), kind=FUTURES
+    ) == [date(2024, 4, 25), date(2024, 5, 30), date(2024, 6, 26)]
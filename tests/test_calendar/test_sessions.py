@@ -0,0 +1,164 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trade.calendar.calendar_data import DateObj, MarketHolidays, WorkingDayDate
+from trade.calendar.sessions import TradingSessions
+
+MARKET_TIMINGS = {
+    "start_time": "0915",
+    "close_time": "1530",
+    "time_zone": "Asia/Kolkata",
+    "time_cutoff": "1600",
+}
+DATE_FMT = "%d-%b-%Y"
+FROZEN_DATE = "2024-04-24"
+HOLIDAYS_DICT = [
+    {"trade_day": "01-May-2024", "week_day": "Wednesday", "description": "Holiday"},
+    {"trade_day": "15-Aug-2024", "week_day": "Thursday", "description": "Holiday"},
+    {"trade_day": "03-Nov-2024", "week_day": "Sunday", "description": "Muhurat*"},
+]
+
+
+@pytest.fixture
+def sessions():
+    return TradingSessions(
+        holidays=[date(2024, 5, 1), date(2024, 8, 15)],
+        working_days=[date(2024, 11, 3)],
+        start=date(2024, 1, 1),
+        end=date(2024, 12, 31),
+    )
+
+
+def test_sessions_membership(sessions):
+    assert date(2024, 4, 30) in sessions
+    assert date(2024, 5, 1) not in sessions
+    assert date(2024, 5, 4) not in sessions
+    assert sessions.is_session(np.datetime64("2024-11-03"))
+    assert sessions.is_session("2024-08-16")
+    assert sessions.sessions.dtype == np.dtype("datetime64[D]")
+
+
+@pytest.mark.parametrize(
+    "day, n, next_day, prev_day",
+    [
+        (date(2024, 4, 30), 1, date(2024, 5, 2), date(2024, 4, 29)),
+        (date(2024, 5, 1), 1, date(2024, 5, 2), date(2024, 4, 30)),
+        (date(2024, 8, 14), 1, date(2024, 8, 16), date(2024, 8, 13)),
+        (date(2024, 11, 1), 1, date(2024, 11, 3), date(2024, 10, 31)),
+        (date(2024, 11, 4), 1, date(2024, 11, 5), date(2024, 11, 3)),
+        (date(2024, 4, 29), 3, date(2024, 5, 3), date(2024, 4, 24)),
+    ],
+)
+def test_next_prev_session(sessions, day, n, next_day, prev_day):
+    assert sessions.next_session(day, n) == next_day
+    assert sessions.prev_session(day, n) == prev_day
+    assert sessions.session_offset(day, n) == next_day
+    assert sessions.session_offset(day, -n) == prev_day
+
+
+def test_session_offset_zero_rolls_back(sessions):
+    assert sessions.session_offset(date(2024, 5, 1), 0) == date(2024, 4, 30)
+    assert sessions.session_offset(date(2024, 5, 2), 0) == date(2024, 5, 2)
+
+
+def test_sessions_between(sessions):
+    between = sessions.sessions_between(date(2024, 4, 29), date(2024, 5, 6))
+    assert between.astype(object).tolist() == [
+        date(2024, 4, 29),
+        date(2024, 4, 30),
+        date(2024, 5, 2),
+        date(2024, 5, 3),
+        date(2024, 5, 6),
+    ]
+    assert (
+        sessions.session_index(date(2024, 5, 6))
+        - sessions.session_index(date(2024, 4, 29))
+        == 4
+    )
+
+
+def test_out_of_range(sessions):
+    with pytest.raises(ValueError):
+        sessions.next_session(date(2024, 12, 31))
+
+    with pytest.raises(ValueError):
+        sessions.prev_session(date(2024, 1, 1))
+
+
+@pytest.mark.freeze_time(FROZEN_DATE)
+def test_market_holidays_contains():
+    market_holidays = MarketHolidays(HOLIDAYS_DICT, date_fmt=DATE_FMT)
+    assert "01-May-2024" in market_holidays
+    assert date(2024, 8, 15) in market_holidays
+    assert date(2024, 8, 16) not in market_holidays
+    assert market_holidays.sessions is market_holidays.sessions
+
+
+@pytest.mark.freeze_time(FROZEN_DATE)
+@pytest.mark.parametrize(
+    "given_date, days, added, subtracted",
+    [
+        ("30-Apr-2024", 1, "02-May-2024", "29-Apr-2024"),
+        ("14-Aug-2024", 2, "19-Aug-2024", "12-Aug-2024"),
+        ("01-Nov-2024", 1, "03-Nov-2024", "31-Oct-2024"),
+    ],
+)
+def test_working_day_date_arithmetic(given_date, days, added, subtracted):
+    working_date_obj = WorkingDayDate(
+        given_date, HOLIDAYS_DICT, market_timings=MARKET_TIMINGS, date_fmt=DATE_FMT
+    )
+    assert (working_date_obj + days).day == DateObj(added, DATE_FMT)
+    assert (working_date_obj - days).day == DateObj(subtracted, DATE_FMT)
+
+
+def test_vectorized_series(sessions):
+    days = pd.Series(
+        pd.to_datetime(["2024-04-30", "2024-05-01", None, "2024-05-03", "2024-05-07"]),
+        index=list("abcde"),
+        name="dated",
+    ).dt.tz_localize("Asia/Kolkata")
+
+    assert sessions.is_trading_day(days).tolist() == [True, False, False, True, True]
+    assert sessions.session_gaps(days).tolist() == [0, 0, 0, 0, 2]
+    assert sessions.next_sessions(days).index.tolist() == list("abcde")
+    assert sessions.next_sessions(days).tolist()[:2] == [pd.Timestamp("2024-05-02")] * 2
+    assert sessions.prev_sessions(days).isna().tolist() == [
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+    ordinals = sessions.session_ordinals(days)
+    assert ordinals["a"] == ordinals["b"] == sessions.session_index(date(2024, 4, 30))
+    assert ordinals["c"] == -1
+
+
+def test_vectorized_array_matches_scalar(sessions):
+    days = np.arange(
+        np.datetime64("2024-02-01"), np.datetime64("2024-11-30"), dtype="datetime64[D]"
+    )
+    next_days = sessions.next_sessions(days, 2)
+    prev_days = sessions.prev_sessions(days, 2)
+
+    assert isinstance(next_days, np.ndarray)
+    assert next_days.astype(object).tolist() == [
+        sessions.next_session(i, 2) for i in days
+    ]
+    assert prev_days.astype(object).tolist() == [
+        sessions.prev_session(i, 2) for i in days
+    ]
+    assert sessions.is_trading_day(days).tolist() == [
+        sessions.is_session(i) for i in days
+    ]
+
+
+def test_vectorized_out_of_range(sessions):
+    days = np.array(["2023-12-25", "2024-12-31"], dtype="datetime64[D]")
+    assert np.isnat(sessions.next_sessions(days))[1]
+    assert np.isnat(sessions.prev_sessions(days))[0]
+    assert sessions.session_ordinals(days)[0] == -1
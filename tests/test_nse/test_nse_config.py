@@ -5,7 +5,7 @@ import pytest
 import requests
 from pandas import DataFrame
 
-from trade.nse.nse_configs.nse_config import DATE_FMT, NSEConfig
+from trade.nse.nse_configs.nse_config import BHAV_FRAME_COLS, DATE_FMT, NSEConfig
 
 MARKET, COUNTRY = "NSE", "INDIA"
 DATED = datetime.today().strftime(DATE_FMT)
@@ -54,6 +54,21 @@ def test_get_eq_bhavcopy():
     assert isinstance(bhavcopy, DataFrame)
 
 
+@pytest.mark.freeze_time("2024-05-17 15:20")
+def test_get_eq_bhav_frame():
+    dated = datetime.today().date().strftime(DATE_FMT)
+    nse_config = NSEConfig(dated, market=MARKET, country=COUNTRY)
+    bhav_frame = nse_config.get_eq_bhav_frame()
+
+    assert bhav_frame is nse_config.get_eq_stocks_by_mcap()
+    assert bhav_frame.index.is_unique
+    assert bhav_frame.loc["RELIANCE", "symbol"] == "RELIANCE"
+    assert bhav_frame.columns.tolist() == BHAV_FRAME_COLS
+    assert bhav_frame.symbol.dtype == "category"
+    assert bhav_frame.close.dtype == "float32"
+    assert bhav_frame.volume.dtype == "int64"
+
+
 def test_init(nse_config):
     assert nse_config.today == DATED
     assert nse_config.market == MARKET
@@ -76,7 +91,7 @@ def test_get_equity_quote_symbol_none(nse_config):
 
 
 def test_get_eq_bhavcopy_url_error(nse_config, monkeypatch):
-    def mock_download_data(url, headers):
+    def mock_download_data(url, headers, **kwargs):
         raise requests.exceptions.RequestException
 
     monkeypatch.setattr(nse_config, "download_data", mock_download_data)
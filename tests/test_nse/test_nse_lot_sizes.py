@@ -0,0 +1,51 @@
+from datetime import date
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trade.nse.nse_configs.nse_lot_sizes import LotSizeTable, to_month
+
+MKTLOTS = """UNDERLYING                          ,SYMBOL      ,JUN-24    ,JUL-24    ,MAY-24    ,
+Derivatives on Individual Securities,Symbol      ,JUN-24    ,JUL-24    ,MAY-24    ,
+AARTI INDUSTRIES LTD                ,AARTIIND    ,1000      ,          ,1000      ,
+ABB INDIA LIMITED                   ,ABB         ,125       ,250       ,125       ,
+NEW LISTING LTD                     ,NEWCO       ,          ,500       ,          ,
+"""
+
+
+@pytest.fixture
+def lots() -> LotSizeTable:
+    data = pd.read_csv(StringIO(MKTLOTS), dtype=str, skipinitialspace=True)
+    return LotSizeTable.from_frame(data)
+
+
+def test_from_frame(lots):
+    assert lots.symbols == ["AARTIIND", "ABB", "NEWCO"]
+    assert lots.months.tolist() == list(
+        np.array(["2024-05", "2024-06", "2024-07"], dtype="datetime64[M]").tolist()
+    )
+    assert lots.as_dataframe().loc["ABB"].tolist() == [125, 125, 250]
+
+
+def test_lot_size(lots):
+    assert lots.lot_size("ABB", "Jul-24") == 250
+    assert lots.lot_size("ABB", "JUN-24") == 125
+    # Blank & later months resolve to the latest published month.
+    assert lots.lot_size("AARTIIND", "Jul-24") == 1000
+    assert lots.lot_size("ABB", "Dec-24") == 250
+    assert lots.lot_size("NEWCO", "Jun-24") is None
+    assert lots.lot_size("ABB", "Apr-24") is None
+
+    with pytest.raises(KeyError):
+        lots.lot_size("INVALID", "Jun-24")
+
+
+def test_lot_sizes(lots):
+    assert lots.lot_sizes(["ABB", "NEWCO", "INVALID"], to_month(date(2024, 7, 15))) == {
+        "ABB": 250,
+        "NEWCO": 500,
+        "INVALID": None,
+    }
+    assert lots.lot_sizes(["ABB"], "Jan-24") == {"ABB": None}
@@ -0,0 +1,47 @@
+from datetime import date
+from types import SimpleNamespace
+
+from trade.nse.nse_configs.nse_fno import NSEFNO
+from trade.nse.nse_configs.nse_strike_multiples import StrikeMultipleStore
+
+DAY = date(2024, 5, 17)
+
+
+class StrikeMultiples(NSEFNO):
+    def __init__(self, store: StrikeMultipleStore):
+        self.strike_multiple_store = store
+        self.working_day = SimpleNamespace(curr_bday=SimpleNamespace(as_date=DAY))
+        self.computed = list()
+
+    def compute_strike_multiples(self, symbols, concurrency=None):
+        self.computed.append(symbols)
+        return {symbol: 5.0 for symbol in symbols if symbol != "FAILS"}
+
+
+def test_strike_multiple_store(tmp_path):
+    store = StrikeMultipleStore(tmp_path)
+
+    assert store.load(DAY) == dict()
+    assert store.missing(DAY, ["SBIN", "INFY"]) == ["SBIN", "INFY"]
+
+    store.merge(DAY, {"SBIN": 5.0})
+    store.merge(DAY, {"INFY": 20.0})
+
+    assert store.load(DAY) == {"INFY": 20.0, "SBIN": 5.0}
+    assert store.missing(DAY, ["SBIN", "TCS"]) == ["TCS"]
+
+    store.merge(DAY, {"TCS": None})
+    assert store.missing(DAY, ["SBIN", "TCS", "WIPRO"]) == ["TCS", "WIPRO"]
+    assert store.load(date(2024, 5, 20)) == dict()
+
+
+def test_failed_strike_multiples_are_retried(tmp_path):
+    fno = StrikeMultiples(StrikeMultipleStore(tmp_path))
+
+    assert fno.get_strike_multiples(["SBIN", "FAILS"]) == {"SBIN": 5.0}
+    assert "FAILS" not in fno.strike_multiple_store.load(DAY)
+    assert fno.get_strike_multiples(["SBIN", "FAILS", "INFY"]) == {
+        "SBIN": 5.0,
+        "INFY": 5.0,
+    }
+    assert fno.computed == [["SBIN", "FAILS"], ["FAILS", "INFY"]]
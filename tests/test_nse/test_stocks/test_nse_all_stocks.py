@@ -1,6 +1,8 @@
+import pandas as pd
 import pytest
 
 from trade.nse.stocks.nse_all_stocks import AllNSEStocks
+from trade.nse.stocks.stock_universe import StockUniverse
 
 
 @pytest.mark.skip
@@ -16,3 +18,62 @@ def test_all_nse_stocks_post_init_with_symbols():
 def test_all_nse_stocks(tops):
     all_nse_stocks = AllNSEStocks("17-May-2024", nse_top=tops)
     assert len(all_nse_stocks) == tops
+
+
+def test_all_nse_stocks_from_bhavcopy():
+    all_nse_stocks = AllNSEStocks("17-May-2024", ["RELIANCE", "SBIN"])
+    attrs = ("open", "close", "prev_close", "prev_high", "prev_low", "prev_volume")
+
+    assert [str(i) for i in all_nse_stocks.symbols] == ["RELIANCE", "SBIN"]
+    assert all(hasattr(all_nse_stocks[0], i) for i in attrs)
+    assert all_nse_stocks[0]._history is None
+    assert len(all_nse_stocks[0].history) > 0
+
+
+def test_all_nse_stocks_universe_views():
+    all_nse_stocks = AllNSEStocks("17-May-2024", nse_top=20)
+    gainers = all_nse_stocks > 0
+
+    assert isinstance(gainers.symbols, StockUniverse)
+    assert all(i.pct_change >= 0 for i in gainers)
+    assert len(all_nse_stocks[:5]) == 5
+    assert "RELIANCE" in all_nse_stocks
+    assert AllNSEStocks(gainers.dated, symbols=list(gainers)).symbols.symbols == (
+        gainers.symbols.symbols
+    )
+    assert len(all_nse_stocks.as_dataframe()) == 20
+
+
+def test_all_nse_stocks_concurrent_construction():
+    progress = list()
+    all_nse_stocks = AllNSEStocks(
+        "17-May-2024",
+        ["SBIN", "RELIANCE", "INFY"],
+        from_bhavcopy=False,
+        progress=lambda done, total, symbol: progress.append((done, total)),
+    )
+
+    assert [i.symbol for i in all_nse_stocks.symbols] == ["SBIN", "RELIANCE", "INFY"]
+    assert sorted(progress) == [(1, 3), (2, 3), (3, 3)]
+    assert all_nse_stocks.failures == dict()
+
+    history = all_nse_stocks.get_historical_data()
+    assert set(history.keys()) == {"SBIN", "RELIANCE", "INFY"}
+
+
+def test_all_nse_stocks_iter_history(monkeypatch):
+    all_nse_stocks = AllNSEStocks("17-May-2024", nse_top=10)
+    symbols = [str(i) for i in all_nse_stocks.symbols]
+    batches = list()
+
+    def get_batch_period_data(chunk, **kwargs):
+        batches.append(chunk)
+        return {i: pd.DataFrame({"close": [1.0, 2.0]}) for i in chunk}
+
+    monkeypatch.setattr(
+        all_nse_stocks._config, "get_batch_period_data", get_batch_period_data
+    )
+    history = dict(all_nse_stocks.iter_history("1mo", "1d", window=2, chunk_size=3))
+
+    assert sorted(history.keys()) == sorted(symbols)
+    assert sorted(len(i) for i in batches) == [1, 3, 3, 3]
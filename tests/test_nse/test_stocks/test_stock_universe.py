@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from trade.nse.stocks.stock_universe import UNIVERSE_COLUMNS, StockUniverse
+
+
+@pytest.fixture
+def universe():
+    data = pd.DataFrame(
+        {
+            "sr_no": [1, 2, 3, 4],
+            "symbol": ["RELIANCE", "TCS", "HDFCBANK", "SBIN"],
+            "close": [2900.0, 3800.0, 1500.0, 820.0],
+            "prev_close": [2800.0, 3900.0, 1500.0, 780.0],
+            "pct_change": [3.57, -2.56, 0.0, 5.13],
+            "volume": [10, 20, 30, 40],
+            "prev_volume": [5, None, 30, 4],
+        }
+    )
+    return StockUniverse.from_frame(data, fno_symbols=["RELIANCE", "SBIN"])
+
+
+def test_from_frame(universe):
+    assert len(universe) == 4
+    assert all(universe.has_column(i) for i in UNIVERSE_COLUMNS)
+    assert universe.column("mcap_rank").tolist() == [1, 2, 3, 4]
+    assert universe.column("prev_volume").tolist() == [5, 0, 30, 4]
+    assert universe.column("open").tolist() == [0.0] * 4
+    assert universe.column("is_fno").tolist() == [True, False, False, True]
+    assert universe["SBIN"]["close"] == 820.0
+
+
+def test_views_share_columns(universe):
+    gainers = universe > 3
+    losers = universe < -1
+
+    assert gainers.symbols == ["RELIANCE", "SBIN"]
+    assert losers.symbols == ["TCS"]
+    assert (gainers > 5).symbols == ["SBIN"]
+    assert universe[1:3].symbols == ["TCS", "HDFCBANK"]
+    assert universe[universe.column("is_fno")].symbols == ["RELIANCE", "SBIN"]
+    assert "SBIN" in gainers and "TCS" not in gainers
+    # Rows keep their position in the base universe.
+    assert gainers[1]["symbol"] == "SBIN"
+    assert [i["symbol"] for i in gainers] == ["RELIANCE", "SBIN"]
+
+
+def test_take(universe):
+    view = universe.take(["SBIN", "INFY", "RELIANCE"])
+
+    assert view.symbols == ["SBIN", "RELIANCE"]
+    assert view.column("close").tolist() == [820.0, 2900.0]
+    assert view.as_dataframe().symbol.tolist() == ["SBIN", "RELIANCE"]
+
+    with pytest.raises(KeyError):
+        view["TCS"]
+
+
+def test_row_factory(universe):
+    universe.row_factory = lambda base, position: base.symbol_at(position)
+    assert list(universe < 1) == ["TCS", "HDFCBANK"]
@@ -0,0 +1,83 @@
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+from trade.technicals.option_chain.generic_option_chain import (
+    MAX_PCR_OI,
+    QUOTE_OPTION_CHAIN_COLS,
+    parse_option_chain,
+)
+from trade.technicals.option_chain.index_option_chain import IndexOptionChainAnalysis
+
+EXPIRIES = ["27-Jun-2024", "04-Jul-2024"]
+
+
+def quote(open_interest: float, last_price: float) -> dict:
+    return {
+        **{field: 1.0 for field in QUOTE_OPTION_CHAIN_COLS},
+        "openInterest": open_interest,
+        "lastPrice": last_price,
+        "identifier": "OPTIDXNIFTY",
+    }
+
+
+@pytest.fixture
+def oc_data():
+    data = []
+
+    for expiry in EXPIRIES:
+        for strike, ce_oi, pe_oi in (
+            (21900, 100, 250),
+            (22000, 200, 0),
+            (22100, 0, 50),
+        ):
+            record = {"strikePrice": strike, "expiryDate": expiry}
+            record["CE"] = quote(ce_oi, 10.126)
+            record["PE"] = quote(pe_oi, 20.0)
+            data.append(record)
+
+    # A strike with puts only.
+    data.append({"strikePrice": 22200, "expiryDate": EXPIRIES[0], "PE": quote(5, 1)})
+
+    return {
+        "records": {
+            "expiryDates": EXPIRIES,
+            "data": data,
+            "timestamp": "12-Jun-2024 15:30:00",
+            "underlyingValue": 22013.4,
+        },
+        "filtered": {"CE": {"totOI": 300}, "PE": {"totOI": 305}},
+    }
+
+
+def test_parse_option_chain(oc_data):
+    data = oc_data["records"]["data"]
+    strikes, calls, puts = parse_option_chain(data, EXPIRIES[0])
+    oi = QUOTE_OPTION_CHAIN_COLS.index("openInterest")
+
+    assert strikes.tolist() == [21900, 22000, 22100, 22200]
+    assert calls.shape == puts.shape == (4, len(QUOTE_OPTION_CHAIN_COLS))
+    assert calls[:3, oi].tolist() == [100, 200, 0] and np.isnan(calls[3]).all()
+    assert puts[:, oi].tolist() == [250, 0, 50, 5]
+
+    strikes, calls, _ = parse_option_chain(data, "11-Jul-2024")
+    assert strikes.size == 0 and calls.shape == (0, len(QUOTE_OPTION_CHAIN_COLS))
+
+
+def test_processed_option_chain(oc_data):
+    no_expiry = deepcopy(oc_data)
+    no_expiry["records"]["expiryDates"] = ["11-Jul-2024"]
+    oc_obj = IndexOptionChainAnalysis("NIFTY", "12-Jun-2024", oc_data, 25, 50)
+    data = oc_obj.get_processed_option_chain()
+
+    assert data.columns[0] == "strikePrice" and data.columns[-1] == "pcr_oi"
+    assert data.CE_lastPrice.iloc[0] == 10.13
+    assert data.pcr_oi.iloc[:3].tolist() == [2.5, 0.0, MAX_PCR_OI]
+    assert np.isnan(data.CE_openInterest.iloc[3]) and np.isnan(data.pcr_oi.iloc[3])
+    # Quantities stay integers unless a side is missing, as NSE sends them.
+    assert data.PE_openInterest.dtype == data.PE_bidQty.dtype == np.int64
+    assert data.CE_openInterest.dtype == data.PE_lastPrice.dtype == float
+
+    with pytest.raises(ValueError, match="No Data"):
+        IndexOptionChainAnalysis("NIFTY", "12-Jun-2024", no_expiry, 25, 50)
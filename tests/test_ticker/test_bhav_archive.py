@@ -0,0 +1,120 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trade.calendar.sessions import TradingSessions
+from trade.exchange import BhavcopyArchive, PricePanel
+from trade.exchange.bhav_archive import normalise_bhavcopy
+
+SESSIONS = TradingSessions(
+    holidays=[date(2024, 5, 1)], start=date(2024, 4, 1), end=date(2024, 5, 31)
+)
+
+
+def legacy_bhavcopy(day: date) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "SYMBOL": ["SBIN", "TCS"],
+            "SERIES": ["EQ", "EQ"],
+            "OPEN": [800, 3800],
+            "HIGH": [810, 3900],
+            "LOW": [790, 3700],
+            "CLOSE": [805.5, 3850],
+            "LAST": [805, 3851],
+            "PREVCLOSE": [799, 3800],
+            "TOTTRDQTY": [100, day.day],
+            "TOTTRDVAL": [1e5, 2e5],
+            "TIMESTAMP": [day.strftime("%d-%b-%Y").upper()] * 2,
+            "TOTALTRADES": [10, 20],
+            "ISIN": ["INE062A01020", "INE467B01029"],
+            "Unnamed: 13": [None, None],
+        }
+    )
+
+
+class Fetch:
+    def __init__(self, fail_on=tuple()):
+        self.days, self.fail_on = list(), fail_on
+
+    def __call__(self, day: date) -> pd.DataFrame:
+        self.days.append(day)
+
+        if day in self.fail_on:
+            raise ConnectionError("Network down")
+
+        return legacy_bhavcopy(day)
+
+
+def test_normalise_bhavcopy():
+    udiff = pd.DataFrame(
+        {
+            "TradDt": ["2024-05-02"],
+            "TckrSymb": ["SBIN"],
+            "SctySrs": ["EQ"],
+            "OpnPric": [800.0],
+            "HghPric": [810.0],
+            "LwPric": [790.0],
+            "ClsPric": [805.0],
+            "PrvsClsgPric": [799.0],
+            "TtlTradgVol": [100],
+        }
+    )
+    legacy = normalise_bhavcopy(legacy_bhavcopy(date(2024, 5, 2)), date(2024, 5, 2))
+    udiff = normalise_bhavcopy(udiff, date(2024, 5, 2))
+
+    assert legacy.columns.tolist() == udiff.columns.tolist()
+    assert legacy.volume.tolist() == [100, 2]
+    assert udiff.prev_close.tolist() == [799.0]
+
+    with pytest.raises(ValueError):
+        normalise_bhavcopy(legacy_bhavcopy(date(2024, 5, 2)), date(2024, 5, 3))
+
+    with pytest.raises(ValueError):
+        normalise_bhavcopy(legacy_bhavcopy(date(2024, 5, 2))[:0], date(2024, 5, 2))
+
+
+def test_backfill_resumes(tmp_path):
+    fetch = Fetch(fail_on=(date(2024, 5, 3),))
+    archive = BhavcopyArchive(SESSIONS, fetch, tmp_path)
+    report = archive.backfill(date(2024, 4, 29), date(2024, 5, 3))
+
+    # The holiday on 1st May is never fetched.
+    assert sorted(fetch.days) == [
+        date(2024, 4, 29),
+        date(2024, 4, 30),
+        date(2024, 5, 2),
+        date(2024, 5, 3),
+    ]
+    assert report.archived == [date(2024, 4, 29), date(2024, 4, 30), date(2024, 5, 2)]
+    assert list(report.failed) == [date(2024, 5, 3)]
+    assert list(archive.failures) == ["2024-05-03"]
+    assert archive.pending(date(2024, 4, 29), date(2024, 5, 6)) == [
+        date(2024, 5, 3),
+        date(2024, 5, 6),
+    ]
+
+    fetch.fail_on, fetch.days = tuple(), list()
+    report = archive.backfill(date(2024, 4, 29), date(2024, 5, 6))
+
+    assert sorted(fetch.days) == [date(2024, 5, 3), date(2024, 5, 6)]
+    assert report.complete and len(report.skipped) == 3
+    assert archive.failures == dict()
+    # Only the archived sessions & failures, no stray temp files.
+    assert {i.name for i in tmp_path.iterdir()} == {"2024", "failures.json"}
+
+
+def test_read(tmp_path):
+    archive = BhavcopyArchive(SESSIONS, Fetch(), tmp_path)
+    archive.backfill(date(2024, 4, 29), date(2024, 5, 3))
+
+    data = archive.read(date(2024, 4, 30), date(2024, 5, 2), symbols=["TCS"])
+    assert data.volume.tolist() == [30, 2]
+    assert data.date.dt.date.tolist() == [date(2024, 4, 30), date(2024, 5, 2)]
+
+    panel = PricePanel.from_bhavcopies(
+        tmp_path / "panel", archive.read_by_day(date(2024, 4, 29), date(2024, 5, 3))
+    )
+    assert panel.shape == (2, 4, 5)
+    assert np.array_equal(panel.series("TCS", "volume"), [29, 30, 2, 3])
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from trade.exchange import MarketBreadth, PricePanel
+from trade.exchange.breadth import (
+    STALE_BREADTH_SESSION,
+    advance_decline,
+    breadth_by_cohort,
+    mcap_cohorts,
+)
+
+SESSIONS = pd.bdate_range("2024-01-01", periods=80)
+SYMBOLS = ["S{0}".format(i) for i in range(12)]
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(7)
+    close = pd.DataFrame(
+        100 + rng.normal(0, 1, (len(SESSIONS), len(SYMBOLS))).cumsum(axis=0),
+        index=SESSIONS,
+        columns=SYMBOLS,
+    )
+    # A listing mid way, a suspension & an unchanged session.
+    close.iloc[:30, 0] = np.nan
+    close.iloc[40:45, 1] = np.nan
+    close.iloc[50, 2:6] = close.iloc[49, 2:6]
+    high = close + rng.uniform(0, 1, close.shape)
+    low = close - rng.uniform(0, 1, close.shape)
+    return close, high, low
+
+
+def breadth(**kwargs) -> MarketBreadth:
+    return MarketBreadth(SYMBOLS, ema_spans=(5, 20), high_low_window=10, **kwargs)
+
+
+def session_bars(bars, day) -> pd.DataFrame:
+    return pd.DataFrame(
+        {name: i.loc[day] for name, i in zip(("close", "high", "low"), bars)}
+    )
+
+
+def test_advance_decline():
+    assert advance_decline([2.0, 1.0, 1.0, np.nan], [1.0, 2.0, 1.0, 1.0]) == {
+        "Advances": 1,
+        "Declines": 1,
+        "Unchanged": 1,
+    }
+
+
+def test_compute(bars):
+    close, high, low = bars
+    data = breadth().compute(close, high, low)
+    change = close.diff()
+
+    assert data.columns.tolist()[:5] == [
+        "advances",
+        "declines",
+        "unchanged",
+        "ad_line",
+        "mcclellan",
+    ]
+    assert data.advances.tolist() == (change > 0).sum(axis=1).tolist()
+    assert data.unchanged.iloc[50] == 4
+    assert data.ad_line.iloc[-1] == ((change > 0).sum() - (change < 0).sum()).sum()
+    # Highs & lows are counted once a full window is seen.
+    assert data.new_highs.iloc[:9].sum() == 0 and data.new_highs.iloc[9] > 0
+    assert data.pct_above_ema_5.iloc[4:].between(0, 100).all()
+    assert data.pct_above_ema_20.iloc[:19].isna().all()
+
+
+def test_update_matches_compute(bars):
+    close, high, low = bars
+    expected = breadth().compute(close, high, low)
+
+    incremental = breadth()
+    incremental.compute(close.iloc[:60], high.iloc[:60], low.iloc[:60])
+
+    for day in SESSIONS[60:]:
+        incremental.update(day, session_bars(bars, day))
+
+    pd.testing.assert_frame_equal(incremental.data, expected)
+
+    from_scratch = breadth()
+
+    for day in SESSIONS:
+        from_scratch.update(day, session_bars(bars, day))
+
+    pd.testing.assert_frame_equal(from_scratch.data, expected)
+
+    with pytest.raises(ValueError, match=STALE_BREADTH_SESSION.format(".*", ".*")):
+        incremental.update(SESSIONS[-1], session_bars(bars, SESSIONS[-1]))
+
+
+def test_from_panel_by_cohort(bars, tmp_path):
+    close, high, low = bars
+    frames = {
+        symbol: pd.DataFrame(
+            {"Open": close[symbol], "High": high[symbol], "Low": low[symbol]}
+        ).assign(Close=close[symbol], Volume=1.0)
+        for symbol in SYMBOLS
+    }
+    panel = PricePanel.from_frames(tmp_path / "panel", frames, SESSIONS)
+    ranks = pd.Series(range(1, len(SYMBOLS) + 1), index=SYMBOLS)
+    cohorts = mcap_cohorts(ranks, {"large": (1, 4), "rest": (5, 12)})
+
+    assert cohorts["large"] == SYMBOLS[:4]
+
+    by_cohort = breadth_by_cohort(panel, cohorts, ema_spans=(5, 20), high_low_window=10)
+    expected = breadth().compute(close, high, low)
+    counts = by_cohort["large"].data.advances + by_cohort["rest"].data.advances
+
+    assert counts.tolist() == expected.advances.tolist()
+
+    window = MarketBreadth.from_panel(panel, ema_spans=(5, 20), high_low_window=10)
+    assert window.between("2024-02-01", "2024-02-29").index.month.unique().tolist() == [
+        2
+    ]
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+
+import pytest
+
+from trade.exchange import ExchangeContexts
+from trade.exchange.exchange_context import MAX_CONTEXTS
+
+HOLIDAYS = [{"tradingDate": "01-May-2024", "description": "Maharashtra Day"}]
+# Dates resolving to another session: a weekend & today (None) after it.
+SESSIONS = {"11-May-2024": "10-May-2024", None: "10-May-2024"}
+
+
+class FakeConfig:
+    built = list()
+
+    def __init__(self, today: str, market_holidays=None):
+        FakeConfig.built.append((type(self).__name__, today, market_holidays))
+        self.working_day = SimpleNamespace(
+            market_holidays=SimpleNamespace(holidays_dict=HOLIDAYS),
+            curr_bday=SimpleNamespace(as_str=SESSIONS.get(today, today)),
+        )
+
+
+class FakeIndexConfig(FakeConfig):
+    pass
+
+
+@pytest.fixture
+def contexts():
+    contexts = ExchangeContexts()
+    contexts.clear()
+    FakeConfig.built.clear()
+    yield contexts
+    contexts.clear()
+    contexts.max_contexts = MAX_CONTEXTS
+
+
+def test_config_is_shared_per_trading_day(contexts):
+    with ThreadPoolExecutor(8) as executor:
+        configs = list(
+            executor.map(
+                lambda _: contexts.config("NSE", "10-May-2024", FakeConfig), range(50)
+            )
+        )
+
+    assert len(FakeConfig.built) == 1
+    assert all(config is configs[0] for config in configs)
+    assert ("NSE", "10-May-2024") in contexts
+
+
+def test_holidays_are_reused_across_configs_and_days(contexts):
+    contexts.config("NSE", "10-May-2024", FakeConfig)
+    contexts.config("NSE", "10-May-2024", FakeIndexConfig)
+    contexts.config("NSE", "13-May-2024", FakeConfig)
+
+    assert [i[:2] for i in FakeConfig.built] == [
+        ("FakeConfig", "10-May-2024"),
+        ("FakeIndexConfig", "10-May-2024"),
+        ("FakeConfig", "13-May-2024"),
+    ]
+    assert FakeConfig.built[0][2] is None
+    assert all(i[2] == HOLIDAYS for i in FakeConfig.built[1:])
+
+
+def test_dates_of_a_session_share_its_context(contexts):
+    config = contexts.config("NSE", "10-May-2024", FakeConfig)
+
+    assert contexts.config("NSE", "11-May-2024", FakeConfig) is config
+    assert contexts.config("NSE", None, FakeConfig) is config
+    assert contexts.get("NSE", "11-May-2024") is contexts.get("NSE", "10-May-2024")
+    assert len(contexts) == 1
+
+    # Once resolved, a date builds no config of its own.
+    contexts.config("NSE", "11-May-2024", FakeConfig)
+    assert [i[1] for i in FakeConfig.built] == ["10-May-2024", "11-May-2024", None]
+
+
+def test_context_is_immutable(contexts):
+    context = contexts.get("NSE", "10-May-2024")
+
+    with pytest.raises(FrozenInstanceError):
+        context.dated = "13-May-2024"
+
+
+def test_release_and_eviction(contexts):
+    contexts.max_contexts = 2
+
+    for dated in ("10-May-2024", "13-May-2024", "14-May-2024"):
+        contexts.config("NSE", dated, FakeConfig)
+
+    assert len(contexts) == 2
+    assert ("NSE", "10-May-2024") not in contexts
+
+    assert contexts.release("NSE", "13-May-2024").dated == "13-May-2024"
+    assert contexts.release("NSE", "13-May-2024") is None
+    assert len(contexts) == 1
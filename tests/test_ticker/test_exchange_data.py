@@ -112,8 +112,8 @@ def test_check_dates_with_markettime():
     )
     obj = Exchange(*prepared_args)
     assert obj.today == "29-Apr-2024"
-    assert obj.prev_day == "26-Apr-2024"
-    assert obj.next_day == "29-Apr-2024"
+    assert obj.prev_day.as_str == "26-Apr-2024"
+    assert obj.next_day.as_str == "29-Apr-2024"
 
 
 @pytest.mark.freeze_time("2024-04-29 16:10")
@@ -131,5 +131,5 @@ def test_check_dates_wo_markettime():
     )
     obj = Exchange(*prepared_args)
     assert obj.today == "29-Apr-2024"
-    assert obj.prev_day == "26-Apr-2024"
-    assert obj.next_day == "30-Apr-2024"
+    assert obj.prev_day.as_str == "26-Apr-2024"
+    assert obj.next_day.as_str == "30-Apr-2024"
@@ -0,0 +1,131 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from trade.calendar.sessions import TradingSessions
+from trade.exchange import PricePanel
+from trade.utils import HistoryStore
+from trade.utils.history_store import HISTORY_PARAMS
+
+SESSIONS = TradingSessions(
+    holidays=[date(2024, 5, 1)], start=date(2024, 4, 29), end=date(2024, 5, 10)
+).sessions
+
+
+def bars(days, close) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "Open": close,
+            "High": close,
+            "Low": close,
+            "Close": close,
+            "Volume": 100.0,
+        },
+        index=pd.DatetimeIndex(days, name="Date"),
+    )
+
+
+@pytest.fixture
+def panel(tmp_path):
+    frames = {
+        "SBIN": bars(["2024-04-29", "2024-04-30", "2024-05-02"], [1.0, 2.0, 3.0]),
+        # Bars off the session grid (a holiday) are dropped.
+        "TCS": bars(["2024-05-01", "2024-05-03"], [10.0, 11.0]),
+    }
+    return PricePanel.from_frames(tmp_path / "panel", frames, SESSIONS)
+
+
+def test_from_frames(panel):
+    assert panel.shape == (2, 9, 5)
+    assert np.array_equal(
+        panel.series("SBIN", "close")[:4], [1.0, 2.0, 3.0, np.nan], equal_nan=True
+    )
+    assert np.isnan(panel.series("TCS", "close")[:2]).all()
+    assert panel.series("TCS", "close")[panel.session_index("2024-05-03")] == 11.0
+
+    with pytest.raises(KeyError):
+        panel.session_index(date(2024, 5, 1))
+
+
+def test_views_are_zero_copy(panel):
+    close = panel.field("close", start="2024-04-30", end="2024-05-02")
+
+    assert close.shape == (2, 2)
+    assert np.shares_memory(close, panel.data)
+    assert np.shares_memory(panel.symbol("SBIN"), panel.data)
+    assert np.shares_memory(panel.field_frame("close").to_numpy(), panel.data)
+    assert panel.as_frame("SBIN").close.tolist() == [1.0, 2.0, 3.0]
+
+
+def test_open_read_only(panel):
+    shared = PricePanel.open(panel.path)
+
+    assert shared.symbols == ["SBIN", "TCS"]
+    assert np.array_equal(shared.data, panel.data, equal_nan=True)
+
+    with pytest.raises(ValueError):
+        shared.data[0, 0, 0] = 0.0
+
+
+def legacy_bhavcopy(symbols, series, close, volume) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "SYMBOL": symbols,
+            "SERIES": series,
+            "OPEN": close,
+            "HIGH": close,
+            "LOW": close,
+            "CLOSE": close,
+            "TOTTRDQTY": volume,
+        }
+    )
+
+
+def test_from_bhavcopies(tmp_path):
+    bhavcopies = {
+        date(2024, 4, 30): legacy_bhavcopy(
+            ["SBIN", "SBIN", "TCS"], ["EQ", "BE", "EQ"], [2.0, 9.0, 20.0], [5, 6, 7]
+        ),
+        # UDiFF headers.
+        date(2024, 5, 2): legacy_bhavcopy(["TCS"], ["EQ"], [21.0], [8]).rename(
+            columns={
+                "SYMBOL": "TckrSymb",
+                "SERIES": "SctySrs",
+                "OPEN": "OpnPric",
+                "HIGH": "HghPric",
+                "LOW": "LwPric",
+                "CLOSE": "ClsPric",
+                "TOTTRDQTY": "TtlTradgVol",
+            }
+        ),
+    }
+    panel = PricePanel.from_bhavcopies(tmp_path / "bhav", bhavcopies)
+
+    assert panel.symbols == ["SBIN", "TCS"]
+    assert panel.field_frame("close").to_dict("list") == {
+        "SBIN": [2.0, pytest.approx(np.nan, nan_ok=True)],
+        "TCS": [20.0, 21.0],
+    }
+    assert panel.field("volume").tolist()[1] == [7.0, 8.0]
+
+
+def test_from_history_store(tmp_path, monkeypatch):
+    store = HistoryStore()
+    monkeypatch.setattr(store, "history_dir", tmp_path)
+    store._manifests.clear()
+    store.append(
+        "SBIN.NS",
+        store.key_of("1d", **HISTORY_PARAMS),
+        bars(["2024-04-29", "2024-05-10"], [1.0, 5.0]),
+        date(2024, 4, 29),
+        date(2024, 5, 11),
+    )
+    panel = PricePanel.from_history_store(
+        tmp_path / "store", ["SBIN"], SESSIONS[:5], ticker=lambda i: i + ".NS"
+    )
+    store._manifests.clear()
+
+    assert panel.series("SBIN", "close")[0] == 1.0
+    assert np.isnan(panel.series("SBIN", "close")[1:]).all()
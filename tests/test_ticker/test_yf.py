@@ -1,6 +1,8 @@
+import pandas as pd
 import pytest
 
 from trade.exchange.yf import YFinance
+from trade.utils import HistoryStore
 
 
 @pytest.fixture
@@ -30,3 +32,45 @@ def test_get_period_data(yfin_data_instance):
         "pct_change",
     )
     assert all(i in data.columns for i in cols)
+
+
+class BatchDownload:
+    def __init__(self):
+        self.calls = list()
+
+    def download(self, tickers, **kwargs):
+        self.calls.append(tickers)
+        tickers = [i for i in tickers.split() if i != "MISSING.NS"]
+        dates = pd.date_range("2024-05-13", periods=3, name="Date")
+        frames = {
+            i: pd.DataFrame(
+                {"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": [10.0, 11.0, 9.9]},
+                index=dates,
+            )
+            for i in tickers
+        }
+        return pd.concat(frames, axis=1)
+
+
+def test_get_batch_period_data(monkeypatch):
+    monkeypatch.setattr(HistoryStore(), "enabled", False)
+    yfin = YFinance(
+        market="NSE",
+        country="INDIA",
+        date_fmt="%Y-%m-%d",
+        ticker_modifications={"MISSING.NS": "MISSING"},
+    )
+    yfin.yf = BatchDownload()
+    yfin.get_period_data = lambda symbol, **kwargs: symbol
+
+    data = yfin.get_batch_period_data(
+        ["reliance", "SBIN", "NIFTY 50", "MISSING"],
+        chunk_size=2,
+        symbol_map={"NIFTY 50": "^NSEI"},
+    )
+
+    assert yfin.yf.calls == ["RELIANCE.NS SBIN.NS", "^NSEI MISSING.NS"]
+    assert data["MISSING"] == "MISSING"
+    assert data["reliance"].date.tolist() == ["2024-05-15", "2024-05-14"]
+    assert data["NIFTY 50"]["pct_change"].round(2).tolist() == [-10.0, 10.0]
+    assert data["SBIN"].prev_close.tolist() == [11.0, 10.0]
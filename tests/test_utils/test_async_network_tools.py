@@ -0,0 +1,92 @@
+import asyncio
+
+import httpx
+import pytest
+from requests.exceptions import InvalidURL
+
+from trade.utils import AsyncDownloadTools, ResponseCache, SessionPool
+
+QUOTE_URL = "https://www.nseindia.com/api/quote-equity?symbol={0}"
+HEADERS = {"user-agent": "pytest"}
+
+
+@pytest.fixture(autouse=True)
+def homepage(mock_get):
+    return mock_get()
+
+
+@pytest.fixture
+def requested():
+    return list()
+
+
+@pytest.fixture
+def tools(monkeypatch, requested):
+    def handler(request: httpx.Request) -> httpx.Response:
+        symbol = request.url.params["symbol"]
+        requested.append(symbol)
+        if symbol == "INVALID":
+            return httpx.Response(404)
+        return httpx.Response(200, json={"symbol": symbol})
+
+    def mock_client(self, concurrency, timeout):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr(AsyncDownloadTools, "_async_client", mock_client)
+    return AsyncDownloadTools()
+
+
+def test_get_json_batch(tools):
+    symbols = ("RELIANCE", "SBIN", "TCS")
+    urls = {symbol: QUOTE_URL.format(symbol) for symbol in symbols}
+
+    result = tools.get_json_batch(urls, HEADERS, concurrency=2)
+
+    assert list(result.keys()) == list(symbols)
+    assert all(result[symbol] == {"symbol": symbol} for symbol in symbols)
+    assert SessionPool().stats["www.nseindia.com"]["cookie_refreshes"] == 1
+
+
+def test_get_json_batch_match_http(tools):
+    urls = {symbol: QUOTE_URL.format(symbol) for symbol in ("SBIN", "INVALID")}
+
+    with pytest.raises(InvalidURL):
+        tools.get_json_batch(urls, HEADERS)
+
+    result = tools.get_json_batch(urls, HEADERS, return_exceptions=True)
+    assert result["SBIN"] == {"symbol": "SBIN"}
+    assert isinstance(result["INVALID"], InvalidURL)
+
+
+def test_get_json_batch_in_running_loop(tools):
+    urls = {symbol: QUOTE_URL.format(symbol) for symbol in ("SBIN", "TCS")}
+
+    async def caller():
+        # A sync caller inside an event loop, as in a notebook cell.
+        return tools.get_json_batch(urls, HEADERS), await tools.aget_json_batch(
+            urls, HEADERS
+        )
+
+    from_sync, from_async = asyncio.run(caller())
+
+    assert from_sync == from_async == {i: {"symbol": i} for i in urls}
+
+
+def test_get_json_batch_reads_through_response_cache(tools, requested, tmp_path):
+    cache = ResponseCache()
+    cache.cache_dir, cache.enabled = tmp_path, True
+    cache.policies.clear()
+    cache.configure("quotes", ttl=60, patterns=("api/quote-equity",))
+    urls = {symbol: QUOTE_URL.format(symbol) for symbol in ("SBIN", "TCS")}
+
+    try:
+        first = tools.get_json_batch(urls, HEADERS)
+        second = tools.get_json_batch(urls, HEADERS)
+        stats = cache.stats["quotes"]
+
+    finally:
+        cache.policies.clear()
+
+    assert first == second == {i: {"symbol": i} for i in urls}
+    assert sorted(requested) == ["SBIN", "TCS"]
+    assert stats == {"hits": 2, "misses": 2}
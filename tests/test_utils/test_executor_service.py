@@ -0,0 +1,99 @@
+from threading import Event, current_thread
+from time import sleep
+
+import pytest
+
+from trade.utils import ExecutorService
+from trade.utils.executor_service import EXECUTOR_WORKERS
+from trade.utils.op_utils import concurrent_execution
+
+
+@pytest.fixture
+def service():
+    service = ExecutorService()
+    service.resize(4)
+    service.stats.clear()
+    yield service
+    service.stats.clear()
+    service.resize(EXECUTOR_WORKERS)
+
+
+def test_map_keeps_order(service):
+    def slow_square(i):
+        sleep(0.01 * (5 - i))
+        return i * i
+
+    assert service.map(slow_square, range(5), name="squares") == [0, 1, 4, 9, 16]
+    stats = service.stats["squares"]
+    assert stats.tasks == stats.completed == 5
+    assert stats.max_latency >= stats.mean_latency > 0
+    assert stats.as_dict()["failed"] == 0
+
+
+def test_errors(service):
+    def fail_on_odd(i):
+        if i % 2:
+            raise KeyError(i)
+        return i
+
+    results = {i.key: i for i in service.as_completed(fail_on_odd, range(4))}
+
+    assert [results[i].ok for i in range(4)] == [True, False, True, False]
+    assert isinstance(results[1].error, KeyError)
+    assert service.stats["default"].failed == 2
+
+    with pytest.raises(KeyError):
+        service.map(fail_on_odd, range(4))
+
+    assert isinstance(
+        service.map(fail_on_odd, [1], return_exceptions=True)[0], KeyError
+    )
+
+
+def test_timeout(service):
+    release = Event()
+
+    def block(i):
+        if i == "slow":
+            release.wait(5)
+        return i
+
+    results = service.map(
+        block, ["fast", "slow"], timeout=0.1, name="timeouts", return_exceptions=True
+    )
+    release.set()
+
+    assert results[0] == "fast"
+    assert isinstance(results[1], TimeoutError)
+    assert service.stats["timeouts"].timed_out == 1
+
+
+def test_shutdown_cancels_pending(service):
+    release = Event()
+    service.resize(1)
+    running = service.submit(release.wait, 5)
+    queued = service.submit(sleep, 0)
+    service.shutdown(wait=False)
+    release.set()
+
+    assert queued.cancelled()
+    assert running.result() is True
+    # A new pool is started on the next submit.
+    assert service.submit(lambda: 1).result() == 1
+
+
+def test_concurrent_execution(service):
+    class Fetcher:
+        @concurrent_execution
+        def fetch(self, symbol, suffix=""):
+            return symbol + suffix, current_thread().name
+
+    fetcher = Fetcher()
+    fanned = fetcher.fetch(["SBIN", "TCS"], suffix=".NS", concurrent=True)
+
+    assert {k: v[0] for k, v in fanned.items()} == {
+        "SBIN": "SBIN.NS",
+        "TCS": "TCS.NS",
+    }
+    assert all(v[1].startswith("market-generic") for v in fanned.values())
+    assert fetcher.fetch("SBIN", concurrent=True) == ("SBIN", current_thread().name)
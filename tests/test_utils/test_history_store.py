@@ -0,0 +1,170 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from trade.exchange.yf import YFinance
+from trade.utils import HistoryStore
+from trade.utils.history_store import HISTORY_PARAMS
+
+SESSIONS = pd.bdate_range("2024-05-01", "2024-05-31", name="Date")
+
+
+def bars(dates) -> pd.DataFrame:
+    close = [float(i.day) for i in dates]
+    return pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1},
+        index=pd.DatetimeIndex(dates, name="Date"),
+    )
+
+
+class Download:
+    def __init__(self, factor: float = 1.0):
+        self.calls = list()
+        self.factor = factor
+
+    def download(self, tickers, start, end, auto_adjust=True, **kwargs):
+        self.calls.append((tickers, start, end))
+        dates = SESSIONS[
+            (SESSIONS >= pd.Timestamp(start)) & (SESSIONS < pd.Timestamp(end))
+        ]
+        tickers = tickers.split()
+        # Adjusted prices scale with the corporate actions seen so far.
+        factor = self.factor if auto_adjust else 1.0
+
+        if len(tickers) == 1:
+            return bars(dates) * factor
+
+        return pd.concat({i: bars(dates) * factor for i in tickers}, axis=1)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = HistoryStore()
+    monkeypatch.setattr(store, "history_dir", tmp_path)
+    monkeypatch.setattr(store, "enabled", True)
+    store._manifests.clear()
+    yield store
+    store._manifests.clear()
+
+
+def test_append_and_read(store):
+    store.append(
+        "SBIN.NS", "1d", bars(SESSIONS[:5]), date(2024, 5, 1), date(2024, 5, 8)
+    )
+    store.append(
+        "SBIN.NS", "1d", bars(SESSIONS[3:8]), date(2024, 5, 6), date(2024, 5, 11)
+    )
+
+    assert store.coverage("SBIN.NS", "1d") == (date(2024, 5, 1), date(2024, 5, 10))
+    assert store.last_session("SBIN.NS", "1d") == date(2024, 5, 10)
+    assert store.read("SBIN.NS", "1d").index.is_unique
+    assert len(store.read("SBIN.NS", "1d")) == 8
+    assert store.read(
+        "SBIN.NS", "1d", date(2024, 5, 3), date(2024, 5, 7)
+    ).Close.tolist() == [
+        3.0,
+        6.0,
+    ]
+    assert store.read("TCS.NS", "1d").empty
+
+
+def test_missing_from(store):
+    assert store.missing_from("SBIN.NS", "1d", date(2024, 5, 1), date(2024, 6, 1)) == (
+        date(2024, 5, 1)
+    )
+    store.append(
+        "SBIN.NS", "1d", bars(SESSIONS[:5]), date(2024, 5, 1), date(2024, 5, 8)
+    )
+
+    assert (
+        store.missing_from("SBIN.NS", "1d", date(2024, 5, 2), date(2024, 5, 8)) is None
+    )
+    assert store.missing_from("SBIN.NS", "1d", date(2024, 5, 2), date(2024, 6, 1)) == (
+        date(2024, 5, 8)
+    )
+    assert store.missing_from("SBIN.NS", "1d", date(2024, 4, 1), date(2024, 5, 8)) == (
+        date(2024, 4, 1)
+    )
+    # Forming bars of today are never stored.
+    store.append(
+        "TCS.NS", "1d", bars([pd.Timestamp(date.today())]), date.today(), date.max
+    )
+    assert store.coverage("TCS.NS", "1d") is None
+
+
+def test_period_data_reads_through_store(store):
+    yfin = YFinance(market="NSE", country="INDIA", date_fmt="%Y-%m-%d")
+    yfin.yf = Download()
+    params = dict(start=date(2024, 5, 1), end=date(2024, 5, 15))
+
+    first = yfin.get_period_data("sbin", **params)
+    again = yfin.get_period_data("sbin", **params)
+    later = yfin.get_batch_period_data(
+        ["sbin", "tcs"], start=date(2024, 5, 6), end=date(2024, 5, 22)
+    )
+
+    assert first.equals(again)
+    assert first.date.tolist()[0] == "2024-05-14"
+    assert later["sbin"].date.tolist()[0] == "2024-05-21"
+    assert yfin.yf.calls == [
+        ("SBIN.NS", date(2024, 5, 1), date(2024, 5, 15)),
+        # The last stored week is fetched again to spot restated bars.
+        ("SBIN.NS", date(2024, 5, 7), date(2024, 5, 22)),
+        ("TCS.NS", date(2024, 5, 6), date(2024, 5, 22)),
+    ]
+
+
+def test_key_of(store):
+    assert store.key_of("1d") == "1d"
+    assert (
+        store.key_of("1d", rounding=True, auto_adjust=False, progress=False)
+        == "1d/auto_adjust=False-rounding=True"
+    )
+
+
+def test_download_params_are_stored_apart(store):
+    yfin = YFinance(market="NSE", country="INDIA", date_fmt="%Y-%m-%d")
+    yfin.yf = Download(factor=0.5)
+    params = dict(start=date(2024, 5, 1), end=date(2024, 5, 15))
+
+    adjusted = yfin.get_period_data("sbin", **params)
+    raw = yfin.get_period_data("sbin", auto_adjust=False, **params)
+
+    assert adjusted.close.tolist()[0] == 7.0 and raw.close.tolist()[0] == 14.0
+    assert len(yfin.yf.calls) == 2
+
+
+def test_restated_bars_are_fetched_again(store):
+    yfin = YFinance(market="NSE", country="INDIA", date_fmt="%Y-%m-%d")
+    yfin.yf = Download()
+    yfin.get_period_data("sbin", start=date(2024, 5, 1), end=date(2024, 5, 15))
+
+    # A split halves the adjusted prices of the days already stored.
+    yfin.yf = Download(factor=0.5)
+    data = yfin.get_period_data("sbin", start=date(2024, 5, 1), end=date(2024, 5, 22))
+
+    assert yfin.yf.calls == [
+        ("SBIN.NS", date(2024, 5, 7), date(2024, 5, 22)),
+        ("SBIN.NS", date(2024, 5, 1), date(2024, 5, 22)),
+    ]
+    assert data.close.tolist()[-1] == 1.0
+    assert store.coverage("SBIN.NS", store.key_of("1d", **HISTORY_PARAMS)) == (
+        date(2024, 5, 1),
+        date(2024, 5, 21),
+    )
+
+
+def test_manifest_entries_of_other_writers_are_kept(store, tmp_path):
+    # Another process sharing the store, with its own manifest copy.
+    other = object.__new__(HistoryStore)
+    other.__init__(tmp_path, enabled=True)
+    store.coverage("SBIN.NS", "1d")
+
+    other.append("TCS.NS", "1d", bars(SESSIONS[:2]), date(2024, 5, 1), date(2024, 5, 3))
+    store.append(
+        "SBIN.NS", "1d", bars(SESSIONS[:2]), date(2024, 5, 1), date(2024, 5, 3)
+    )
+
+    assert other.coverage("SBIN.NS", "1d") == (date(2024, 5, 1), date(2024, 5, 2))
+    assert store.coverage("TCS.NS", "1d") == (date(2024, 5, 1), date(2024, 5, 2))
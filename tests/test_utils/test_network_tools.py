@@ -0,0 +1,102 @@
+from io import BytesIO
+from zipfile import ZipFile
+
+import pandas as pd
+import pytest
+
+from trade.utils import DownloadTools, network_tools
+from trade.utils.network_tools import SNIFF_SIZE, UNKNOWN_CONTENT
+
+CSV_CONTENT = (
+    "SYMBOL,SERIES,CLOSE,TOTTRDQTY,\nSBIN,EQ,820.5,100,\nINFY,EQ,1450.0,200,\n"
+)
+
+
+@pytest.fixture
+def tools():
+    return DownloadTools()
+
+
+def zipped(name: str, content: bytes) -> bytes:
+    buffer = BytesIO()
+
+    with ZipFile(buffer, "w") as zip_file:
+        zip_file.writestr(name, content)
+
+    return buffer.getvalue()
+
+
+def xlsx_bytes() -> bytes:
+    buffer = BytesIO()
+    pd.DataFrame({"symbol": ["SBIN"], "close": [820.5]}).to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+
+def test_sniffing(tools):
+    csv_zip, xlsx = zipped("bhav.csv", CSV_CONTENT.encode()), xlsx_bytes()
+
+    assert tools.is_csv(BytesIO(CSV_CONTENT.encode()))
+    assert tools.is_zip(BytesIO(csv_zip)) and not tools.is_xlsx(BytesIO(csv_zip))
+    assert tools.is_zip(xlsx) and tools.is_xlsx(BytesIO(xlsx))
+    assert not tools.is_csv(BytesIO(b"\xff\xfe\x00binary"))
+
+
+def test_is_csv_reads_only_a_prefix(tools):
+    # A multi byte character cut at the prefix boundary is not an error.
+    content = ("a,bcd\n" + "é,1\n" * SNIFF_SIZE).encode()
+    assert tools.is_csv(BytesIO(content))
+
+
+def test_read_from_buffer(tools):
+    usecols = lambda column: column in ("SYMBOL", "SERIES", "TOTTRDQTY")
+    dtype = {"SERIES": "category", "TOTTRDQTY": "int64"}
+
+    for content in (CSV_CONTENT.encode(), zipped("bhav.csv", CSV_CONTENT.encode())):
+        data = tools.read_from_buffer(BytesIO(content), usecols=usecols, dtype=dtype)
+
+        assert data.columns.tolist() == ["SYMBOL", "SERIES", "TOTTRDQTY"]
+        assert data.SERIES.dtype == "category"
+        assert data.TOTTRDQTY.tolist() == [100, 200]
+
+    data = tools.read_from_buffer(BytesIO(xlsx_bytes()))
+    assert data.to_dict("records") == [{"symbol": "SBIN", "close": 820.5}]
+
+
+def test_read_from_buffer_unknown_content(tools):
+    with pytest.raises(ValueError, match=UNKNOWN_CONTENT):
+        tools.read_from_buffer(BytesIO(zipped("image.png", b"\x89PNG\r\n\x1a\n\x00")))
+
+
+def test_unzip_closes_the_archive(tools, monkeypatch):
+    closed = list()
+
+    class SpyZipFile(ZipFile):
+        def close(self):
+            closed.append(self)
+            super().close()
+
+    monkeypatch.setattr(network_tools, "ZipFile", SpyZipFile)
+
+    with tools.unzip(BytesIO(zipped("bhav.csv", CSV_CONTENT.encode()))) as member:
+        assert member.read().decode() == CSV_CONTENT
+        assert closed == list()
+
+    assert member.closed and len(closed) == 1
+
+
+def test_read_zip_opens_the_member_once(tools, monkeypatch):
+    opened = list()
+
+    class SpyZipFile(ZipFile):
+        def open(self, name, *args, **kwargs):
+            opened.append(name)
+            return super().open(name, *args, **kwargs)
+
+    monkeypatch.setattr(network_tools, "ZipFile", SpyZipFile)
+    header, rows = CSV_CONTENT.split("\n", 1)
+    repeat = 2 * SNIFF_SIZE // len(rows)
+    content = header + "\n" + rows * repeat
+    data = tools.read_zip(BytesIO(zipped("bhav.csv", content.encode())))
+
+    # The sniffed head is parsed too, from the one stream.
+    assert opened == ["bhav.csv"] and len(data) == 2 * repeat
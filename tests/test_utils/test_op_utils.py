@@ -0,0 +1,22 @@
+import pytest
+
+from trade.utils.op_utils import find_least_difference_strike, min_strike_gaps
+
+
+def test_min_strike_gaps():
+    strikes = {
+        "SBIN": [800.0, 810.0, 820.0, 825.0, 0.0],
+        "NIFTY": [22000, 22100, 22050, 22100],
+        "SINGLE": [100.0],
+        "EMPTY": [],
+    }
+
+    assert min_strike_gaps(strikes) == {"SBIN": 5.0, "NIFTY": 50.0}
+    assert min_strike_gaps(dict()) == dict()
+
+
+@pytest.mark.parametrize(
+    "strikes, expected", [([100, 105, 115], 5.0), ([100], float("inf"))]
+)
+def test_find_least_difference_strike(strikes, expected):
+    assert find_least_difference_strike(strikes) == expected
@@ -0,0 +1,123 @@
+from threading import Thread
+from time import monotonic
+
+import pytest
+from requests.exceptions import ReadTimeout
+
+from trade.utils import DownloadTools, SessionPool
+from trade.utils.rate_limiter import DEFAULT_CLASS, RateLimiter, TokenBucket
+
+NSE_URL = "https://www.nseindia.com/api/option-chain-indices?symbol=NIFTY"
+RATE_LIMITS = {
+    "www.nseindia.com": {
+        "option-chains": {"rate": 50, "capacity": 2, "patterns": ["option-chain"]},
+        "default": {"rate": 100, "capacity": 10},
+    }
+}
+
+
+@pytest.fixture
+def limiter(pool, monkeypatch):
+    limiter = RateLimiter()
+    monkeypatch.setattr(limiter, "backoff_max", 0.05)
+    limiter.configure_from(RATE_LIMITS)
+    return limiter
+
+
+def test_token_bucket_reserve():
+    bucket = TokenBucket(rate=10, capacity=2)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert 0.0 < bucket.reserve() <= 0.1
+
+
+def test_token_bucket_invalid_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+
+
+def test_classify(limiter):
+    assert limiter.classify(NSE_URL) == ("www.nseindia.com", "option-chains")
+    assert limiter.classify("https://www.nseindia.com/api/allIndices") == (
+        "www.nseindia.com",
+        DEFAULT_CLASS,
+    )
+
+
+def test_configure_is_idempotent(limiter):
+    bucket = limiter.bucket(NSE_URL)
+    bucket.reserve()
+    limiter.configure_from(RATE_LIMITS)
+
+    assert limiter.bucket(NSE_URL) is bucket
+
+
+def test_acquire_throttles_beyond_capacity(limiter):
+    start = monotonic()
+    for _ in range(4):
+        limiter.acquire(NSE_URL)
+
+    # Two tokens of burst, the remaining two wait for 1/50s each.
+    assert monotonic() - start >= 0.03
+
+
+@pytest.mark.parametrize("status_code", [403, 429, None])
+def test_report_failure_sets_cooldown(limiter, status_code):
+    limiter.report(NSE_URL, status_code)
+
+    assert limiter.stats["www.nseindia.com"]["failures"] == 1
+    assert limiter.cooldown(NSE_URL).cooling_down
+
+
+def test_report_success_resets_failures(limiter):
+    limiter.report(NSE_URL, 429)
+    limiter.report(NSE_URL, 429)
+    limiter.report(NSE_URL, 200)
+
+    assert limiter.stats["www.nseindia.com"]["failures"] == 0
+
+
+def test_cookie_retries_are_bounded(limiter, mock_get):
+    def timeout(url):
+        raise ReadTimeout()
+
+    calls = mock_get(timeout)
+
+    with pytest.raises(ReadTimeout):
+        DownloadTools().get_cookies(NSE_URL, {})
+
+    assert len(calls) == 3
+
+
+def test_cookie_pacing_does_not_hold_session_lock(limiter, mock_get, monkeypatch):
+    held = list()
+    acquire = RateLimiter.acquire
+
+    def mock_acquire(self, url):
+        lock = SessionPool().get_session(url).lock
+
+        def try_lock():
+            held.append(not lock.acquire(blocking=False))
+
+            if not held[-1]:
+                lock.release()
+
+        worker = Thread(target=try_lock)
+        worker.start()
+        worker.join()
+        return acquire(self, url)
+
+    monkeypatch.setattr(RateLimiter, "acquire", mock_acquire)
+    mock_get()
+
+    DownloadTools().get_cookies(NSE_URL, {})
+
+    assert held == [False]
+
+
+def test_request_retried_on_too_many_requests(limiter, mock_get, make_response):
+    statuses = iter([200, 429, 200])
+    mock_get(lambda url: make_response(next(statuses)))
+
+    assert DownloadTools().get_request_api(NSE_URL, {}).status_code == 200
@@ -0,0 +1,98 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from trade.utils import DownloadTools, ResponseCache
+
+HOLIDAY_URL = "https://www.nseindia.com/api/holiday-master?type=trading"
+QUOTE_URL = "https://www.nseindia.com/api/quote-equity?symbol=SBIN"
+HEADERS = {"user-agent": "pytest"}
+JSON_HEADERS = {"Content-Type": "application/json"}
+POLICIES = {"holidays": {"ttl": 60, "patterns": ["api/holiday-master"]}}
+
+
+@pytest.fixture
+def holidays(make_response):
+    """The holiday master response, or another `status_code`."""
+
+    def holidays(status_code: int = 200):
+        return make_response(status_code, b'{"CM": []}', headers=JSON_HEADERS)
+
+    return holidays
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache()
+    cache.cache_dir, cache.enabled = tmp_path, True
+    cache.policies.clear()
+    cache.configure_from(POLICIES)
+    yield cache
+    cache.policies.clear()
+
+
+@pytest.fixture
+def calls(mock_get, holidays):
+    return mock_get(lambda url: holidays())
+
+
+def test_only_configured_urls_cached(cache, holidays):
+    assert cache.policy_for(HOLIDAY_URL).name == "holidays"
+    assert cache.policy_for(QUOTE_URL) is None
+    assert not cache.set(QUOTE_URL, HEADERS, holidays())
+
+
+def test_round_trip(cache, holidays):
+    assert cache.set(HOLIDAY_URL, HEADERS, holidays())
+
+    response = cache.get(HOLIDAY_URL, HEADERS)
+    assert response.json() == {"CM": []}
+    assert response.headers["content-type"] == "application/json"
+    assert cache.stats["holidays"] == {"hits": 1, "misses": 0}
+
+
+def test_keyed_by_headers(cache, holidays):
+    cache.set(HOLIDAY_URL, HEADERS, holidays())
+
+    assert cache.get(HOLIDAY_URL, {"user-agent": "other"}) is None
+    assert cache.stats["holidays"]["misses"] == 1
+
+
+def test_stats_counted_across_threads(cache, holidays):
+    cache.set(HOLIDAY_URL, HEADERS, holidays())
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: cache.get(HOLIDAY_URL, HEADERS), range(200)))
+
+    assert cache.stats["holidays"] == {"hits": 200, "misses": 0}
+
+
+def test_expired_entry_is_a_miss(cache, holidays):
+    cache.policies["holidays"].ttl = 0
+    cache.set(HOLIDAY_URL, HEADERS, holidays())
+
+    assert cache.get(HOLIDAY_URL, HEADERS) is None
+
+
+def test_errors_not_cached(cache, holidays):
+    assert not cache.set(HOLIDAY_URL, HEADERS, holidays(500))
+
+
+def test_corrupt_entry_dropped(cache, holidays):
+    cache.set(HOLIDAY_URL, HEADERS, holidays())
+    path = cache.path_of(cache.key(HOLIDAY_URL, HEADERS))
+    path.write_bytes(b"garbage")
+
+    assert cache.get(HOLIDAY_URL, HEADERS) is None
+    assert not path.exists()
+
+
+def test_read_through_get_request_api(cache, calls):
+    tools = DownloadTools()
+
+    for _ in range(3):
+        assert tools.get_request_api(HOLIDAY_URL, HEADERS).json() == {"CM": []}
+
+    # Homepage & API hit only once, the rest served from disk.
+    assert calls.count(HOLIDAY_URL) == 1
+    assert cache.stats["holidays"] == {"hits": 2, "misses": 1}
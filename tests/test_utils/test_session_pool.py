@@ -0,0 +1,55 @@
+import pytest
+
+from trade.utils import DownloadTools, SessionPool
+
+NSE_URL = "https://www.nseindia.com/api/quote-equity?symbol=RELIANCE"
+HEADERS = {"user-agent": "pytest"}
+
+
+@pytest.fixture
+def calls(mock_get):
+    return mock_get()
+
+
+def test_session_pool_is_singleton(pool):
+    assert SessionPool() is pool
+
+
+def test_session_per_host(pool):
+    first = pool.get_session(NSE_URL)
+    second = pool.get_session("https://www.nseindia.com/api/allIndices")
+    other = pool.get_session("https://niftyindices.com/IndexConstituent/x.csv")
+
+    assert first is second
+    assert first is not other
+    assert len(pool) == 2
+
+
+def test_cookies_reused_within_ttl(pool, calls):
+    tools = DownloadTools()
+
+    for _ in range(3):
+        tools.get_request_api(NSE_URL, HEADERS)
+
+    # One homepage visit followed by three API calls.
+    assert calls.count("https://www.nseindia.com") == 1
+    assert pool.stats["www.nseindia.com"]["cookie_refreshes"] == 1
+    assert pool.stats["www.nseindia.com"]["requests"] == 4
+
+
+def test_cookies_refreshed_after_forbidden(pool, mock_get, make_response):
+    statuses = iter([200, 403, 200, 200])
+    mock_get(lambda url: make_response(next(statuses), url=url))
+    response = DownloadTools().get_request_api(NSE_URL, HEADERS)
+
+    assert response.status_code == 200
+    assert pool.stats["www.nseindia.com"]["cookie_refreshes"] == 2
+
+
+def test_cookies_refreshed_after_ttl(pool, calls):
+    tools = DownloadTools()
+    tools.get_request_api(NSE_URL, HEADERS)
+    pool.get_session(NSE_URL).cookie_ttl = 0
+    tools.get_request_api(NSE_URL, HEADERS)
+
+    assert calls.count("https://www.nseindia.com") == 2
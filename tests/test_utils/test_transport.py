@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+from requests import Session
+from requests.exceptions import InvalidURL
+
+from trade.exchange.yf import YFinance
+from trade.utils import DownloadTools, Transport
+from trade.utils.html_parsing import HtmlParser
+from trade.utils.transport import FixtureNotFound
+
+QUOTE_URL = "https://www.nseindia.com/api/quote-equity?symbol={0}"
+PAGE_URL = "https://www.nseindia.com/regulations/market-capitalisation"
+
+
+@pytest.fixture
+def live_calls(mock_get, make_response):
+    content = b'{"symbol": "SBIN"}'
+    return mock_get(
+        lambda url: make_response(404 if url.endswith("INVALID") else 200, content)
+    )
+
+
+@pytest.fixture
+def transport():
+    transport = Transport()
+    yield transport
+    transport.set_mode("live")
+
+
+def test_invalid_mode(transport):
+    with pytest.raises(ValueError):
+        transport.set_mode("offline")
+
+    with pytest.raises(ValueError):
+        transport.set_mode("replay", None)
+
+
+def test_record_and_replay_http(transport, live_calls, tmp_path):
+    tools = DownloadTools()
+
+    with transport.recording(tmp_path):
+        recorded = tools.get_request_api(QUOTE_URL.format("SBIN"), {}).json()
+
+        with pytest.raises(InvalidURL):
+            tools.get_request_api(QUOTE_URL.format("INVALID"), {})
+
+    live_calls.clear()
+
+    with transport.replaying(tmp_path):
+        assert tools.get_request_api(QUOTE_URL.format("SBIN"), {}).json() == recorded
+
+        with pytest.raises(InvalidURL):
+            tools.get_request_api(QUOTE_URL.format("INVALID"), {})
+
+        with pytest.raises(FixtureNotFound):
+            tools.get_request_api(QUOTE_URL.format("TCS"), {})
+
+    assert live_calls == []
+
+
+def test_record_and_replay_html(transport, live_calls, tmp_path):
+    parser = HtmlParser(PAGE_URL, {}, ("Period",), session=Session())
+
+    with transport.recording(tmp_path):
+        recorded = parser.get_page_html()
+
+    live_calls.clear()
+
+    with transport.replaying(tmp_path):
+        assert parser.get_page_html() == recorded
+
+    assert live_calls == []
+
+
+def test_record_and_replay_yfinance(transport, tmp_path, monkeypatch):
+    index = pd.date_range("2024-05-13", periods=4, name="Date")
+    frame = pd.DataFrame(
+        {
+            "Open": [1.0, 2.0, 3.0, 4.0],
+            "High": [1.0, 2.0, 3.0, 4.0],
+            "Low": [1.0, 2.0, 3.0, 4.0],
+            "Close": [1.0, 2.0, 3.0, 4.0],
+            "Volume": [10, 20, 30, 40],
+        },
+        index=index,
+    )
+    yfin = YFinance(market="NSE", country="INDIA", date_fmt="%Y-%m-%d")
+    monkeypatch.setattr(yfin.yf, "download", lambda *args, **kwargs: frame.copy())
+
+    with transport.recording(tmp_path):
+        recorded = yfin.get_period_data("sbin")
+
+    monkeypatch.setattr(yfin.yf, "download", None)
+
+    with transport.replaying(tmp_path):
+        replayed = yfin.get_period_data("sbin")
+
+    pd.testing.assert_frame_equal(recorded, replayed)
+    assert len(replayed) == 3
@@ -5,3 +5,5 @@ from trade.calendar.calendar_data import (
     WorkingDayDate,
 )
 from trade.calendar.calendar_tool import MarketCalendar
+from trade.calendar.expiries import ExpiryCalendar
+from trade.calendar.sessions import TradingSessions
@@ -1,10 +1,13 @@
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import List, Optional, TypedDict, Union
+from functools import cached_property
+from typing import List, Optional, Set, Tuple, TypedDict, Union
 
 from pandas.tseries.offsets import BDay
 from pytz import timezone
 
+from trade.calendar.sessions import TradingSessions
+
 WEEKDAY_TO_ISO = {
     "Monday": 1,
     "Tuesday": 2,
@@ -14,6 +17,7 @@ WEEKDAY_TO_ISO = {
     "Saturday": 6,
     "Sunday": 7,
 }
+ISO_TO_WEEKDAY = {v: k for k, v in WEEKDAY_TO_ISO.items()}
 
 
 class MarketTimingType(TypedDict):
@@ -42,104 +46,149 @@ class MarketTimings:
         self.time_cutoff = datetime.strptime(self.time_cutoff, TIME_STRF).time()
 
 
-@dataclass
 class DateObj:
-    raw_date: str
-    date_fmt: str
-    _formatted_date: datetime = None
+    """
+    Trading date backed by its proleptic Gregorian ordinal.
+    Arithmetic & comparisons work on the ordinal, the `date` and the
+    formatted string are only built on first access and then cached.
+    Compares against `DateObj` & `date` only and hashes like the
+    equivalent `date`, so both can be mixed as dict & set keys. Strings
+    and datetimes are never equal to it, compare `as_str` / `as_date`.
+    """
+
+    __slots__ = ("date_fmt", "_ordinal", "_raw_date", "_date", "_as_str")
+
+    def __init__(self, raw_date: str, date_fmt: str):
+        self.date_fmt = date_fmt
+        self._raw_date = raw_date
+        self._date = datetime.strptime(raw_date, date_fmt).date()
+        self._ordinal = self._date.toordinal()
+        self._as_str = None
+
+    @classmethod
+    def from_ordinal(cls, ordinal: int, date_fmt: str) -> "DateObj":
+        date_obj = cls.__new__(cls)
+        date_obj.date_fmt = date_fmt
+        date_obj._ordinal = ordinal
+        date_obj._raw_date, date_obj._date, date_obj._as_str = None, None, None
+        return date_obj
+
+    @classmethod
+    def from_date(cls, value: Union[date, datetime], date_fmt: str) -> "DateObj":
+        return cls.from_ordinal(value.toordinal(), date_fmt)
+
+    def __repr__(self) -> str:
+        return "DateObj(raw_date={0!r}, date_fmt={1!r})".format(
+            self.raw_date, self.date_fmt
+        )
 
-    def __post_init__(self):
-        self._formatted_date = datetime.strptime(self.raw_date, self.date_fmt).date()
+    def __getstate__(self) -> Tuple[int, str]:
+        return self._ordinal, self.date_fmt
+
+    def __setstate__(self, state: Tuple[int, str]) -> None:
+        self._ordinal, self.date_fmt = state
+        self._raw_date, self._date, self._as_str = None, None, None
 
     @property
-    def as_date(self) -> datetime:
-        return self._formatted_date
+    def raw_date(self) -> str:
+        if self._raw_date is None:
+            return self.as_str
+
+        return self._raw_date
+
+    @property
+    def ordinal(self) -> int:
+        return self._ordinal
+
+    @property
+    def as_date(self) -> date:
+        if self._date is None:
+            self._date = date.fromordinal(self._ordinal)
+
+        return self._date
 
     @property
     def day(self) -> int:
-        return self._formatted_date.day
+        return self.as_date.day
 
     @property
     def month(self) -> str:
-        return self._formatted_date.strftime("%b")
+        return self.as_date.strftime("%b")
 
     @property
-    def year(self) -> str:
-        return self._formatted_date.year
+    def year(self) -> int:
+        return self.as_date.year
 
     @property
     def as_str(self) -> str:
-        return self.as_date.strftime(self.date_fmt)
+        if self._as_str is None:
+            self._as_str = self.as_date.strftime(self.date_fmt)
+
+        return self._as_str
 
     @property
-    def as_weekday(self):
-        return self.as_date.strftime("%A")
+    def as_weekday(self) -> str:
+        return ISO_TO_WEEKDAY[self.as_weekday_iso]
 
     @property
     def as_weekday_iso(self) -> int:
-        return WEEKDAY_TO_ISO[self.as_weekday]
+        # Ordinal 1 (01-Jan-0001) is a Monday.
+        return (self._ordinal - 1) % 7 + 1
 
     def __str__(self):
         return self.as_str
 
+    def __hash__(self) -> int:
+        return hash(self.as_date)
+
     def __add__(self, date_diff: Union[timedelta, BDay, int]) -> "DateObj":
         if isinstance(date_diff, int):
-            date_diff = timedelta(date_diff)
+            return DateObj.from_ordinal(self._ordinal + date_diff, self.date_fmt)
+
+        if isinstance(date_diff, timedelta):
+            return DateObj.from_ordinal(self._ordinal + date_diff.days, self.date_fmt)
 
-        new_date = self.as_date + date_diff
-        return DateObj(new_date.strftime(self.date_fmt), date_fmt=self.date_fmt)
+        return DateObj.from_date(self.as_date + date_diff, self.date_fmt)
 
     def __sub__(self, date_diff: Union[timedelta, BDay, int]) -> "DateObj":
         if isinstance(date_diff, int):
-            date_diff = timedelta(date_diff)
+            return DateObj.from_ordinal(self._ordinal - date_diff, self.date_fmt)
 
-        new_date = self.as_date - date_diff
-        return DateObj(new_date.strftime(self.date_fmt), date_fmt=self.date_fmt)
-
-    def __eq__(self, another_date: Union["DateObj", date, datetime]):
-
-        if isinstance(another_date, date) or isinstance(another_date, datetime):
-            another_date = DateObj(
-                another_date.strftime(self.date_fmt), date_fmt=self.date_fmt
-            )
+        if isinstance(date_diff, timedelta):
+            return DateObj.from_ordinal(self._ordinal - date_diff.days, self.date_fmt)
 
-        if isinstance(another_date, str):
-            another_date = DateObj(another_date, date_fmt=self.date_fmt)
-
-        if self.as_date == another_date.as_date:
-            return True
-
-        return False
-
-    def __gt__(self, other_date: Union["DateObj", date, datetime]):
-
-        if isinstance(other_date, date) or isinstance(other_date, datetime):
-            another_date = DateObj(
-                other_date.strftime(self.date_fmt), date_fmt=self.date_fmt
-            )
+        return DateObj.from_date(self.as_date - date_diff, self.date_fmt)
 
-        if isinstance(other_date, str):
-            other_date = DateObj(other_date, date_fmt=self.date_fmt)
+    @staticmethod
+    def _ordinal_of(other: Union["DateObj", date]) -> Optional[int]:
+        if isinstance(other, DateObj):
+            return other._ordinal
 
-        if self.as_date > other_date:
-            return True
+        # A datetime is a date too, but neither equal nor hashed like one.
+        if isinstance(other, date) and not isinstance(other, datetime):
+            return other.toordinal()
 
-        return False
+        return None
 
-    def __lt__(self, other_date: Union["DateObj", date, datetime]):
+    def __eq__(self, other: Union["DateObj", date]) -> bool:
+        ordinal = self._ordinal_of(other)
+        return NotImplemented if ordinal is None else self._ordinal == ordinal
 
-        if isinstance(other_date, date) or isinstance(other_date, datetime):
-            other_date = DateObj(
-                other_date.strftime(self.date_fmt), date_fmt=self.date_fmt
-            )
+    def __lt__(self, other: Union["DateObj", date]) -> bool:
+        ordinal = self._ordinal_of(other)
+        return NotImplemented if ordinal is None else self._ordinal < ordinal
 
-        if isinstance(other_date, str):
-            other_date = DateObj(other_date, date_fmt=self.date_fmt)
+    def __le__(self, other: Union["DateObj", date]) -> bool:
+        ordinal = self._ordinal_of(other)
+        return NotImplemented if ordinal is None else self._ordinal <= ordinal
 
-        if self.as_date < other_date:
-            return True
+    def __gt__(self, other: Union["DateObj", date]) -> bool:
+        ordinal = self._ordinal_of(other)
+        return NotImplemented if ordinal is None else self._ordinal > ordinal
 
-        return False
+    def __ge__(self, other: Union["DateObj", date]) -> bool:
+        ordinal = self._ordinal_of(other)
+        return NotImplemented if ordinal is None else self._ordinal >= ordinal
 
 
 @dataclass
@@ -193,16 +242,33 @@ class MarketHolidays:
     def __len__(self) -> int:
         return len(self.holidays)
 
-    def __contains__(self, item):
-        return item in [i.trade_date for i in self.holidays]
+    def __contains__(self, item: Union[DateObj, date, datetime, str]) -> bool:
+        if isinstance(item, str):
+            item = datetime.strptime(item, self.date_fmt).date()
+
+        elif isinstance(item, DateObj):
+            item = item.as_date
+
+        elif isinstance(item, datetime):
+            item = item.date()
+
+        return item in self._trade_dates
 
     def __post_init__(self):
         if self.today is None:
             self.today = datetime.today().date()
 
         self.holidays = [self._create_holiday_entry(h) for h in self.holidays_dict]
+        self._trade_dates: Set[date] = {i.trade_date.as_date for i in self.holidays}
         self.update_next_holiday()
 
+    @cached_property
+    def sessions(self) -> TradingSessions:
+        return TradingSessions(
+            holidays=[i.trade_date.as_date for i in self.holidays if not i.working],
+            working_days=[i.trade_date.as_date for i in self.holidays if i.working],
+        )
+
     def _create_holiday_entry(
         self, holiday_str: MarketHolidayEntry
     ) -> MarketHolidayEntry:
@@ -214,14 +280,10 @@ class MarketHolidays:
         for i, holiday in enumerate(self.holidays):
             if holiday.trade_date.as_date >= self.today:
                 if holiday.working and self.next_working is None:
-                    self.next_working = DateObj(
-                        holiday.trade_date.as_str, date_fmt=self.date_fmt
-                    )
+                    self.next_working = holiday.trade_date
 
                 if not holiday.working and self.next_holiday is None:
-                    self.next_holiday = DateObj(
-                        holiday.trade_date.as_str, date_fmt=self.date_fmt
-                    )
+                    self.next_holiday = holiday.trade_date
 
                 if self.next_holiday is not None and self.next_working is not None:
                     break
@@ -232,7 +294,7 @@ class MarketHolidays:
     def prev_holiday(self) -> DateObj:
         for holiday in reversed(self.holidays):
             if holiday.trade_date < self.today and not holiday.working:
-                return DateObj(holiday.trade_date.as_str, date_fmt=self.date_fmt)
+                return holiday.trade_date
 
         return None
 
@@ -241,7 +303,7 @@ class MarketHolidays:
 
         for holiday in reversed(self.holidays):
             if holiday.trade_date < self.today and holiday.working:
-                return DateObj(holiday.trade_date.as_str, date_fmt=self.date_fmt)
+                return holiday.trade_date
 
         return None
 
@@ -306,13 +368,15 @@ class WorkingDayDate:
 
         now = datetime.now(tz=self.market_timings.tz).time()
 
+        given_date = DateObj(self.given_date, self.date_fmt)
+
         if (
-            DateObj(self.given_date, self.date_fmt) == self.today
+            given_date == self.today
             and self.market_timings.start_time <= now <= self.market_timings.time_cutoff
         ):
             self.working_day = self.compare_time_cutoff()
         else:
-            self.working_day = DateObj(self.given_date, self.date_fmt)
+            self.working_day = given_date
 
         if not isinstance(self.market_holidays, MarketHolidays):
             self.market_holidays = MarketHolidays(
@@ -330,66 +394,42 @@ class WorkingDayDate:
         ).previous_business_day
 
     @property
-    def next_business_day(self) -> DateObj:
-
-        today = self.day
-        tomorrow = today + BDay()
+    def sessions(self) -> TradingSessions:
+        return self.market_holidays.sessions
 
-        if tomorrow == self.market_holidays.next_holiday:
-            tomorrow = tomorrow + BDay()
+    def _as_date_obj(self, day: date) -> DateObj:
+        return DateObj.from_date(day, self.date_fmt)
 
-        if self.market_holidays.next_working > today:
-            if self.market_holidays.next_working < tomorrow:
-                tomorrow = self.market_holidays.next_holiday
-
-        return tomorrow
+    @property
+    def next_business_day(self) -> DateObj:
+        return self._as_date_obj(self.sessions.next_session(self.day.as_date))
 
     @property
     def previous_business_day(self) -> DateObj:
 
         today = self.day
-        yesterday = today - BDay()
 
         if (
-            today not in self.market_holidays
-            and today < datetime.now(tz=self.market_timings.tz).today()
+            self.sessions.is_session(today.as_date)
+            and today < datetime.now(tz=self.market_timings.tz).today().date()
         ):
             return today
 
-        if yesterday == self.market_holidays.next_holiday:
-            yesterday = yesterday - BDay()
-
-        if self.market_holidays.prev_working is not None:
-            if (
-                self.market_holidays.prev_working < today
-                and self.market_holidays.prev_working > yesterday
-            ):
-                yesterday = self.market_holidays.prev_working
-
-        return yesterday
-
-    def __add__(self, days: int) -> "WorkObj":
-        count_days = 0
-        iter_work_day = self.day
-        while count_days < days:
-            iter_work_day = WorkingDayDate(
-                iter_work_day.as_str, self.market_holidays
-            ).next_business_day
-            count_days += 1
+        return self._as_date_obj(self.sessions.prev_session(today.as_date))
 
+    def _offset(self, days: int) -> "WorkingDayDate":
         return WorkingDayDate(
-            iter_work_day.as_str, self.market_holidays, date_fmt=self.date_fmt
+            self._as_date_obj(
+                self.sessions.session_offset(self.day.as_date, days)
+            ).as_str,
+            self.market_holidays,
+            market_timings=self.market_timings,
+            date_fmt=self.date_fmt,
+            today=self.today,
         )
 
-    def __sub__(self, days: int) -> "WorkObj":
-        count_days = days
-        iter_work_day = self.day
-        while count_days > 0:
-            iter_work_day = WorkingDayDate(
-                iter_work_day.as_str, self.market_holidays, date_fmt=self.date_fmt
-            ).previous_business_day
-            count_days -= 1
+    def __add__(self, days: int) -> "WorkingDayDate":
+        return self._offset(days)
 
-        return WorkingDayDate(
-            iter_work_day.as_str, self.market_holidays, date_fmt=self.date_fmt
-        )
+    def __sub__(self, days: int) -> "WorkingDayDate":
+        return self._offset(-days)
@@ -6,6 +6,7 @@ from trade.calendar.calendar_data import (
     MarketTimingType,
     WorkingDayDate,
 )
+from trade.calendar.sessions import TradingSessions
 
 
 class MarketCalendar:
@@ -41,3 +42,7 @@ class MarketCalendar:
     @property
     def curr_day(self):
         return self.working_day.working_day
+
+    @property
+    def sessions(self) -> TradingSessions:
+        return self.working_day.sessions
@@ -0,0 +1,240 @@
+from bisect import bisect_right
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from trade.calendar.calendar_data import WEEKDAY_TO_ISO
+from trade.calendar.sessions import TradingSessions
+
+FUTURES, OPTIONS = "fut_expiry", "opt_expiry"
+EXPIRY_KINDS = (FUTURES, OPTIONS)
+STOCK_EXPIRY = "stock"
+EXPIRY_RULES_TYPE = Dict[str, object]
+EXPIRIES_TYPE = Dict[str, List[str]]
+NO_EXPIRY_RULE = "No expiry rule for {0} effective on {1}."
+INVALID_EXPIRY_KIND = "Invalid expiry kind: {0}. Choose from {1}."
+
+
+@dataclass(frozen=True)
+class ExpiryRule:
+    """
+    Expiry schedule of an underlying from `effective_from` onwards.
+    Monthly contracts expire on the last `weekday` of the month, weekly
+    options (when `weekly` > 0) on every `weekly_weekday` except the week
+    of the monthly expiry. `weekly` & `monthly` are the number of
+    contracts listed at any time.
+    """
+
+    effective_from: date
+    weekday: int
+    weekly_weekday: Optional[int] = None
+    weekly: int = 0
+    monthly: int = 3
+
+    @classmethod
+    def from_config(cls, params: Dict[str, object], date_fmt: str) -> "ExpiryRule":
+        weekly_weekday = params.get("weekly-weekday", None)
+
+        return cls(
+            effective_from=datetime.strptime(params["effective-from"], date_fmt).date(),
+            weekday=WEEKDAY_TO_ISO[params["weekday"]],
+            weekly_weekday=(
+                None if weekly_weekday is None else WEEKDAY_TO_ISO[weekly_weekday]
+            ),
+            weekly=params.get("weekly", 0),
+            monthly=params.get("monthly", 3),
+        )
+
+    @property
+    def weekly_iso(self) -> int:
+        return self.weekday if self.weekly_weekday is None else self.weekly_weekday
+
+
+class ExpiryCalendar:
+    """
+    Rule based F&O expiry calendar.
+    Expiries are generated from the `EXPIRY-RULES` of the market config
+    for any date range and shifted to the previous session when they
+    fall on a market holiday. `reconcile` aligns the generated upcoming
+    expiries with the ones listed by the exchange; the differences are
+    kept as overrides for queries as of that day or later.
+    """
+
+    def __init__(
+        self,
+        sessions: TradingSessions,
+        expiry_rules: EXPIRY_RULES_TYPE,
+        date_fmt: str,
+    ):
+        self.sessions = sessions
+        self.date_fmt = date_fmt
+        self._rules: Dict[str, List[ExpiryRule]] = dict()
+        self._overrides: Dict[Tuple[str, str], Tuple[Set[date], Set[date]]] = dict()
+        self._reconciled: Dict[str, date] = dict()
+
+        rules = {STOCK_EXPIRY: expiry_rules.get(STOCK_EXPIRY, list())}
+        rules.update(expiry_rules.get("index", dict()))
+
+        for key, params in rules.items():
+            self._rules[key] = sorted(
+                (ExpiryRule.from_config(i, date_fmt) for i in params),
+                key=lambda rule: rule.effective_from,
+            )
+
+        self._effective = {
+            key: [i.effective_from for i in rules] for key, rules in self._rules.items()
+        }
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rules
+
+    def _rule_or_none(self, key: str, day: date) -> Optional[ExpiryRule]:
+        index = bisect_right(self._effective[key], day) - 1
+        return None if index < 0 else self._rules[key][index]
+
+    def rule_for(self, key: str, day: date) -> ExpiryRule:
+        rule = self._rule_or_none(key, day)
+
+        if rule is None:
+            raise ValueError(NO_EXPIRY_RULE.format(key, day))
+
+        return rule
+
+    def _shift(self, day: date) -> date:
+        try:
+            return self.sessions.session_offset(day, 0)
+
+        except ValueError:
+            # Outside the session calendar, holidays are unknown.
+            return day
+
+    def monthly_expiry(self, key: str, year: int, month: int) -> date:
+        last_day = date(year, month, monthrange(year, month)[1])
+        rule = self.rule_for(key, last_day)
+        offset = (last_day.isoweekday() - rule.weekday) % 7
+        return self._shift(last_day - timedelta(days=offset))
+
+    def _monthly_between(self, key: str, start: date, end: date) -> List[date]:
+        expiries = list()
+        year, month = start.year, start.month
+
+        while date(year, month, 1) <= end:
+            expiry = self.monthly_expiry(key, year, month)
+
+            if start <= expiry <= end:
+                expiries.append(expiry)
+
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+        return expiries
+
+    def _weekly_between(
+        self, key: str, start: date, end: date, monthly: Iterable[date]
+    ) -> List[date]:
+        monthly_weeks = {i.isocalendar()[:2] for i in monthly}
+        expiries = list()
+        # Weekly expiries shift back at most a few sessions on holidays, so
+        # candidates are generated a week past `end` and trimmed after.
+        for ordinal in range(start.toordinal(), end.toordinal() + 8):
+            day = date.fromordinal(ordinal)
+            rule = self._rule_or_none(key, day)
+
+            if rule is None or rule.weekly == 0 or day.isoweekday() != rule.weekly_iso:
+                continue
+
+            if day.isocalendar()[:2] not in monthly_weeks:
+                expiry = self._shift(day)
+
+                if start <= expiry <= end:
+                    expiries.append(expiry)
+
+        return expiries
+
+    def _generate(self, key: str, start: date, end: date, kind: str) -> Set[date]:
+        if kind not in EXPIRY_KINDS:
+            raise ValueError(INVALID_EXPIRY_KIND.format(kind, EXPIRY_KINDS))
+
+        # Monthly expiries can shift into the previous month on holidays.
+        monthly = self._monthly_between(key, start, end + timedelta(days=7))
+        expiries = {i for i in monthly if i <= end}
+
+        if kind == OPTIONS:
+            expiries.update(self._weekly_between(key, start, end, monthly))
+
+        return expiries
+
+    def _apply_overrides(
+        self, key: str, kind: str, expiries: Set[date], start: date, end: date
+    ) -> Set[date]:
+        reconciled_on = self._reconciled.get(key, None)
+
+        if (key, kind) not in self._overrides or start < reconciled_on:
+            return expiries
+
+        added, removed = self._overrides[(key, kind)]
+        expiries = expiries - removed
+        return expiries | {i for i in added if start <= i <= end}
+
+    def expiries_between(
+        self, key: str, start: date, end: date, kind: str = OPTIONS
+    ) -> List[date]:
+        """Every `kind` expiry of `key` from `start` through `end`."""
+
+        expiries = self._generate(key, start, end, kind)
+        return sorted(self._apply_overrides(key, kind, expiries, start, end))
+
+    def _upcoming(self, key: str, as_of: date) -> Dict[str, Set[date]]:
+        rule = self.rule_for(key, as_of)
+        end = as_of + timedelta(days=31 * (rule.monthly + 1))
+        futures = sorted(self._generate(key, as_of, end, FUTURES))[: rule.monthly]
+        options = sorted(self._generate(key, as_of, futures[-1], OPTIONS))
+        weeklies = [i for i in options if i not in futures][: rule.weekly]
+
+        return {FUTURES: set(futures), OPTIONS: set(futures + weeklies)}
+
+    def upcoming(self, key: str, as_of: date) -> EXPIRIES_TYPE:
+        """
+        Futures & options expiries of `key` listed as of `as_of`, in the
+        same shape (and date format) as the exchange's derivative quote.
+        """
+
+        return {
+            kind: [
+                i.strftime(self.date_fmt)
+                for i in sorted(
+                    self._apply_overrides(key, kind, expiries, as_of, date.max)
+                )
+            ]
+            for kind, expiries in self._upcoming(key, as_of).items()
+        }
+
+    def needs_reconcile(self, key: str, today: Optional[date] = None) -> bool:
+        today = date.today() if today is None else today
+        return self._reconciled.get(key, None) != today
+
+    def mark_reconciled(self, key: str, today: Optional[date] = None) -> None:
+        self._reconciled[key] = date.today() if today is None else today
+
+    def reconcile(
+        self,
+        key: str,
+        futures: List[str],
+        options: List[str],
+        today: Optional[date] = None,
+    ) -> None:
+        """
+        Record where the exchange listed `futures` & `options` expiries
+        differ from the generated ones as of `today`.
+        """
+
+        today = date.today() if today is None else today
+        upcoming = self._upcoming(key, today)
+
+        for kind, listed in ((FUTURES, futures), (OPTIONS, options)):
+            listed = {datetime.strptime(i, self.date_fmt).date() for i in listed}
+            horizon = max(listed, default=today)
+            generated = {i for i in upcoming[kind] if i <= horizon}
+            self._overrides[(key, kind)] = (listed - generated, generated - listed)
+
+        self.mark_reconciled(key, today)
@@ -0,0 +1,225 @@
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+SESSIONS_START = date(1990, 1, 1)
+SESSIONS_YEARS_AHEAD = 1
+WEEKMASK = "1111100"
+SESSION_DAY_TYPE = Union[date, datetime, np.datetime64, str, Any]
+SESSION_ARRAY_TYPE = Union[np.ndarray, pd.Series, pd.DatetimeIndex, list]
+SESSION_OUT_OF_RANGE = "{0} is outside the trading session calendar ({1} - {2})."
+INVALID_SESSION_DAY = "Cannot convert {0} of type {1} to a session day."
+
+
+def to_ordinal(day: SESSION_DAY_TYPE) -> int:
+    """
+    Proleptic Gregorian ordinal of `day`, which can be a date, datetime,
+    numpy datetime64, ISO formatted string or anything with `as_date`
+    (i.e. `DateObj`).
+    """
+
+    if isinstance(day, date):
+        return day.toordinal()
+
+    if isinstance(day, np.datetime64):
+        return int(day.astype("datetime64[D]").astype(np.int64)) + EPOCH_ORDINAL
+
+    if isinstance(day, str):
+        return date.fromisoformat(day).toordinal()
+
+    if hasattr(day, "as_date"):
+        return day.as_date.toordinal()
+
+    raise TypeError(INVALID_SESSION_DAY.format(day, type(day).__name__))
+
+
+def as_day_array(days: SESSION_ARRAY_TYPE) -> np.ndarray:
+    """Day resolution datetime64 array of `days`, time zones are dropped."""
+
+    if isinstance(days, pd.Series) and isinstance(days.dtype, pd.DatetimeTZDtype):
+        days = days.dt.tz_localize(None)
+
+    if isinstance(days, pd.DatetimeIndex) and days.tz is not None:
+        days = days.tz_localize(None)
+
+    return np.asarray(days, dtype="datetime64[D]")
+
+
+def _like(days: SESSION_ARRAY_TYPE, values: np.ndarray) -> Union[np.ndarray, pd.Series]:
+    if isinstance(days, pd.Series):
+        return pd.Series(values, index=days.index, name=days.name)
+
+    return values
+
+
+def to_datetime64(days: Iterable[SESSION_DAY_TYPE]) -> np.ndarray:
+    ordinals = np.fromiter((to_ordinal(i) for i in days), dtype=np.int64)
+    return (ordinals - EPOCH_ORDINAL).astype("datetime64[D]")
+
+
+class TradingSessions:
+    """
+    Compiled trading session calendar of a market.
+    Sessions are every weekday between `start` & `end` minus the market
+    holidays plus the special working days (e.g. muhurat trading), held
+    as a sorted datetime64 array (`sessions`) and as proleptic ordinals.
+    Membership is O(1), next/prev/offset lookups are O(log n) bisects.
+    """
+
+    def __init__(
+        self,
+        holidays: Iterable[SESSION_DAY_TYPE] = tuple(),
+        working_days: Iterable[SESSION_DAY_TYPE] = tuple(),
+        start: date = SESSIONS_START,
+        end: Optional[date] = None,
+    ):
+        holidays, working_days = to_datetime64(holidays), to_datetime64(working_days)
+
+        if end is None:
+            years = [date.today().year]
+            years += [i.year for i in holidays.astype(object)]
+            years += [i.year for i in working_days.astype(object)]
+            end = date(max(years) + SESSIONS_YEARS_AHEAD, 12, 31)
+
+        self.start, self.end = start, end
+        days = np.arange(
+            np.datetime64(start, "D"),
+            np.datetime64(end, "D") + 1,
+            dtype="datetime64[D]",
+        )
+        working_days = working_days[
+            (working_days >= days[0]) & (working_days <= days[-1])
+        ]
+        self.sessions = np.union1d(
+            days[np.is_busday(days, weekmask=WEEKMASK, holidays=holidays)],
+            working_days,
+        )
+        self.ordinals = self.sessions.astype(np.int64) + EPOCH_ORDINAL
+        self._ordinals = self.ordinals.tolist()
+        self._ordinal_set = set(self._ordinals)
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __contains__(self, day: SESSION_DAY_TYPE) -> bool:
+        return self.is_session(day)
+
+    def _session_at(self, index: int, day: SESSION_DAY_TYPE) -> date:
+        if not 0 <= index < len(self._ordinals):
+            raise ValueError(SESSION_OUT_OF_RANGE.format(day, self.start, self.end))
+
+        return date.fromordinal(self._ordinals[index])
+
+    def is_session(self, day: SESSION_DAY_TYPE) -> bool:
+        return to_ordinal(day) in self._ordinal_set
+
+    def session_index(self, day: SESSION_DAY_TYPE) -> int:
+        """Position of the session on or before `day` in `sessions`."""
+
+        return bisect_right(self._ordinals, to_ordinal(day)) - 1
+
+    def next_session(self, day: SESSION_DAY_TYPE, n: int = 1) -> date:
+        """`n`th session strictly after `day`."""
+
+        index = bisect_right(self._ordinals, to_ordinal(day)) + n - 1
+        return self._session_at(index, day)
+
+    def prev_session(self, day: SESSION_DAY_TYPE, n: int = 1) -> date:
+        """`n`th session strictly before `day`."""
+
+        index = bisect_left(self._ordinals, to_ordinal(day)) - n
+        return self._session_at(index, day)
+
+    def session_offset(self, day: SESSION_DAY_TYPE, n: int) -> date:
+        """
+        Session `n` sessions away from `day`, forward for positive and
+        backward for negative `n`. With `n=0` a non session `day` rolls
+        back to the previous session.
+        """
+
+        if n > 0:
+            return self.next_session(day, n)
+
+        if n < 0:
+            return self.prev_session(day, -n)
+
+        if self.is_session(day):
+            return date.fromordinal(to_ordinal(day))
+
+        return self.prev_session(day)
+
+    def sessions_between(
+        self, start: SESSION_DAY_TYPE, end: SESSION_DAY_TYPE
+    ) -> np.ndarray:
+        """Sessions from `start` through `end`, both inclusive."""
+
+        first = bisect_left(self._ordinals, to_ordinal(start))
+        last = bisect_right(self._ordinals, to_ordinal(end))
+        return self.sessions[first:last]
+
+    def _from_indices(self, indices: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        valid = valid & (indices >= 0) & (indices < len(self.sessions))
+        result = np.full(indices.shape, np.datetime64("NaT"), dtype="datetime64[D]")
+        result[valid] = self.sessions[indices[valid]]
+        return result
+
+    def is_trading_day(self, days: SESSION_ARRAY_TYPE) -> Union[np.ndarray, pd.Series]:
+        """Element wise `is_session`, NaT is never a trading day."""
+
+        values = as_day_array(days)
+        indices = np.searchsorted(self.sessions, values, side="left")
+        found = np.zeros(values.shape, dtype=bool)
+        in_range = ~np.isnat(values) & (indices < len(self.sessions))
+        found[in_range] = self.sessions[indices[in_range]] == values[in_range]
+        return _like(days, found)
+
+    def session_ordinals(
+        self, days: SESSION_ARRAY_TYPE
+    ) -> Union[np.ndarray, pd.Series]:
+        """
+        Element wise `session_index`: position on the session grid of the
+        session on or before each day, -1 for NaT or days before `start`.
+        """
+
+        values = as_day_array(days)
+        ordinals = np.searchsorted(self.sessions, values, side="right") - 1
+        ordinals[np.isnat(values)] = -1
+        return _like(days, ordinals)
+
+    def next_sessions(
+        self, days: SESSION_ARRAY_TYPE, n: int = 1
+    ) -> Union[np.ndarray, pd.Series]:
+        """Element wise `next_session`, NaT where out of range."""
+
+        values = as_day_array(days)
+        indices = np.searchsorted(self.sessions, values, side="right") + n - 1
+        return _like(days, self._from_indices(indices, ~np.isnat(values)))
+
+    def prev_sessions(
+        self, days: SESSION_ARRAY_TYPE, n: int = 1
+    ) -> Union[np.ndarray, pd.Series]:
+        """Element wise `prev_session`, NaT where out of range."""
+
+        values = as_day_array(days)
+        indices = np.searchsorted(self.sessions, values, side="left") - n
+        return _like(days, self._from_indices(indices, ~np.isnat(values)))
+
+    def session_gaps(self, days: SESSION_ARRAY_TYPE) -> Union[np.ndarray, pd.Series]:
+        """
+        Sessions elapsed between consecutive days, 1 for back to back
+        sessions, 0 for the first element and around NaT. Gaps above 1
+        mark missing sessions, e.g. holes in a downloaded history.
+        """
+
+        values = as_day_array(days)
+        ordinals = np.searchsorted(self.sessions, values, side="right") - 1
+        missing = np.isnat(values)
+        gaps = np.zeros(ordinals.shape, dtype=np.int64)
+        gaps[1:] = np.diff(ordinals)
+        gaps[missing] = 0
+        gaps[1:][missing[:-1]] = 0
+        return _like(days, gaps)
@@ -1 +1,5 @@
+from trade.exchange.bhav_archive import BackfillReport, BhavcopyArchive
+from trade.exchange.breadth import MarketBreadth
+from trade.exchange.exchange_context import ExchangeContext, ExchangeContexts
 from trade.exchange.market import Exchange, ExchangeArgs
+from trade.exchange.price_panel import PricePanel
@@ -0,0 +1,263 @@
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import pandas as pd
+
+from trade.calendar.sessions import SESSION_DAY_TYPE, TradingSessions, to_ordinal
+from trade.utils.executor_service import ExecutorService
+from trade.utils.history_store import HISTORY_DIR
+
+BHAV_ARCHIVE_DIR = Path(os.getenv("BHAV_ARCHIVE_DIR", HISTORY_DIR / Path("bhavcopy")))
+ARCHIVE_SUFFIX = ".parquet"
+FAILURES_FILE = "failures.json"
+# Legacy (`cm..bhav.csv`) & UDiFF bhavcopy headers to the archived columns.
+BHAV_COLUMN_ALIASES = {
+    "symbol": "symbol",
+    "tckrsymb": "symbol",
+    "series": "series",
+    "sctysrs": "series",
+    "open": "open",
+    "opnpric": "open",
+    "high": "high",
+    "hghpric": "high",
+    "low": "low",
+    "lwpric": "low",
+    "close": "close",
+    "clspric": "close",
+    "last": "last",
+    "lastpric": "last",
+    "prevclose": "prev_close",
+    "prvsclsgpric": "prev_close",
+    "tottrdqty": "volume",
+    "ttltradgvol": "volume",
+    "tottrdval": "turnover",
+    "ttltrfval": "turnover",
+    "totaltrades": "trades",
+    "ttlnboftxsexctd": "trades",
+    "isin": "isin",
+    "timestamp": "date",
+    "traddt": "date",
+}
+BHAV_ARCHIVE_COLS = (
+    "date",
+    "symbol",
+    "series",
+    "open",
+    "high",
+    "low",
+    "close",
+    "last",
+    "prev_close",
+    "volume",
+    "turnover",
+    "trades",
+    "isin",
+)
+BHAV_REQUIRED_COLS = ("symbol", "series", "open", "high", "low", "close", "volume")
+BHAV_PRICE_COLS = ("open", "high", "low", "close", "last", "prev_close")
+FETCH_BHAVCOPY_TYPE = Callable[[date], pd.DataFrame]
+EMPTY_BHAVCOPY = "Empty bhavcopy for {0}."
+MISSING_BHAV_COLUMNS = "Bhavcopy for {0} misses columns: {1}."
+STALE_BHAVCOPY = "Bhavcopy for {0} is dated {1}."
+
+
+@dataclass
+class BackfillReport:
+    archived: List[date] = field(default_factory=list)
+    skipped: List[date] = field(default_factory=list)
+    failed: Dict[date, str] = field(default_factory=dict)
+
+    @property
+    def complete(self) -> bool:
+        return len(self.failed) == 0
+
+
+def normalise_bhavcopy(data: pd.DataFrame, day: date) -> pd.DataFrame:
+    """
+    Bhavcopy in the archived layout (`BHAV_ARCHIVE_COLS`), whichever of the
+    legacy or UDiFF formats it was published in. Raises ValueError when the
+    file is empty, misses columns or is of another session.
+    """
+
+    data = data.loc[:, ~data.columns.astype(str).str.contains("^Unnamed")]
+    data.columns = data.columns.astype(str).str.strip().str.lower()
+    data = data.rename(columns=BHAV_COLUMN_ALIASES)
+
+    if data.empty:
+        raise ValueError(EMPTY_BHAVCOPY.format(day))
+
+    missing = [i for i in BHAV_REQUIRED_COLS if i not in data.columns]
+
+    if len(missing) > 0:
+        raise ValueError(MISSING_BHAV_COLUMNS.format(day, missing))
+
+    if "date" in data.columns:
+        dated = pd.to_datetime(data["date"].iloc[0], format="mixed").date()
+
+        if dated != day:
+            raise ValueError(STALE_BHAVCOPY.format(day, dated))
+
+    data = data.reindex(columns=list(BHAV_ARCHIVE_COLS))
+    data["date"] = pd.Timestamp(day)
+
+    for column in ("symbol", "series", "isin"):
+        data[column] = data[column].astype("string").str.strip()
+
+    for column in BHAV_PRICE_COLS + ("turnover",):
+        data[column] = pd.to_numeric(data[column], errors="coerce").astype(float)
+
+    for column in ("volume", "trades"):
+        data[column] = pd.to_numeric(data[column], errors="coerce").astype("Int64")
+
+    return data.reset_index(drop=True)
+
+
+class BhavcopyArchive:
+    """
+    Local archive of daily bhavcopies, one normalised parquet file per
+    session (`<archive_dir>/<year>/<yyyy-mm-dd>.parquet`). Backfills walk
+    the session calendar (holidays are never fetched), download the
+    missing days in parallel on the `ExecutorService` through `fetch`
+    (rate limited by the download tools) and write each day atomically,
+    so an interrupted backfill resumes from the days still missing.
+    Failed days are kept in `failures.json` and retried by the next
+    backfill.
+    """
+
+    def __init__(
+        self,
+        sessions: TradingSessions,
+        fetch: FETCH_BHAVCOPY_TYPE,
+        archive_dir: Path = BHAV_ARCHIVE_DIR,
+    ):
+        self.sessions = sessions
+        self.fetch = fetch
+        self.archive_dir = Path(archive_dir)
+
+    def path_of(self, day: date) -> Path:
+        return (
+            self.archive_dir
+            / Path(str(day.year))
+            / Path(day.isoformat() + ARCHIVE_SUFFIX)
+        )
+
+    def __contains__(self, day: SESSION_DAY_TYPE) -> bool:
+        return self.path_of(date.fromordinal(to_ordinal(day))).exists()
+
+    @property
+    def failures(self) -> Dict[str, str]:
+        try:
+            return json.loads((self.archive_dir / Path(FAILURES_FILE)).read_text())
+
+        except (FileNotFoundError, ValueError):
+            return dict()
+
+    def _write_failures(self, failures: Dict[str, str]) -> None:
+        path = self.archive_dir / Path(FAILURES_FILE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile("w", dir=path.parent, delete=False) as file:
+            json.dump(failures, file, sort_keys=True)
+
+        os.replace(file.name, path)
+
+    def sessions_between(
+        self, start: SESSION_DAY_TYPE, end: SESSION_DAY_TYPE
+    ) -> List[date]:
+        return [
+            date.fromordinal(to_ordinal(i))
+            for i in self.sessions.sessions_between(start, end)
+        ]
+
+    def pending(self, start: SESSION_DAY_TYPE, end: SESSION_DAY_TYPE) -> List[date]:
+        """Sessions from `start` through `end` not archived yet."""
+
+        return [i for i in self.sessions_between(start, end) if i not in self]
+
+    def store(self, day: date, data: pd.DataFrame) -> Path:
+        path = self.path_of(day)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile(dir=path.parent, delete=False) as file:
+            data.to_parquet(file, index=False)
+
+        os.replace(file.name, path)
+        return path
+
+    def archive(self, day: date) -> Path:
+        """Download, validate & store the bhavcopy of `day`."""
+
+        return self.store(day, normalise_bhavcopy(self.fetch(day), day))
+
+    def backfill(
+        self, start: SESSION_DAY_TYPE, end: SESSION_DAY_TYPE
+    ) -> BackfillReport:
+        """Archive every session from `start` through `end` not archived yet."""
+
+        sessions = self.sessions_between(start, end)
+        archived = {i for i in sessions if i in self}
+        pending = [i for i in sessions if i not in archived]
+        report = BackfillReport(skipped=sorted(archived))
+        failures = self.failures
+
+        for result in ExecutorService().as_completed(
+            self.archive, pending, name="bhavcopy-backfill"
+        ):
+            day = result.key
+
+            if result.ok:
+                report.archived.append(day)
+                failures.pop(day.isoformat(), None)
+            else:
+                report.failed[day] = str(result.error)
+                failures[day.isoformat()] = str(result.error)
+
+        self._write_failures(failures)
+
+        report.archived.sort()
+        return report
+
+    def read_day(
+        self, day: SESSION_DAY_TYPE, columns: Optional[Sequence[str]] = None
+    ) -> pd.DataFrame:
+        day = date.fromordinal(to_ordinal(day))
+        columns = None if columns is None else list(columns)
+        return pd.read_parquet(self.path_of(day), columns=columns)
+
+    def read(
+        self,
+        start: SESSION_DAY_TYPE,
+        end: SESSION_DAY_TYPE,
+        symbols: Optional[Iterable[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Archived bhavcopies from `start` through `end` as one frame."""
+
+        columns = None if columns is None else list(dict.fromkeys(columns))
+        filters = None if symbols is None else [("symbol", "in", list(symbols))]
+        frames = [
+            pd.read_parquet(self.path_of(day), columns=columns, filters=filters)
+            for day in self.sessions_between(start, end)
+            if day in self
+        ]
+
+        if len(frames) == 0:
+            return pd.DataFrame(columns=columns or list(BHAV_ARCHIVE_COLS))
+
+        return pd.concat(frames, ignore_index=True)
+
+    def read_by_day(
+        self, start: SESSION_DAY_TYPE, end: SESSION_DAY_TYPE
+    ) -> Dict[date, pd.DataFrame]:
+        """Archived bhavcopies keyed by session, e.g. for a `PricePanel`."""
+
+        return {
+            day: self.read_day(day)
+            for day in self.sessions_between(start, end)
+            if day in self
+        }
@@ -0,0 +1,293 @@
+import warnings
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from trade.calendar.sessions import SESSION_DAY_TYPE
+from trade.exchange.price_panel import PricePanel
+
+BREADTH_EMAS = (20, 50, 200)
+HIGH_LOW_WINDOW = 252
+MCCLELLAN_SPANS = (19, 39)
+# Market cap rank bounds (inclusive) of the cohorts, as in the NIFTY indices.
+MCAP_COHORTS = {"large": (1, 100), "mid": (101, 250), "small": (251, 500)}
+BREADTH_COUNTS = ["advances", "declines", "unchanged", "new_highs", "new_lows"]
+MISSING_BREADTH_FIELD = "The price panel misses the {0} field."
+STALE_BREADTH_SESSION = "Session {0} is not after the last breadth session {1}."
+
+
+def advance_decline(close: np.ndarray, prev_close: np.ndarray) -> Dict[str, int]:
+    """Advances, declines & unchanged of one session, NaN quotes left out."""
+
+    change = np.asarray(close, dtype=float) - np.asarray(prev_close, dtype=float)
+    return {
+        "Advances": int((change > 0).sum()),
+        "Declines": int((change < 0).sum()),
+        "Unchanged": int((change == 0).sum()),
+    }
+
+
+def mcap_cohorts(
+    ranks: pd.Series, bounds: Dict[str, Tuple[int, int]] = MCAP_COHORTS
+) -> Dict[str, List[str]]:
+    """Symbols of each cohort, from market cap ranks (e.g. `sr_no`) by symbol."""
+
+    return {
+        cohort: ranks.index[(ranks >= low) & (ranks <= high)].astype(str).tolist()
+        for cohort, (low, high) in bounds.items()
+    }
+
+
+class MarketBreadth:
+    """
+    Per session breadth of a set of symbols: advance/decline counts, the
+    A/D line, the McClellan oscillator, new highs & lows over
+    `high_low_window` sessions and the percent of stocks closing above
+    their EMAs. `compute` works on whole (session x symbol) frames in one
+    vectorised pass, `update` appends a session from the state left by
+    it, giving the same rows as recomputing over the longer history.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        ema_spans: Sequence[int] = BREADTH_EMAS,
+        high_low_window: int = HIGH_LOW_WINDOW,
+    ):
+        self.symbols = list(symbols)
+        self.ema_spans = tuple(ema_spans)
+        self.high_low_window = high_low_window
+        self.data = pd.DataFrame(
+            columns=self.columns, index=pd.DatetimeIndex([], name="date")
+        ).astype(self.dtypes)
+        self._prev_close = np.full(len(self.symbols), np.nan)
+        self._highs = deque(maxlen=high_low_window)
+        self._lows = deque(maxlen=high_low_window)
+        self._emas = {span: np.full(len(self.symbols), np.nan) for span in ema_spans}
+        self._observed = np.zeros(len(self.symbols), dtype=np.int64)
+        self._net = {span: np.nan for span in MCCLELLAN_SPANS}
+        self._ad_line = 0
+
+    @property
+    def columns(self) -> List[str]:
+        return [
+            "advances",
+            "declines",
+            "unchanged",
+            "ad_line",
+            "mcclellan",
+            "new_highs",
+            "new_lows",
+        ] + ["pct_above_ema_{0}".format(span) for span in self.ema_spans]
+
+    @property
+    def dtypes(self) -> Dict[str, str]:
+        return {i: "int64" if i in BREADTH_COUNTS else "float64" for i in self.columns}
+
+    @classmethod
+    def from_panel(
+        cls,
+        panel: PricePanel,
+        symbols: Optional[Iterable[str]] = None,
+        start: Optional[SESSION_DAY_TYPE] = None,
+        end: Optional[SESSION_DAY_TYPE] = None,
+        **kwargs,
+    ) -> "MarketBreadth":
+        """
+        Breadth of `symbols` (every symbol of the panel by default) over the
+        panel sessions from `start` through `end`. EMAs & highs/lows warm
+        up from `start`, pass an earlier one to have them settled.
+        """
+
+        for field in ("close", "high", "low"):
+            if field not in panel.fields:
+                raise KeyError(MISSING_BREADTH_FIELD.format(field))
+
+        symbols = panel.symbols if symbols is None else list(symbols)
+        symbols = [i for i in symbols if i in panel]
+        breadth = cls(symbols, **kwargs)
+        breadth.compute(
+            *(
+                panel.field_frame(field, symbols, start, end)
+                for field in ("close", "high", "low")
+            )
+        )
+        return breadth
+
+    def _ema(self, data: pd.DataFrame, span: int) -> pd.DataFrame:
+        return data.ewm(span=span, adjust=False, ignore_na=True).mean()
+
+    def compute(
+        self,
+        close: pd.DataFrame,
+        high: Optional[pd.DataFrame] = None,
+        low: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
+        """
+        Breadth of (session x symbol) frames of the `symbols`, closes stand
+        in for missing highs & lows. Replaces the rows computed so far.
+        """
+
+        close = close.reindex(columns=self.symbols).astype(float)
+        high = close if high is None else high.reindex_like(close).astype(float)
+        low = close if low is None else low.reindex_like(close).astype(float)
+        window = self.high_low_window
+
+        change = close - close.shift(1)
+        data = pd.DataFrame(index=pd.DatetimeIndex(close.index.to_numpy(), name="date"))
+        data["advances"] = (change > 0).sum(axis=1).to_numpy()
+        data["declines"] = (change < 0).sum(axis=1).to_numpy()
+        data["unchanged"] = (change == 0).sum(axis=1).to_numpy()
+
+        net = (data.advances - data.declines).astype(float)
+        data["ad_line"] = net.cumsum()
+        fast, slow = (self._ema(net, span) for span in MCCLELLAN_SPANS)
+        data["mcclellan"] = (fast - slow).to_numpy()
+
+        highest = high.rolling(window, min_periods=window).max()
+        lowest = low.rolling(window, min_periods=window).min()
+        data["new_highs"] = (high >= highest).sum(axis=1).to_numpy()
+        data["new_lows"] = (low <= lowest).sum(axis=1).to_numpy()
+
+        observed = close.notna().cumsum()
+        emas = dict()
+
+        for span in self.ema_spans:
+            emas[span] = self._ema(close, span)
+            valid = close.notna() & (observed >= span)
+            above = ((close > emas[span]) & valid).sum(axis=1)
+            data["pct_above_ema_{0}".format(span)] = _percent(
+                above.to_numpy(), valid.sum(axis=1).to_numpy()
+            )
+
+        self.data = data[self.columns].astype(self.dtypes)
+
+        # State for `update`, as left by the last session.
+        self._prev_close = close.iloc[-1].to_numpy() if len(close) else self._prev_close
+        self._highs = deque(high.to_numpy()[-window:], maxlen=window)
+        self._lows = deque(low.to_numpy()[-window:], maxlen=window)
+        self._observed = observed.iloc[-1].to_numpy() if len(close) else self._observed
+
+        for span in self.ema_spans:
+            if len(close):
+                self._emas[span] = emas[span].iloc[-1].to_numpy()
+
+        for span, ema in zip(MCCLELLAN_SPANS, (fast, slow)):
+            self._net[span] = ema.iloc[-1] if len(ema) else np.nan
+
+        self._ad_line = data.ad_line.iloc[-1] if len(data) else 0
+        return self.data
+
+    def update(self, day: SESSION_DAY_TYPE, bars: pd.DataFrame) -> pd.Series:
+        """
+        Append the session `day` from its bars indexed by symbol, with a
+        `close` & optionally `high` & `low` columns (e.g. a processed
+        bhavcopy), without recomputing the earlier sessions.
+        """
+
+        day = pd.Timestamp(day)
+
+        if len(self.data) and day <= self.data.index[-1]:
+            raise ValueError(STALE_BREADTH_SESSION.format(day, self.data.index[-1]))
+
+        bars = bars.reindex(index=self.symbols)
+        close = bars["close"].to_numpy(dtype=float)
+        high = bars["high"].to_numpy(float) if "high" in bars.columns else close
+        low = bars["low"].to_numpy(float) if "low" in bars.columns else close
+
+        row = dict()
+        change = close - self._prev_close
+        row["advances"] = int((change > 0).sum())
+        row["declines"] = int((change < 0).sum())
+        row["unchanged"] = int((change == 0).sum())
+
+        net = float(row["advances"] - row["declines"])
+        self._ad_line = self._ad_line + net
+        row["ad_line"] = self._ad_line
+
+        for span in MCCLELLAN_SPANS:
+            self._net[span] = _ema_step(self._net[span], net, span)
+
+        row["mcclellan"] = self._net[MCCLELLAN_SPANS[0]] - self._net[MCCLELLAN_SPANS[1]]
+
+        self._highs.append(high)
+        self._lows.append(low)
+        row["new_highs"] = _new_extremes(
+            self._highs, high, self.high_low_window, np.nanmax, np.greater_equal
+        )
+        row["new_lows"] = _new_extremes(
+            self._lows, low, self.high_low_window, np.nanmin, np.less_equal
+        )
+
+        self._observed = self._observed + ~np.isnan(close)
+
+        for span in self.ema_spans:
+            self._emas[span] = _ema_step(self._emas[span], close, span)
+            valid = ~np.isnan(close) & (self._observed >= span)
+            above = (close > self._emas[span]) & valid
+            row["pct_above_ema_{0}".format(span)] = _percent(above.sum(), valid.sum())
+
+        self._prev_close = close
+        row = pd.DataFrame([row], index=pd.DatetimeIndex([day], name="date"))
+        row = row[self.columns].astype(self.dtypes)
+        self.data = pd.concat([self.data, row]) if len(self.data) else row
+
+        return self.data.iloc[-1]
+
+    def between(
+        self,
+        start: Optional[SESSION_DAY_TYPE] = None,
+        end: Optional[SESSION_DAY_TYPE] = None,
+    ) -> pd.DataFrame:
+        """Breadth of the sessions from `start` through `end`, both inclusive."""
+
+        start = None if start is None else pd.Timestamp(start)
+        end = None if end is None else pd.Timestamp(end)
+        return self.data.loc[start:end]
+
+
+def breadth_by_cohort(
+    panel: PricePanel,
+    cohorts: Dict[str, Sequence[str]],
+    start: Optional[SESSION_DAY_TYPE] = None,
+    end: Optional[SESSION_DAY_TYPE] = None,
+    **kwargs,
+) -> Dict[str, MarketBreadth]:
+    """`MarketBreadth` of each cohort (e.g. of `mcap_cohorts`) of the panel."""
+
+    return {
+        cohort: MarketBreadth.from_panel(panel, symbols, start, end, **kwargs)
+        for cohort, symbols in cohorts.items()
+    }
+
+
+def _percent(count: np.ndarray, total: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total > 0, 100 * count / np.maximum(total, 1), np.nan)
+
+
+def _ema_step(ema, value, span: int):
+    """`ewm(span, adjust=False, ignore_na=True)` advanced by one value."""
+
+    alpha = 2 / (span + 1)
+    step = np.where(np.isnan(ema), value, alpha * value + (1 - alpha) * ema)
+    step = np.where(np.isnan(value), ema, step)
+    return step if np.ndim(step) else float(step)
+
+
+def _new_extremes(
+    history: deque, values: np.ndarray, window: int, reduce, compare
+) -> int:
+    """Symbols at the extreme of their last `window` (non NaN) values."""
+
+    stacked = np.vstack(history)
+    observed = (~np.isnan(stacked)).sum(axis=0)
+
+    with warnings.catch_warnings():
+        # All NaN columns (e.g. unlisted symbols) reduce to NaN.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        bound = reduce(stacked, axis=0)
+
+    return int((compare(values, bound) & (observed >= window)).sum())
@@ -0,0 +1,172 @@
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock, RLock
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
+
+from trade.calendar import MarketHolidayType, WorkingDayDate
+from trade.utils.singleton_meta import SingletonMeta
+
+MAX_CONTEXTS = int(os.getenv("MAX_EXCHANGE_CONTEXTS", 8))
+CONTEXT_KEY_TYPE = Tuple[str, str]
+ExchangeConfig = TypeVar("ExchangeConfig")
+
+
+@dataclass(frozen=True, eq=False, repr=False)
+class ExchangeContext:
+    """
+    Everything a ticker object needs from its exchange for one trading
+    day: the configs (one per config class, e.g. stock & index) and
+    through them the calendar, holidays & per config caches.
+    Configs are built lazily, once, and shared by every ticker object.
+    The context itself is immutable, only its config cache fills up.
+    """
+
+    market: str
+    dated: str
+    market_holidays: Optional[Tuple[MarketHolidayType, ...]] = None
+    _configs: Dict[type, ExchangeConfig] = field(default_factory=dict, init=False)
+    _lock: RLock = field(default_factory=RLock, init=False)
+
+    def __post_init__(self):
+        if self.market_holidays is not None:
+            object.__setattr__(self, "market_holidays", tuple(self.market_holidays))
+
+    def __repr__(self) -> str:
+        return "{0}(market={1}, dated={2}, configs={3})".format(
+            type(self).__name__,
+            self.market,
+            self.dated,
+            [i.__name__ for i in self._configs],
+        )
+
+    @property
+    def calendar(self) -> Optional[WorkingDayDate]:
+        for config in self._configs.values():
+            return config.working_day
+
+        return None
+
+    @property
+    def holidays(self) -> Optional[List[MarketHolidayType]]:
+        """Holidays given to the context, else the ones its first config read."""
+
+        if self.market_holidays is not None:
+            return list(self.market_holidays)
+
+        calendar = self.calendar
+        return None if calendar is None else calendar.market_holidays.holidays_dict
+
+    @property
+    def session(self) -> Optional[str]:
+        """Trading session `dated` resolves to, once a config is built."""
+
+        calendar = self.calendar
+        return None if calendar is None else calendar.curr_bday.as_str
+
+    def config(self, config_cls: Type[ExchangeConfig]) -> ExchangeConfig:
+        with self._lock:
+            if config_cls not in self._configs:
+                config = config_cls(self.dated, market_holidays=self.holidays)
+                self._configs[config_cls] = config
+
+            return self._configs[config_cls]
+
+    def adopt(
+        self, config_cls: Type[ExchangeConfig], config: ExchangeConfig
+    ) -> ExchangeConfig:
+        """The config of `config_cls`, `config` unless one is already held."""
+
+        with self._lock:
+            return self._configs.setdefault(config_cls, config)
+
+
+class ExchangeContexts(metaclass=SingletonMeta):
+    """
+    Process wide registry of `ExchangeContext`, one per (market, session).
+    A date is resolved to its trading session by the first config built
+    for it, from then on every date of that session (e.g. a weekend, a
+    holiday or None for today) shares the session's context.
+    At most `max_contexts` are kept alive, least recently used ones are
+    dropped first. Long running processes can `release` a trading day
+    or `clear` everything, e.g. at day roll over.
+    """
+
+    def __init__(self, max_contexts: int = MAX_CONTEXTS):
+        self.max_contexts = max_contexts
+        self._contexts: OrderedDict[CONTEXT_KEY_TYPE, ExchangeContext] = OrderedDict()
+        # Contexts of dates not resolved to a session yet.
+        self._pending: Dict[CONTEXT_KEY_TYPE, ExchangeContext] = dict()
+        self._aliases: Dict[CONTEXT_KEY_TYPE, CONTEXT_KEY_TYPE] = dict()
+        self._holidays: Dict[str, List[MarketHolidayType]] = dict()
+        self._lock = Lock()
+
+    def __contains__(self, key: CONTEXT_KEY_TYPE) -> bool:
+        return self._aliases.get(key, key) in self._contexts
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+    def get(self, market: str, dated: str) -> ExchangeContext:
+        key = (market, dated)
+
+        with self._lock:
+            session_key = self._aliases.get(key, None)
+
+            if session_key in self._contexts:
+                self._contexts.move_to_end(session_key)
+                return self._contexts[session_key]
+
+            if key not in self._pending:
+                self._pending[key] = ExchangeContext(
+                    market, dated, self._holidays.get(market, None)
+                )
+
+            return self._pending[key]
+
+    def config(
+        self, market: str, dated: str, config_cls: Type[ExchangeConfig]
+    ) -> ExchangeConfig:
+        context = self.get(market, dated)
+        config = context.config(config_cls)
+
+        with self._lock:
+            key = (market, dated)
+
+            if self._contexts.get(self._aliases.get(key, None)) is context:
+                return config
+
+            session_key = (market, context.session)
+            self._pending.pop(key, None)
+            self._contexts.setdefault(session_key, context)
+            self._contexts.move_to_end(session_key)
+            self._aliases[key] = self._aliases[session_key] = session_key
+
+            if market not in self._holidays and context.holidays is not None:
+                self._holidays[market] = context.holidays
+
+            while len(self._contexts) > self.max_contexts:
+                self._drop(next(iter(self._contexts)))
+
+            registered = self._contexts.get(session_key, context)
+
+        return registered.adopt(config_cls, config)
+
+    def _drop(self, session_key: CONTEXT_KEY_TYPE) -> Optional[ExchangeContext]:
+        self._aliases = {k: v for k, v in self._aliases.items() if v != session_key}
+        return self._contexts.pop(session_key, None)
+
+    def release(self, market: str, dated: str) -> Optional[ExchangeContext]:
+        key = (market, dated)
+
+        with self._lock:
+            pending = self._pending.pop(key, None)
+            context = self._drop(self._aliases.get(key, key))
+            return pending if context is None else context
+
+    def clear(self) -> None:
+        with self._lock:
+            self._contexts.clear()
+            self._pending.clear()
+            self._aliases.clear()
+            self._holidays.clear()
@@ -5,7 +5,7 @@ from typing import Callable, Dict, List, Optional, Union
 from trade.calendar import MarketCalendar, MarketHolidayType, MarketTimingType
 from trade.exchange.api_config import APIConfig
 from trade.exchange.yf import YFinance
-from trade.utils import DownloadTools, Logger, LoggingType
+from trade.utils import AsyncDownloadTools, Logger, LoggingType
 
 
 @dataclass
@@ -21,7 +21,7 @@ class ExchangeArgs:
     log_config: Optional[LoggingType] = None
 
 
-class Exchange(APIConfig, YFinance, MarketCalendar, DownloadTools):
+class Exchange(APIConfig, YFinance, MarketCalendar, AsyncDownloadTools):
 
     def __init__(
         self,
@@ -36,6 +36,13 @@ class Exchange(APIConfig, YFinance, MarketCalendar, DownloadTools):
         logging_config: Optional[LoggingType] = None,
     ):
         super().__init__(config)
+
+        if hasattr(self, "rate_limits"):
+            self.rate_limiter.configure_from(self.rate_limits)
+
+        if hasattr(self, "cache_policies"):
+            self.response_cache.configure_from(self.cache_policies)
+
         YFinance.__init__(
             self, market, country, date_fmt, ticker_modifications=ticker_mod
         )
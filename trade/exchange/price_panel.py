@@ -0,0 +1,303 @@
+import json
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from trade.calendar.sessions import SESSION_DAY_TYPE, to_datetime64
+from trade.exchange.bhav_archive import normalise_bhavcopy
+from trade.utils import HistoryStore
+from trade.utils.history_store import HISTORY_PARAMS
+
+PANEL_FIELDS = ("open", "high", "low", "close", "volume")
+PANEL_DTYPE = "float64"
+PANEL_SUFFIX, META_SUFFIX = ".panel", ".json"
+SYMBOL_NOT_IN_PANEL = "Symbol not in the price panel: {0}"
+SESSION_NOT_IN_PANEL = "{0} is not a session of the price panel."
+FIELD_NOT_IN_PANEL = "Invalid panel field: {0}. Choose from {1}."
+
+
+class PricePanel:
+    """
+    Dense (symbol x session x field) float array of OHLCV bars aligned to
+    the session grid, backed by a memory mapped file so that several
+    processes can open the same panel read only without copying it.
+    Missing bars are NaN. Slicing by field, symbol or session window
+    returns numpy views of the mapped file.
+
+    A panel is two files: `<path>.panel` (raw C ordered array) and
+    `<path>.json` (symbols, sessions, fields & dtype).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        symbols: Sequence[str],
+        sessions: np.ndarray,
+        fields: Sequence[str] = PANEL_FIELDS,
+        mode: str = "r",
+    ):
+        self.path = Path(path)
+        self.symbols = list(symbols)
+        self.sessions = np.asarray(sessions, dtype="datetime64[D]")
+        self.fields = tuple(fields)
+        self._symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._field_index = {field: i for i, field in enumerate(self.fields)}
+        self.data = np.memmap(
+            self.path.with_suffix(PANEL_SUFFIX),
+            dtype=PANEL_DTYPE,
+            mode=mode,
+            shape=(len(self.symbols), len(self.sessions), len(self.fields)),
+        )
+
+    def __repr__(self) -> str:
+        return "PricePanel(path={0}, shape={1})".format(self.path, self.shape)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._symbol_index
+
+    @property
+    def shape(self) -> tuple:
+        return self.data.shape
+
+    @classmethod
+    def create(
+        cls,
+        path: Union[str, Path],
+        symbols: Sequence[str],
+        sessions: np.ndarray,
+        fields: Sequence[str] = PANEL_FIELDS,
+    ) -> "PricePanel":
+        """New NaN filled panel at `path`, open for writing."""
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sessions = np.asarray(sessions, dtype="datetime64[D]")
+        meta = {
+            "symbols": list(symbols),
+            "sessions": sessions.astype(str).tolist(),
+            "fields": list(fields),
+            "dtype": PANEL_DTYPE,
+        }
+        path.with_suffix(META_SUFFIX).write_text(json.dumps(meta))
+
+        panel = cls(path, symbols, sessions, fields, mode="w+")
+        panel.data[:] = np.nan
+        return panel
+
+    @classmethod
+    def open(cls, path: Union[str, Path], mode: str = "r") -> "PricePanel":
+        """Existing panel at `path`, read only unless `mode` says otherwise."""
+
+        meta = json.loads(Path(path).with_suffix(META_SUFFIX).read_text())
+        sessions = np.asarray(meta["sessions"], dtype="datetime64[D]")
+        return cls(path, meta["symbols"], sessions, meta["fields"], mode=mode)
+
+    @classmethod
+    def from_frames(
+        cls,
+        path: Union[str, Path],
+        frames: Dict[str, pd.DataFrame],
+        sessions: np.ndarray,
+        fields: Sequence[str] = PANEL_FIELDS,
+    ) -> "PricePanel":
+        """
+        Panel of per symbol frames of bars indexed by date, with the
+        `fields` as (case insensitive) columns. Bars off the session grid
+        are dropped.
+        """
+
+        panel = cls.create(path, list(frames.keys()), sessions, fields)
+
+        for symbol, data in frames.items():
+            if data.empty:
+                continue
+
+            data = data.rename(columns=str.lower)
+            days = pd.DatetimeIndex(data.index).values.astype("datetime64[D]")
+            positions, found = panel._positions(days)
+            values = data.reindex(columns=list(panel.fields)).to_numpy(PANEL_DTYPE)
+            panel.data[panel._symbol_index[symbol], positions[found]] = values[found]
+
+        panel.flush()
+        return panel
+
+    @classmethod
+    def from_history_store(
+        cls,
+        path: Union[str, Path],
+        symbols: Iterable[str],
+        sessions: np.ndarray,
+        ticker: Optional[Callable[[str], str]] = None,
+        interval: str = "1d",
+        fields: Sequence[str] = PANEL_FIELDS,
+        params: Optional[Dict[str, object]] = None,
+    ) -> "PricePanel":
+        """
+        Panel of `symbols` from the bars in the `HistoryStore`, `ticker`
+        maps a symbol to its stored (yfinance) ticker & `params` are the
+        download params of the bars (`HISTORY_PARAMS` by default).
+        """
+
+        store, ticker = HistoryStore(), ticker or (lambda symbol: symbol)
+        params = HISTORY_PARAMS if params is None else params
+        key = store.key_of(interval, **params)
+        sessions = np.asarray(sessions, dtype="datetime64[D]")
+        start, end = sessions[0], sessions[-1] + np.timedelta64(1, "D")
+        frames = {
+            symbol: store.read(ticker(symbol), key, start, end) for symbol in symbols
+        }
+        return cls.from_frames(path, frames, sessions, fields)
+
+    @classmethod
+    def from_bhavcopies(
+        cls,
+        path: Union[str, Path],
+        bhavcopies: Dict[SESSION_DAY_TYPE, pd.DataFrame],
+        symbols: Optional[Sequence[str]] = None,
+        fields: Sequence[str] = PANEL_FIELDS,
+    ) -> "PricePanel":
+        """
+        Panel of daily bhavcopies (one frame of every symbol per session, in
+        any layout `normalise_bhavcopy` reads), only of the EQ series.
+        Symbols default to every symbol seen across the bhavcopies.
+        """
+
+        days = to_datetime64(bhavcopies.keys())
+        bhavcopies = {
+            day: _eq_series(normalise_bhavcopy(data, pd.Timestamp(day).date()))
+            for day, data in zip(days, bhavcopies.values())
+        }
+
+        if symbols is None:
+            symbols = sorted(set().union(*(i.symbol for i in bhavcopies.values())))
+
+        panel = cls.create(path, symbols, sorted(bhavcopies.keys()), fields)
+
+        for day, data in bhavcopies.items():
+            data = data.drop_duplicates("symbol").set_index("symbol")
+            data = data.reindex(index=panel.symbols, columns=list(panel.fields))
+            values = data.astype(float).to_numpy(PANEL_DTYPE)
+            panel.data[:, panel.session_index(day)] = values
+
+        panel.flush()
+        return panel
+
+    def flush(self) -> None:
+        if self.data.mode != "r":
+            self.data.flush()
+
+    def _positions(self, days: np.ndarray):
+        positions = np.searchsorted(self.sessions, days)
+        positions = np.clip(positions, 0, max(len(self.sessions) - 1, 0))
+        found = (len(self.sessions) > 0) & (self.sessions[positions] == days)
+        return positions, found
+
+    def symbol_index(self, symbol: str) -> int:
+        if symbol not in self._symbol_index:
+            raise KeyError(SYMBOL_NOT_IN_PANEL.format(symbol))
+
+        return self._symbol_index[symbol]
+
+    def session_index(self, day: SESSION_DAY_TYPE) -> int:
+        day = _day(day)
+        positions, found = self._positions(np.asarray([day]))
+
+        if not found[0]:
+            raise KeyError(SESSION_NOT_IN_PANEL.format(day))
+
+        return int(positions[0])
+
+    def field_index(self, field: str) -> int:
+        if field not in self._field_index:
+            raise KeyError(FIELD_NOT_IN_PANEL.format(field, self.fields))
+
+        return self._field_index[field]
+
+    def window(
+        self,
+        start: Optional[SESSION_DAY_TYPE] = None,
+        end: Optional[SESSION_DAY_TYPE] = None,
+    ) -> slice:
+        """Session positions from `start` through `end`, both inclusive."""
+
+        first = 0 if start is None else None
+        last = len(self.sessions) if end is None else None
+
+        if first is None:
+            first = int(np.searchsorted(self.sessions, _day(start), side="left"))
+
+        if last is None:
+            last = int(np.searchsorted(self.sessions, _day(end), side="right"))
+
+        return slice(first, last)
+
+    def field(
+        self,
+        field: str,
+        start: Optional[SESSION_DAY_TYPE] = None,
+        end: Optional[SESSION_DAY_TYPE] = None,
+    ) -> np.ndarray:
+        """(symbol x session) view of `field`."""
+
+        return self.data[:, self.window(start, end), self.field_index(field)]
+
+    def symbol(
+        self,
+        symbol: str,
+        start: Optional[SESSION_DAY_TYPE] = None,
+        end: Optional[SESSION_DAY_TYPE] = None,
+    ) -> np.ndarray:
+        """(session x field) view of `symbol`."""
+
+        return self.data[self.symbol_index(symbol), self.window(start, end)]
+
+    def series(self, symbol: str, field: str) -> np.ndarray:
+        return self.data[self.symbol_index(symbol), :, self.field_index(field)]
+
+    def field_frame(
+        self,
+        field: str,
+        symbols: Optional[List[str]] = None,
+        start: Optional[SESSION_DAY_TYPE] = None,
+        end: Optional[SESSION_DAY_TYPE] = None,
+    ) -> pd.DataFrame:
+        """
+        (session x symbol) frame of `field`, wrapping the panel view
+        without a copy unless a subset of `symbols` is selected.
+        """
+
+        window = self.window(start, end)
+        values = self.field(field, start, end)
+
+        if symbols is not None:
+            values = values[[self.symbol_index(i) for i in symbols]]
+
+        return pd.DataFrame(
+            values.T,
+            index=pd.DatetimeIndex(self.sessions[window], name="date"),
+            columns=self.symbols if symbols is None else symbols,
+            copy=False,
+        )
+
+    def as_frame(self, symbol: str) -> pd.DataFrame:
+        """Bars of `symbol` as a (copied) frame, sessions without a bar dropped."""
+
+        data = pd.DataFrame(
+            np.array(self.symbol(symbol)),
+            index=pd.DatetimeIndex(self.sessions, name="date"),
+            columns=list(self.fields),
+        )
+        return data.dropna(how="all")
+
+
+def _eq_series(data: pd.DataFrame) -> pd.DataFrame:
+    return data.loc[data.series == "EQ"]
+
+
+def _day(day: SESSION_DAY_TYPE) -> np.datetime64:
+    return np.datetime64(to_datetime64([day])[0], "D")
@@ -1,15 +1,29 @@
 import re
 from calendar import monthrange
-from datetime import date, datetime
+from collections import defaultdict
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
 
-from trade.utils import Logger, MarketDFUtils, op_utils
+from trade.utils import HistoryStore, Logger, MarketDFUtils, Transport, op_utils
+from trade.utils.history_store import HISTORY_OVERLAP
 
 SYMBOL_ERROR = "Error Incurred for symbol: {0}"
+YFIN_CHUNK_SIZE = 50
+YFIN_PERIODS = {
+    "1d": pd.DateOffset(days=1),
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
 YFIN_TICKER_BY_COUNTRY = {
     "INDIA": {"BSE": ".BO", "NSE": ".NS"},
     # TODO: Populate this country to extend to all the countries.
@@ -46,6 +60,20 @@ class YFinance(MarketDFUtils):
         if hasattr(self, "logger"):
             self.logger.error(message)
 
+    def download_period_data(self, symbol: str, **kwargs) -> pd.DataFrame:
+        """`yf.download` routed through the record/replay transport."""
+
+        transport = Transport()
+        params = {k: v for k, v in kwargs.items() if k not in ("threads", "progress")}
+
+        if transport.is_replaying:
+            return transport.replay_frame(symbol, params)
+
+        data = self.yf.download(symbol, **kwargs)
+        transport.record_frame(data, symbol, params)
+
+        return data
+
     @op_utils.concurrent_execution
     def get_period_data(
         self,
@@ -69,17 +97,20 @@ class YFinance(MarketDFUtils):
             progress=progress,
         )
         symbol = self.adjust_yfin_ticker_by_market(symbol, index)
+        bounds = self._store_bounds(interval, period, start, end)
+
+        if bounds is not None:
+            data = self._download_through_store(
+                [symbol], *bounds, **download_params, **kwargs
+            )[symbol]
 
-        if start is None and end is None:
-            download_params.update({"period": period})
         else:
-            download_params.update({"start": start, "end": end})
+            if start is None and end is None:
+                download_params.update({"period": period})
+            else:
+                download_params.update({"start": start, "end": end})
 
-        data = self.yf.download(
-            symbol,
-            **download_params,
-            **kwargs,
-        )
+            data = self.download_period_data(symbol, **download_params, **kwargs)
 
         if 0 in data.shape:
             message = SYMBOL_ERROR.format(symbol)
@@ -90,8 +121,17 @@ class YFinance(MarketDFUtils):
                     return self.get_period_data(
                         self.ticker_modifications[symbol], period, interval
                     )
-                return pd.DataFrame()
 
+            return pd.DataFrame()
+
+        return self._process_period_data(data, ascending)
+
+    def _process_period_data(
+        self, data: pd.DataFrame, ascending: bool = False
+    ) -> pd.DataFrame:
+        """`prev_close`, `pct_change` & date formatting of a downloaded frame."""
+
+        data = data.copy()
         data["prev_close"] = data.Close.shift(1)
         data = data.loc[~data.prev_close.isna(), :]
         data = self.calculate_pct_change(data, "Close", "prev_close")
@@ -112,6 +152,235 @@ class YFinance(MarketDFUtils):
 
         return data.round(2)
 
+    def _download_chunks(
+        self, tickers: List[str], chunk_size: int = YFIN_CHUNK_SIZE, **kwargs
+    ) -> Dict[str, pd.DataFrame]:
+        """Bars of `tickers`, `chunk_size` tickers per `yf.download` call."""
+
+        frames = dict()
+
+        for i in range(0, len(tickers), chunk_size):
+            chunk = tickers[i : i + chunk_size]
+            params = dict(group_by="ticker") if len(chunk) > 1 else dict()
+            data = self.download_period_data(" ".join(chunk), **params, **kwargs)
+
+            for ticker in chunk:
+                if isinstance(data.columns, pd.MultiIndex):
+                    frame = (
+                        data[ticker]
+                        if ticker in data.columns.get_level_values(0)
+                        else pd.DataFrame()
+                    )
+                else:
+                    frame = data
+
+                frames[ticker] = frame.dropna(how="all")
+
+        return frames
+
+    def _store_bounds(
+        self, interval: str, period: str, start: date = None, end: date = None
+    ) -> Optional[Tuple[date, date]]:
+        """
+        Requested days as `(start, end)` when they can be served by the
+        `HistoryStore`, None when the request bypasses it.
+        """
+
+        transport = Transport()
+
+        if not HistoryStore().supports(interval) or (
+            transport.is_recording or transport.is_replaying
+        ):
+            return None
+
+        end = date.today() + timedelta(days=1) if end is None else end
+        end = pd.Timestamp(end).date()
+
+        if start is None:
+            if period not in YFIN_PERIODS:
+                return None
+
+            start = pd.Timestamp(end) - YFIN_PERIODS[period]
+
+        return pd.Timestamp(start).date(), end
+
+    def _download_through_store(
+        self,
+        tickers: List[str],
+        start: date,
+        end: date,
+        chunk_size: int = YFIN_CHUNK_SIZE,
+        **kwargs,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Bars of `tickers` from `start` up to (excluding) `end`, read from
+        the `HistoryStore` under the key of the download params. Only the
+        days missing from it are downloaded (with `HISTORY_OVERLAP` of the
+        stored days), in one batch per first day, and stored back. Tickers
+        whose stored bars were restated by a corporate action since are
+        downloaded again over every stored day.
+        """
+
+        store = HistoryStore()
+        key = store.key_of(**kwargs)
+        missing = defaultdict(list)
+
+        for ticker in tickers:
+            fetch_from = store.missing_from(ticker, key, start, end)
+
+            if fetch_from is not None:
+                covered = store.coverage(ticker, key)
+
+                if covered is not None and fetch_from > covered[0]:
+                    fetch_from = max(covered[0], covered[1] - HISTORY_OVERLAP)
+
+                missing[fetch_from].append(ticker)
+
+        fetched = dict()
+
+        for fetch_from, group in missing.items():
+            frames = self._download_chunks(
+                group, chunk_size, start=fetch_from, end=end, **kwargs
+            )
+            restated = defaultdict(list)
+
+            for ticker, data in frames.items():
+                if store.is_restated(ticker, key, data):
+                    refetch_from = min(store.coverage(ticker, key)[0], start)
+
+                    if fetch_from <= refetch_from:
+                        store.append(ticker, key, data, fetch_from, end, True)
+                    else:
+                        restated[refetch_from].append(ticker)
+
+                # Failed downloads come back empty and are not marked fetched.
+                elif not data.empty:
+                    store.append(ticker, key, data, fetch_from, end)
+
+            for refetch_from, restated_group in restated.items():
+                refetched = self._download_chunks(
+                    restated_group, chunk_size, start=refetch_from, end=end, **kwargs
+                )
+
+                for ticker, data in refetched.items():
+                    if not data.empty:
+                        store.append(ticker, key, data, refetch_from, end, True)
+
+                frames.update(refetched)
+
+            fetched.update(frames)
+
+        result = dict()
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+
+        for ticker in tickers:
+            data = store.read(ticker, key, start, end)
+            recent = fetched.get(ticker, pd.DataFrame())
+
+            if not recent.empty:
+                # Still forming bars of today are only in the download.
+                data = pd.concat([data, recent]) if not data.empty else recent
+                data = data[~data.index.duplicated(keep="last")].sort_index()
+                data = data.loc[(data.index >= start) & (data.index < end)]
+
+            result[ticker] = data
+
+        return result
+
+    def _batch_ticker(
+        self, symbol: str, index: bool, symbol_map: Dict[str, str]
+    ) -> str:
+        ticker = symbol_map.get(symbol.upper(), symbol)
+
+        # Mapped yfinance tickers (e.g. `^NSEI`, `X.NS`) carry their suffix.
+        if ticker.startswith("^") or "." in ticker:
+            return ticker
+
+        return self.adjust_yfin_ticker_by_market(ticker, index)
+
+    def get_batch_period_data(
+        self,
+        symbols: List[str],
+        period: str = "1mo",
+        interval: str = "1d",
+        start: date = None,
+        end: date = None,
+        rounding: bool = True,
+        index: bool = False,
+        ascending: bool = False,
+        auto_adjust: bool = True,
+        progress: bool = False,
+        chunk_size: int = YFIN_CHUNK_SIZE,
+        symbol_map: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Period data of many `symbols`, downloaded `chunk_size` tickers per
+        `yf.download` call and split into one frame per symbol, processed
+        as in `get_period_data`. Symbols are mapped through `symbol_map`
+        (e.g. `yfin_nse_symbols`) before the market suffix. Symbols without
+        data are retried one by one through `ticker_modifications`.
+        """
+
+        symbol_map = dict() if symbol_map is None else symbol_map
+        tickers = {i: self._batch_ticker(i, index, symbol_map) for i in symbols}
+        download_params = dict(
+            interval=interval,
+            rounding=rounding,
+            auto_adjust=auto_adjust,
+            progress=progress,
+        )
+        unique_tickers = list(dict.fromkeys(tickers.values()))
+        bounds = self._store_bounds(interval, period, start, end)
+
+        if bounds is not None:
+            frames = self._download_through_store(
+                unique_tickers,
+                *bounds,
+                chunk_size=chunk_size,
+                **download_params,
+                **kwargs,
+            )
+
+        else:
+            if start is None and end is None:
+                download_params.update({"period": period})
+            else:
+                download_params.update({"start": start, "end": end})
+
+            frames = self._download_chunks(
+                unique_tickers, chunk_size, **download_params, **kwargs
+            )
+
+        result = dict()
+
+        for symbol, ticker in tickers.items():
+            data = frames[ticker]
+
+            if 0 not in data.shape:
+                result[symbol] = self._process_period_data(data, ascending)
+                continue
+
+            self.log_method(SYMBOL_ERROR.format(ticker))
+            modified = (self.ticker_modifications or dict()).get(ticker, None)
+            result[symbol] = (
+                pd.DataFrame()
+                if modified is None
+                else self.get_period_data(
+                    modified,
+                    period=period,
+                    interval=interval,
+                    start=start,
+                    end=end,
+                    rounding=rounding,
+                    index=index,
+                    ascending=ascending,
+                    auto_adjust=auto_adjust,
+                )
+            )
+
+        return result
+
     def get_unique_ticker_set(self, tickers: List[str]) -> Tuple[str]:
 
         return tuple([self.adjust_yfin_ticker_by_market(i) for i in tickers])
@@ -3,7 +3,9 @@ from typing import Dict, List, Union
 
 import pandas as pd
 
+from trade.exchange import ExchangeContexts
 from trade.nse.indices.nse_index import INDICES, NSEIndex
+from trade.nse.nse_configs.nse_config import MARKET
 from trade.nse.nse_configs.nse_indices_config import NSEIndexConfig
 from trade.nse.nse_generics.all_data_generics import AllDataGenerics
 from trade.technicals.indicators import GenericIndicator, MovingAverages, PivotPoints
@@ -43,7 +45,7 @@ class SpotIndices(AllDataGenerics):
 
     def __post_init__(self):
 
-        self._config = NSEIndexConfig(self.dated)
+        self._config = ExchangeContexts().config(MARKET, self.dated, NSEIndexConfig)
         self.dated = self._config.working_day.day.as_str
         self.symbols = {i: NSEIndex(i, self.dated) for i in INDICES}
         self.vix = self._config.get_vix()
@@ -90,8 +92,11 @@ class SpotIndices(AllDataGenerics):
     def get_top_bottom(self, top_n: int = 200, n_value: int = 5):
 
         data = self._get_bhavcopy()
-        data = data.loc[data.index <= top_n, :]
-        data["pct_change"] = data["pct_change"] * 100
+        data = data.loc[data.sr_no <= top_n, ["symbol", "pct_change"]]
+        data = data.assign(
+            symbol=data.symbol.astype(str),
+            pct_change=(data.pct_change.astype(float) * 100).round(2),
+        )
         largest = data.nlargest(n_value, "pct_change")[
             ["symbol", "pct_change"]
         ].to_dict(orient="records")
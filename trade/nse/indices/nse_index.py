@@ -35,9 +35,9 @@ class NSEIndex(NSEDataGeneric):
     @property
     def strike_multiples(self):
         mapped_symbol = INDICES_MAPPING[self.symbol]
-        return self._config.get_strike_mul_by_symbol(mapped_symbol, INDICES_API)[
+        return self._config.get_strike_mul_by_symbol(mapped_symbol, INDICES_API).get(
             mapped_symbol
-        ]
+        )
 
     @property
     def expiries(self):
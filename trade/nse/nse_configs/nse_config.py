@@ -1,6 +1,6 @@
 import os
-from datetime import datetime
-from functools import cache
+from datetime import date, datetime
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 
@@ -12,8 +12,15 @@ from trade.calendar.calendar_data import (
     MarketTimingType,
 )
 from trade.exchange import Exchange
+from trade.exchange.bhav_archive import (
+    BHAV_ARCHIVE_DIR,
+    BHAV_COLUMN_ALIASES,
+    BackfillReport,
+    BhavcopyArchive,
+)
 from trade.nse.nse_configs.nse_fno import NSEFNO
 from trade.utils import LoggingType
+from trade.utils.async_network_tools import CONCURRENCY
 from trade.utils.network_tools import CustomHTTPException
 from trade.utils.utility_enabler import UtilityEnabler
 
@@ -36,6 +43,59 @@ TOP_BOTTOM_TYPE = Dict[str, Dict[str, float]]
 ENABLE_TIME = bool(os.getenv("ENABLE_TIME", False))
 ENABLE_PROFILE = bool(os.getenv("ENABLE_PROFILE", False))
 FII_DII_REPORT = List[Dict[str, str]]
+BHAV_PREV_COLS = ["prev_high", "prev_low", "prev_volume"]
+BHAV_QUOTE_COLS = [
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "prev_close",
+    "pct_change",
+] + BHAV_PREV_COLS
+BHAV_FRAME_PRICE_COLS = ["open", "high", "low", "close", "prev_close", "pct_change"]
+BHAV_FRAME_COLS = [
+    "sr_no",
+    "symbol",
+    "series",
+    "company_name",
+    "market_cap",
+    "open",
+    "high",
+    "low",
+    "close",
+    "prev_close",
+    "volume",
+    "pct_change",
+]
+BHAV_FRAME_DTYPES = {
+    "sr_no": "int64",
+    "symbol": "category",
+    "series": "category",
+    "market_cap": "float64",
+    **dict.fromkeys(BHAV_FRAME_PRICE_COLS, "float32"),
+    "volume": "int64",
+}
+# Parser settings per download, the bhavcopy ones cover legacy & UDiFF headers.
+EQ_BHAV_READ = dict(
+    usecols=lambda column: column.strip().lower() in BHAV_COLUMN_ALIASES,
+    dtype={
+        **dict.fromkeys(("SERIES", "SctySrs"), "category"),
+        **dict.fromkeys(
+            ("OPEN", "HIGH", "LOW", "CLOSE", "LAST", "PREVCLOSE", "TOTTRDVAL"),
+            "float64",
+        ),
+        **dict.fromkeys(
+            ("OpnPric", "HghPric", "LwPric", "ClsPric", "LastPric"), "float64"
+        ),
+        **dict.fromkeys(("PrvsClsgPric", "TtlTrfVal"), "float64"),
+        **dict.fromkeys(
+            ("TOTTRDQTY", "TOTALTRADES", "TtlTradgVol", "TtlNbOfTxsExctd"), "int64"
+        ),
+    },
+)
+MCAP_READ = dict(usecols=[0, 1, 2, 3])
+SECTORAL_READ = dict(dtype=str)
 
 
 class NSEConfig(Exchange, NSEFNO):
@@ -53,6 +113,7 @@ class NSEConfig(Exchange, NSEFNO):
         log_config: Optional[LoggingType] = None,
         enable_time: bool = ENABLE_TIME,
         enable_profile: bool = ENABLE_PROFILE,
+        market_holidays: Optional[List[MarketHolidayType]] = None,
     ):
 
         super().__init__(
@@ -61,7 +122,7 @@ class NSEConfig(Exchange, NSEFNO):
             config,
             market,
             country,
-            self.get_market_holidays,
+            self.get_market_holidays if market_holidays is None else market_holidays,
             market_timings,
             ticker_mod,
             log_config,
@@ -106,10 +167,21 @@ class NSEConfig(Exchange, NSEFNO):
 
         return content
 
-    def get_equity_meta(self, symbol: str) -> MARKET_API_QUOTE_TYPE:
+    def get_equity_meta_url(self, symbol: str) -> str:
+        return (self.main_domain + self.equity_meta).format(symbol.upper())
+
+    def get_equity_quote_url(self, symbol: str, with_trade_info: bool = False) -> str:
         symbol = symbol.upper()
-        url = self.main_domain + self.equity_meta
-        url = url.format(symbol)
+
+        if with_trade_info:
+            url = self.main_domain + self.equity_trade
+        else:
+            url = self.main_domain + self.equity_quote
+
+        return url.format(symbol)
+
+    def get_equity_meta(self, symbol: str) -> MARKET_API_QUOTE_TYPE:
+        url = self.get_equity_meta_url(symbol)
 
         response = self.get_request_api(url, self.advanced_header)
         content = response.json()
@@ -121,14 +193,7 @@ class NSEConfig(Exchange, NSEFNO):
         self, symbol: str, with_trade_info: bool = False
     ) -> MARKET_API_QUOTE_TYPE:
 
-        symbol = symbol.upper()
-
-        if with_trade_info:
-            url = self.main_domain + self.equity_trade
-        else:
-            url = self.main_domain + self.equity_quote
-
-        url = url.format(symbol)
+        url = self.get_equity_quote_url(symbol, with_trade_info)
 
         response = self.get_request_api(url, self.advanced_header)
         content = response.json()
@@ -136,15 +201,62 @@ class NSEConfig(Exchange, NSEFNO):
 
         return content
 
-    @cache
-    def get_eq_bhavcopy(self) -> pd.DataFrame:
-        headers = self.advanced_header
+    def get_equity_metas(
+        self, symbols: List[str], concurrency: int = CONCURRENCY
+    ) -> Dict[str, MARKET_API_QUOTE_TYPE]:
+        """Batched `get_equity_meta` for a list of symbols."""
+
+        urls = {symbol.upper(): self.get_equity_meta_url(symbol) for symbol in symbols}
+        content = self.get_json_batch(urls, self.advanced_header, concurrency)
+
+        return {key: None if value == {} else value for key, value in content.items()}
+
+    def get_equity_quotes(
+        self,
+        symbols: List[str],
+        with_trade_info: bool = False,
+        concurrency: int = CONCURRENCY,
+    ) -> Dict[str, MARKET_API_QUOTE_TYPE]:
+        """Batched `get_equity_quote` for a list of symbols."""
+
+        urls = {
+            symbol.upper(): self.get_equity_quote_url(symbol, with_trade_info)
+            for symbol in symbols
+        }
+        content = self.get_json_batch(urls, self.advanced_header, concurrency)
+
+        return {key: None if value == {} else value for key, value in content.items()}
+
+    def download_eq_bhavcopy(self, dated: str) -> pd.DataFrame:
         url = self.eq_bhavcopy["url"] + self.eq_bhavcopy["url_params"]
-        today = self.working_day.curr_bday.as_str
-        url = url.format(today)
-        result = self.download_data(url, headers)
+        return self.download_data(
+            url.format(dated), self.advanced_header, **EQ_BHAV_READ
+        )
+
+    @cache
+    def get_eq_bhavcopy(self, dated: Optional[str] = None) -> pd.DataFrame:
+        today = self.working_day.curr_bday.as_str if dated is None else dated
+        return self.download_eq_bhavcopy(today)
+
+    @cached_property
+    def eq_bhav_archive(self) -> BhavcopyArchive:
+        return BhavcopyArchive(
+            self.sessions,
+            lambda day: self.download_eq_bhavcopy(day.strftime(self.date_fmt)),
+            BHAV_ARCHIVE_DIR / Path("eq"),
+        )
+
+    def backfill_eq_bhavcopies(
+        self, start: Union[date, str], end: Optional[Union[date, str]] = None
+    ) -> BackfillReport:
+        """
+        Archive the equity bhavcopy of every session from `start` through
+        `end` (the current business day by default), resuming from the
+        days already archived.
+        """
 
-        return result
+        end = self.working_day.curr_bday.as_date if end is None else end
+        return self.eq_bhav_archive.backfill(start, end)
 
     def process_mcap_file(self, data: pd.DataFrame) -> pd.DataFrame:
 
@@ -169,9 +281,9 @@ class NSEConfig(Exchange, NSEFNO):
         url = self.get_mcap_file_url()
 
         try:
-            content = self.download_data(url, self.advanced_header)
+            content = self.download_data(url, self.advanced_header, **MCAP_READ)
         except CustomHTTPException:
-            content = self.download_data(url, self.simple_headers)
+            content = self.download_data(url, self.simple_headers, **MCAP_READ)
 
         content = self.process_mcap_file(content)
         return content
@@ -191,41 +303,53 @@ class NSEConfig(Exchange, NSEFNO):
 
     @cache
     def get_eq_listed_stocks(self) -> List[str]:
-        data = self.get_eq_bhavcopy()
-        data = self.apply_nse_data_preprocessing(data)
-        return data.symbol.unique().tolist()
+        # EQ stocks are listed in the market cap ranking, whether or not
+        # they have a quote in the bhavcopy.
+        return self.get_mcap().symbol.unique().tolist()
 
     @cache
-    def get_eq_stocks_by_mcap(self) -> pd.DataFrame:
-
-        data = self.get_eq_bhavcopy()
-        data = self.apply_nse_data_preprocessing(data)
+    def get_eq_bhav_frame(self, dated: Optional[str] = None) -> pd.DataFrame:
+        """
+        Processed EQ bhavcopy of the session, built once & shared by every
+        consumer: stocks ranked by market cap (`sr_no`) with a complete
+        quote, indexed by symbol, dtypes pinned to `BHAV_FRAME_DTYPES`
+        (`pct_change` is a fraction). Treat it as read only.
+        """
+
+        data = self.apply_nse_data_preprocessing(self.get_eq_bhavcopy(dated))
         data = data.rename(columns={"tottrdqty": "volume", "prevclose": "prev_close"})
+        data = data.dropna(subset=["open", "high", "low", "close", "volume"])
+        data = data.drop_duplicates("symbol")
         data["pct_change"] = (data.close - data.prev_close) / data.prev_close
-        data = data.loc[
-            :,
-            [
-                "sr_no",
-                "symbol",
-                "company_name",
-                "market_cap",
-                "open",
-                "high",
-                "low",
-                "close",
-                "prev_close",
-                "volume",
-                "pct_change",
-            ],
-        ]
-        filter_out = (
-            data.open.isna()
-            | data.close.isna()
-            | data.high.isna()
-            | data.low.isna()
-            | data.volume.isna()
-        )
-        data = data.loc[~filter_out, :]
+        data = data.loc[:, BHAV_FRAME_COLS].astype(BHAV_FRAME_DTYPES)
+        data.index = pd.Index(data.symbol.astype(str).to_numpy())
+
+        return data
+
+    def get_eq_stocks_by_mcap(self) -> pd.DataFrame:
+        return self.get_eq_bhav_frame()
+
+    @cache
+    def get_eq_bhav_quotes(self) -> pd.DataFrame:
+        """
+        Current & previous session quotes of every EQ stock ranked by market
+        cap, with `pct_change` in percent as in the yfinance history.
+        The previous session's high, low & volume come from its bhavcopy.
+        """
+
+        data = self.get_eq_stocks_by_mcap()
+        prev_bday = self.sessions.prev_session(self.working_day.curr_bday)
+        prev = self.get_eq_bhav_frame(prev_bday.strftime(self.date_fmt))
+        prev = prev.loc[:, ["high", "low", "volume"]].astype(float).round(2)
+        prev.columns = BHAV_PREV_COLS
+
+        data = data.join(prev, how="left").reset_index(drop=True)
+        data[BHAV_PREV_COLS] = data[BHAV_PREV_COLS].fillna(0.0)
+        data["symbol"] = data.symbol.astype(str)
+        data[BHAV_FRAME_PRICE_COLS] = data[BHAV_FRAME_PRICE_COLS].astype(float)
+        data[BHAV_FRAME_PRICE_COLS[:-1]] = data[BHAV_FRAME_PRICE_COLS[:-1]].round(2)
+        data["pct_change"] = (data["pct_change"] * 100).round(2)
+
         return data
 
     @cache
@@ -245,7 +369,8 @@ class NSEConfig(Exchange, NSEFNO):
         sectors = self.sectoral_indices
 
         sectoral_data = {
-            sector: self.download_data(url) for sector, url in sectors.items()
+            sector: self.download_data(url, **SECTORAL_READ)
+            for sector, url in sectors.items()
         }
 
         sectoral_list = list()
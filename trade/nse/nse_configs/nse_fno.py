@@ -1,15 +1,20 @@
 from abc import ABC
-from datetime import datetime, timedelta
 from functools import cache, cached_property
-from io import BytesIO
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 import pandas as pd
 
-from trade.utils.op_utils import find_least_difference_strike, timed_lru_cache
+from trade.calendar.expiries import EXPIRIES_TYPE, STOCK_EXPIRY, ExpiryCalendar
+from trade.nse.nse_configs.nse_lot_sizes import LotSizeTable
+from trade.nse.nse_configs.nse_strike_multiples import StrikeMultipleStore
+from trade.utils import Transport
+from trade.utils.async_network_tools import CONCURRENCY
+from trade.utils.network_tools import CustomHTTPException
+from trade.utils.op_utils import min_strike_gaps, timed_lru_cache
 
 MARKET_API_QUOTE_TYPE = Dict[str, Union[list, str, bool]]
 INVALID_SYMBOL = "Invalid Symbol Chosen."
+FO_MKTLOTS_READ = dict(dtype=str, skipinitialspace=True)
 
 
 class NSEFNO(ABC):
@@ -21,137 +26,218 @@ class NSEFNO(ABC):
         data = self.get_request_api(url, self.advanced_header).json()
         return data
 
-    def get_option_chain_data(self, symbol: str) -> MARKET_API_QUOTE_TYPE:
-        """Based on symbol extract Option Chain data from NSE API."""
-
+    def get_option_chain_url(self, symbol: str) -> str:
         symbol = symbol.upper()
 
         if symbol in self.derivative_index_choice:
-            url = self.get_option_chain_index(symbol)
+            return self.get_option_chain_index(symbol)
 
         elif symbol in self.get_fno_stocks():
-            url = self.get_option_chain_equities(symbol)
+            return self.get_option_chain_equities(symbol)
 
-        else:
-            raise KeyError(INVALID_SYMBOL)
+        raise KeyError(INVALID_SYMBOL)
+
+    def get_option_chain_data(self, symbol: str) -> MARKET_API_QUOTE_TYPE:
+        """Based on symbol extract Option Chain data from NSE API."""
 
+        url = self.get_option_chain_url(symbol)
         data = self.get_request_api(url, self.advanced_header).json()
 
         return data
 
+    def get_option_chains(
+        self,
+        symbols: Optional[List[str]] = None,
+        concurrency: int = CONCURRENCY,
+        return_exceptions: bool = True,
+    ) -> Dict[str, MARKET_API_QUOTE_TYPE]:
+        """
+        Option Chain data for `symbols` fetched concurrently.
+        Defaults to every F&O stock along with the derivative indices.
+        """
+
+        if symbols is None:
+            symbols = self.derivative_index_choice + self.get_fno_stocks()
+
+        urls = {symbol.upper(): self.get_option_chain_url(symbol) for symbol in symbols}
+
+        return self.get_json_batch(
+            urls, self.advanced_header, concurrency, return_exceptions
+        )
+
     def get_option_chain_equities(self, symbol: str) -> str:
         return self.main_domain + self.derivative_option_chain.format(symbol)
 
     def get_option_chain_index(self, symbol: str) -> str:
         return self.main_domain + self.derivative_option_index.format(symbol)
 
-    def process_downloaded_mklots(
-        self, data: pd.DataFrame
-    ) -> Dict[str, Dict[str, str]]:
-        data.columns = data.columns.str.strip()
-        data.columns = data.columns.str.capitalize()
-        data = data.loc[
-            ~data.Underlying.str.contains("Derivatives"),
-            ~data.columns.isin(["Underlying"]),
-        ]
-        data = data.apply(lambda x: x.str.strip())
-
-        resulting_dict = {
-            data_value["Symbol"]: {
-                k: v for k, v in data_value.to_dict().items() if v != str()
-            }
-            for iter, data_value in data.iterrows()
-        }
-
-        return resulting_dict
+    def process_downloaded_mklots(self, data: pd.DataFrame) -> LotSizeTable:
+        return LotSizeTable.from_frame(data)
 
     @cached_property
-    def get_fo_mktlots(self) -> Dict[str, Dict[str, str]]:
+    def get_fo_mktlots(self) -> LotSizeTable:
 
-        data = self.get_request_api(self.fo_mklots["url"], self.simple_headers).content
-
-        # Since data is a csv object, we read the bytes into a dataframe.
-        data = pd.read_csv(BytesIO(data))
+        data = self.download_data(
+            self.fo_mklots["url"], self.simple_headers, **FO_MKTLOTS_READ
+        )
         data = self.process_downloaded_mklots(data)
 
         return data
 
-    def get_ticker_folots(self, ticker: str, month: str) -> int:
+    def get_ticker_folots(self, ticker: str, month: str) -> Optional[int]:
+        """Lot of `ticker` in `month` (`May-24`) or the latest month before it."""
+
+        return self.get_fo_mktlots.lot_size(ticker, month)
 
-        if ticker in self.get_fo_mktlots.keys():
-            data = self.get_fo_mktlots[ticker]
-            if month in data.keys():
-                return int(data[month])
+    def get_tickers_folots(
+        self, tickers: List[str], month: str
+    ) -> Dict[str, Optional[int]]:
+        """Batched `get_ticker_folots`, None for tickers without a lot."""
 
-            if month.capitalize() in data.keys():
-                return int(data[month.capitalize()])
+        return self.get_fo_mktlots.lot_sizes(tickers, month)
 
-        month = datetime.strptime(month, "%b-%y")
-        month = (month - timedelta(days=1)).strftime("%b-%y")
-        return self.get_ticker_folots(ticker, month)
+    def get_derivative_quote_url(self, symbol: str) -> str:
+        return self.main_domain + self.quote_derivative.format(symbol)
 
     @timed_lru_cache(seconds=300)
     def get_derivative_quote(self, symbol: str) -> dict:
 
-        url = self.main_domain + self.quote_derivative.format(symbol)
+        url = self.get_derivative_quote_url(symbol)
 
         response = self.get_request_api(url, self.advanced_header).json()
 
         return response
 
-    def strike_multiples(self) -> Dict[str, int]:
-        strike_muls = dict()
-        for stocks in self.get_fno_stocks():
-            strike_price = sorted(
-                list(set(self.get_derivative_quote(stocks)["strikePrices"]))
-            )
-            strike_muls.update({stocks: find_least_difference_strike(strike_price)})
+    def get_derivative_quotes(
+        self,
+        symbols: List[str],
+        concurrency: int = CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> Dict[str, dict]:
+        """Batched `get_derivative_quote` for a list of symbols."""
 
-        return strike_muls
+        urls = {symbol: self.get_derivative_quote_url(symbol) for symbol in symbols}
+
+        return self.get_json_batch(
+            urls, self.advanced_header, concurrency, return_exceptions
+        )
+
+    @cached_property
+    def strike_multiple_store(self) -> StrikeMultipleStore:
+        return StrikeMultipleStore()
+
+    def compute_strike_multiples(
+        self, symbols: List[str], concurrency: int = CONCURRENCY
+    ) -> Dict[str, float]:
+        """
+        Strike multiples of `symbols` from their derivative quotes, fetched
+        concurrently. Symbols whose quote failed are left out.
+        """
+
+        urls = {symbol: self.get_derivative_quote_url(symbol) for symbol in symbols}
+        quotes = self.get_json_batch(
+            urls, self.advanced_header, concurrency, return_exceptions=True
+        )
+        strikes = {
+            symbol: quote["strikePrices"]
+            for symbol, quote in quotes.items()
+            if isinstance(quote, dict) and "strikePrices" in quote
+        }
 
-    def get_expiries(self) -> Dict[str, Dict[str, str]]:
+        return min_strike_gaps(strikes)
 
-        expiries = dict()
+    def get_strike_multiples(
+        self, symbols: List[str], concurrency: int = CONCURRENCY
+    ) -> Dict[str, float]:
+        """
+        Strike multiples of `symbols` read from the session's persisted
+        table, the ones missing from it are computed in one batch & stored.
+        Only computed multiples are stored, symbols that fail are left out
+        & retried by the next call. Record/replay runs bypass the table.
+        """
 
-        for symbol in self.get_fno_stocks():
-            symbol_expiry = self.get_derivative_quote(symbol)["expiryDatesByInstrument"]
-            symbol_expiry["fut_expiry"] = symbol_expiry.pop("Stock Futures")
-            symbol_expiry["opt_expiry"] = symbol_expiry.pop("Stock Options")
+        transport = Transport()
 
-            expiries.update({symbol: symbol_expiry})
+        if transport.is_recording or transport.is_replaying:
+            return self.compute_strike_multiples(symbols, concurrency)
 
-        return expiries
+        day = self.working_day.curr_bday.as_date
+        missing = self.strike_multiple_store.missing(day, symbols)
+
+        if len(missing) > 0:
+            multiples = self.compute_strike_multiples(missing, concurrency)
+            self.strike_multiple_store.merge(day, multiples)
+
+        table = self.strike_multiple_store.load(day)
+        return {
+            symbol: table[symbol]
+            for symbol in symbols
+            if table.get(symbol, None) is not None
+        }
+
+    def strike_multiples(self) -> Dict[str, float]:
+        return self.get_strike_multiples(self.get_fno_stocks())
+
+    @cached_property
+    def expiry_calendar(self) -> ExpiryCalendar:
+        return ExpiryCalendar(self.sessions, self.expiry_rules, self.date_fmt)
+
+    def _reconcile_expiries(self, key: str, symbol: str, instrument: str) -> None:
+        """Align the rule based expiries of `key` with the NSE once a day."""
+
+        if not self.expiry_calendar.needs_reconcile(key):
+            return
+
+        try:
+            expiries = self.get_derivative_quote(symbol)["expiryDatesByInstrument"]
+
+        except (CustomHTTPException, KeyError, ValueError):
+            # Fall back on the rules until the next day.
+            self.expiry_calendar.mark_reconciled(key)
+            return
+
+        self.expiry_calendar.reconcile(
+            key, expiries[f"{instrument} Futures"], expiries[f"{instrument} Options"]
+        )
+
+    def get_symbol_expiries(
+        self, key: str, symbol: str, instrument: str
+    ) -> EXPIRIES_TYPE:
+        self._reconcile_expiries(key, symbol, instrument)
+        return self.expiry_calendar.upcoming(key, self.working_day.day.as_date)
+
+    def get_expiries(self) -> Dict[str, EXPIRIES_TYPE]:
+        symbols = self.get_fno_stocks()
+        expiries = self.get_symbol_expiries(STOCK_EXPIRY, symbols[0], "Stock")
+
+        return {
+            symbol: {kind: list(dates) for kind, dates in expiries.items()}
+            for symbol in symbols
+        }
 
     def get_strike_mul_by_symbol(
         self, symbol: str, symbol_list: List[str] = None
-    ) -> Dict[str, int]:
+    ) -> Dict[str, float]:
 
         if symbol_list is None:
             symbol_list = self.get_fno_stocks()
 
         if symbol in symbol_list:
-            strike_price = sorted(
-                list(set(self.get_derivative_quote(symbol)["strikePrices"]))
-            )
-            return {symbol: find_least_difference_strike(strike_price)}
+            return self.get_strike_multiples([symbol])
 
         raise KeyError("Invalid Symbol not found.")
 
     def get_expiry_by_symbol(
         self, symbol: str, symbol_list: List[str] = None
-    ) -> Dict[str, Dict[str, str]]:
+    ) -> Dict[str, EXPIRIES_TYPE]:
 
         if symbol_list is None:
             symbol_list = self.get_fno_stocks()
-            key = "Stock"
+            key, instrument = STOCK_EXPIRY, "Stock"
         else:
-            key = "Index"
+            key, instrument = symbol, "Index"
 
         if symbol in symbol_list:
-            expiries = self.get_derivative_quote(symbol)["expiryDatesByInstrument"]
-            expiries["fut_expiry"] = expiries.pop(f"{key} Futures")
-            expiries["opt_expiry"] = expiries.pop(f"{key} Options")
-
-            return {symbol: expiries}
+            return {symbol: self.get_symbol_expiries(key, symbol, instrument)}
 
         raise KeyError("Invalid symbol not found.")
@@ -3,8 +3,8 @@ from typing import Dict, List, Literal, Union
 
 import pandas as pd
 
+from trade.calendar.expiries import EXPIRIES_TYPE
 from trade.nse.nse_configs.nse_config import NSEConfig
-from trade.utils.op_utils import find_least_difference_strike
 
 INDICES = [
     "NIFTY 50",
@@ -204,26 +204,11 @@ class NSEIndexConfig(NSEConfig):
 
         return data
 
-    def strike_multiples(self) -> Dict[str, int]:
-        strike_muls = dict()
+    def strike_multiples(self) -> Dict[str, float]:
+        return self.get_strike_multiples(INDICES_API)
 
-        for index in INDICES_API:
-            strike_price = sorted(
-                list(set(self.get_derivative_quote(index)["strikePrices"]))
-            )
-            strike_price.remove(0)
-
-            strike_muls.update({index: find_least_difference_strike(strike_price)})
-
-        return strike_muls
-
-    def get_expiries(self) -> Dict[str, Dict[str, str]]:
-        expiries = dict()
-        for symbol in INDICES_API:
-            symbol_expiry = self.get_derivative_quote(symbol)["expiryDatesByInstrument"]
-            symbol_expiry["fut_expiry"] = symbol_expiry.pop("Index Futures")
-            symbol_expiry["opt_expiry"] = symbol_expiry.pop("Index Options")
-
-            expiries.update({symbol: symbol_expiry})
-
-        return expiries
+    def get_expiries(self) -> Dict[str, EXPIRIES_TYPE]:
+        return {
+            symbol: self.get_symbol_expiries(symbol, symbol, "Index")
+            for symbol in INDICES_API
+        }
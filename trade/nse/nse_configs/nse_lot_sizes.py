@@ -0,0 +1,106 @@
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+LOT_MONTH_FMT = "%b-%y"
+MONTH_TYPE = Union[str, date, datetime, np.datetime64]
+SYMBOL_NOT_IN_LOTS = "Symbol has no F&O lot size: {0}"
+
+
+def to_month(month: MONTH_TYPE) -> np.datetime64:
+    """`Jun-24` (any case), a date or a datetime64 as a month."""
+
+    if isinstance(month, str):
+        month = datetime.strptime(month.strip(), LOT_MONTH_FMT)
+
+    return np.datetime64(pd.Timestamp(month).to_period("M").start_time, "M")
+
+
+class LotSizeTable:
+    """
+    F&O market lots as a (symbol x month) int array, months ascending.
+    Each cell holds the lot of the latest month at or before it with a
+    published lot (0 when none), so resolving a month is a binary search
+    over the few month columns & an array lookup, for one symbol or many.
+    """
+
+    def __init__(self, symbols: Iterable[str], months: np.ndarray, lots: np.ndarray):
+        self.symbols = list(symbols)
+        self.months = np.asarray(months, dtype="datetime64[M]")
+        self.lots = np.asarray(lots, dtype=np.int64)
+        self._positions = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._positions
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> "LotSizeTable":
+        """
+        Table of the `fo_mktlots.csv` layout: UNDERLYING, SYMBOL & one
+        column per month (`JUN-24`), blank where a lot isn't published.
+        """
+
+        data = data.rename(columns=lambda column: str(column).strip().upper())
+        data = data.loc[~data.UNDERLYING.str.contains("Derivatives", na=False)]
+        symbols = data.SYMBOL.str.strip()
+        columns = [i for i in data.columns if i not in ("UNDERLYING", "SYMBOL")]
+        columns = [i for i in columns if _parse_month(i) is not None]
+        months = np.asarray([to_month(i) for i in columns], dtype="datetime64[M]")
+        order = np.argsort(months)
+
+        lots = data[columns].apply(pd.to_numeric, errors="coerce")
+        lots = lots.iloc[:, order].ffill(axis=1).fillna(0)
+
+        keep = ~symbols.duplicated().to_numpy()
+        return cls(symbols[keep], months[order], lots.to_numpy(dtype=np.int64)[keep])
+
+    def month_position(self, month: MONTH_TYPE) -> int:
+        """Column of the latest month at or before `month`, -1 when none."""
+
+        return int(np.searchsorted(self.months, to_month(month), side="right")) - 1
+
+    def lot_size(self, symbol: str, month: MONTH_TYPE) -> Optional[int]:
+        if symbol not in self._positions:
+            raise KeyError(SYMBOL_NOT_IN_LOTS.format(symbol))
+
+        position = self.month_position(month)
+        lot = self.lots[self._positions[symbol], position] if position >= 0 else 0
+
+        return int(lot) if lot > 0 else None
+
+    def lot_sizes(
+        self, symbols: Iterable[str], month: MONTH_TYPE
+    ) -> Dict[str, Optional[int]]:
+        """Lots of `symbols` in `month`, None for symbols without one."""
+
+        symbols = list(symbols)
+        position = self.month_position(month)
+        rows = np.asarray([self._positions.get(i, -1) for i in symbols], dtype=int)
+        lots = np.zeros(len(symbols), dtype=np.int64)
+
+        if position >= 0:
+            found = rows >= 0
+            lots[found] = self.lots[rows[found], position]
+
+        return {
+            symbol: int(lot) if lot > 0 else None for symbol, lot in zip(symbols, lots)
+        }
+
+    def as_dataframe(self) -> pd.DataFrame:
+        columns: List[str] = [
+            pd.Timestamp(i).strftime(LOT_MONTH_FMT) for i in self.months
+        ]
+        return pd.DataFrame(self.lots, index=self.symbols, columns=columns)
+
+
+def _parse_month(column: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(column, LOT_MONTH_FMT)
+
+    except ValueError:
+        return None
@@ -0,0 +1,55 @@
+import json
+import os
+from datetime import date
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Dict, Iterable
+
+from trade.utils.response_cache import CACHE_DIR
+
+STRIKE_MULTIPLES_DIR = Path(
+    os.getenv("STRIKE_MULTIPLES_DIR", CACHE_DIR / Path("strike_multiples"))
+)
+STRIKE_MULTIPLES_TYPE = Dict[str, float]
+
+
+class StrikeMultipleStore:
+    """
+    Daily symbol -> strike multiple tables, one JSON file per session
+    (`<store_dir>/<yyyy-mm-dd>.json`). Symbols are merged into the day's
+    table as they are computed, so a day is fetched from the NSE once.
+    Only computed multiples are stored, symbols without one (or `null`)
+    are missing, so a failed symbol is retried.
+    """
+
+    _lock = Lock()
+
+    def __init__(self, store_dir: Path = STRIKE_MULTIPLES_DIR):
+        self.store_dir = Path(store_dir)
+
+    def path_of(self, day: date) -> Path:
+        return self.store_dir / Path(day.isoformat() + ".json")
+
+    def load(self, day: date) -> STRIKE_MULTIPLES_TYPE:
+        try:
+            return json.loads(self.path_of(day).read_text())
+
+        except (FileNotFoundError, ValueError):
+            return dict()
+
+    def merge(self, day: date, multiples: STRIKE_MULTIPLES_TYPE) -> None:
+        path = self.path_of(day)
+
+        with self._lock:
+            table = {**self.load(day), **multiples}
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with NamedTemporaryFile("w", dir=path.parent, delete=False) as file:
+                json.dump(table, file, sort_keys=True)
+
+            os.replace(file.name, path)
+
+    def missing(self, day: date, symbols: Iterable[str]) -> list:
+        table = self.load(day)
+        return [i for i in symbols if table.get(i, None) is None]
@@ -1,15 +1,22 @@
+import os
 from abc import ABC
-from collections import Counter
-from typing import Any, Dict, List, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 
-from trade.nse.nse_configs.nse_config import NSEConfig
+from trade.calendar.sessions import SESSION_DAY_TYPE
+from trade.exchange import ExchangeContexts, MarketBreadth, PricePanel
+from trade.exchange.breadth import advance_decline, breadth_by_cohort, mcap_cohorts
+from trade.exchange.yf import YFIN_CHUNK_SIZE
+from trade.nse.nse_configs.nse_config import MARKET, NSEConfig
 from trade.nse.nse_configs.nse_indices_config import NSEIndexConfig
 from trade.nse.nse_generics.data_generics import OHLC_TYPE
+from trade.utils import ExecutorService
 
-ADV_DEC_TYPE = Dict[Union[bool, None], int]
+ADV_DEC_TYPE = Dict[str, int]
 DATA_HISTORY_DATAFRAMES = Union[Tuple[pd.DataFrame], List[pd.DataFrame]]
+HISTORY_WINDOW = int(os.getenv("HISTORY_WINDOW", 4))
 
 
 class AllDataGenerics(ABC):
@@ -25,9 +32,11 @@ class AllDataGenerics(ABC):
     def set_config(self) -> None:
         match self._all_ticker_type:
             case "stock":
-                self._config = NSEConfig(self.dated)
+                self._config = ExchangeContexts().config(MARKET, self.dated, NSEConfig)
             case "index":
-                self._config = NSEIndexConfig(self.dated)
+                self._config = ExchangeContexts().config(
+                    MARKET, self.dated, NSEIndexConfig
+                )
 
             case _:
                 raise KeyError("Undefined All NSE Data class.")
@@ -44,10 +53,74 @@ class AllDataGenerics(ABC):
         return resulting_dict
 
     def get_history_data(self, period: str, interval: str) -> DATA_HISTORY_DATAFRAMES:
-        return {
-            str(symbol): symbol.get_history_data(period, interval)
-            for symbol in self.symbols
-        }
+        return self._config.get_batch_period_data(
+            [str(symbol) for symbol in self.symbols],
+            period=period,
+            interval=interval,
+            ascending=True,
+            symbol_map=self._config.yfin_nse_symbols,
+        )
+
+    def iter_history(
+        self,
+        period: str,
+        interval: str,
+        window: int = HISTORY_WINDOW,
+        chunk_size: int = YFIN_CHUNK_SIZE,
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        `(symbol, history)` of every symbol as its download completes, in
+        batches of `chunk_size` symbols with at most `window` batches in
+        flight, so only those frames are held at a time however large the
+        universe. The frames aren't kept on the stocks, each is released
+        once the consumer asks for the next one.
+        """
+
+        symbols = [str(symbol) for symbol in self.symbols]
+        chunks = iter(
+            [
+                symbols[i : i + chunk_size]
+                for i in range(0, len(symbols), max(chunk_size, 1))
+            ]
+        )
+        executor, pending = ExecutorService(), set()
+
+        def fetch(chunk: List[str]) -> Dict[str, pd.DataFrame]:
+            return self._config.get_batch_period_data(
+                chunk,
+                period=period,
+                interval=interval,
+                ascending=True,
+                chunk_size=chunk_size,
+                symbol_map=self._config.yfin_nse_symbols,
+            )
+
+        def refill() -> None:
+            for chunk in chunks:
+                pending.add(executor.submit(fetch, chunk))
+
+                if len(pending) >= max(window, 1):
+                    break
+
+        try:
+            refill()
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                pending.difference_update(done)
+                refill()
+
+                for future in done:
+                    frames = future.result()
+
+                    while frames:
+                        symbol, data = frames.popitem()
+                        yield symbol, data
+                        del data
+
+        finally:
+            for future in pending:
+                future.cancel()
 
     # @property
     def as_dataframe(self):
@@ -61,29 +134,31 @@ class AllDataGenerics(ABC):
         return self._get_advance_decline()
 
     def _get_advance_decline(self) -> ADV_DEC_TYPE:
-        counter_ = list()
         data = self._get_bhavcopy()
+        return advance_decline(data.close.to_numpy(), data.prev_close.to_numpy())
 
-        for _, i in data.iterrows():
-            if (i.close - i.prev_close) < 0:
-                counter_.append(False)
-
-            elif (i.close - i.prev_close) == 0:
-                counter_.append(None)
+    def market_breadth(
+        self,
+        panel: PricePanel,
+        start: Optional[SESSION_DAY_TYPE] = None,
+        end: Optional[SESSION_DAY_TYPE] = None,
+        by_mcap: bool = False,
+    ) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+        """
+        Per session breadth of the EQ stocks in `panel`, or of each market
+        cap cohort (`MCAP_COHORTS`) with `by_mcap`.
+        """
 
-            else:
-                counter_.append(True)
+        ranks = self._get_bhavcopy().sr_no
 
-        adv_dec = dict(Counter(counter_))
-        adv_dec["Advances"] = adv_dec.pop(True)
-        adv_dec["Declines"] = adv_dec.pop(False)
-        adv_dec["Unchanged"] = adv_dec.pop(None)
+        if not by_mcap:
+            return MarketBreadth.from_panel(panel, ranks.index, start, end).data
 
-        return adv_dec
+        cohorts = breadth_by_cohort(panel, mcap_cohorts(ranks), start, end)
+        return {cohort: breadth.data for cohort, breadth in cohorts.items()}
 
-    def _get_bhavcopy(self):
-        data = self._config.get_eq_stocks_by_mcap()
-        return data
+    def _get_bhavcopy(self) -> pd.DataFrame:
+        return self._config.get_eq_bhav_frame()
 
     def get_fii_dii_reports(self) -> List[Dict[str, str]]:
         return self._config.get_fii_dii_report()
@@ -93,6 +168,15 @@ class AllDataGenerics(ABC):
             self.symbols.values() if isinstance(self.symbols, dict) else self.symbols
         )
 
+        # One batch fills the session's strike multiples read by each chain.
+        if self._all_ticker_type == "stock":
+            fno = set(self._config.get_fno_stocks())
+            self._config.get_strike_multiples(
+                [str(i) for i in symbols if str(i) in fno]
+            )
+        else:
+            self._config.strike_multiples()
+
         data = {str(symbol): symbol.get_option_chain_analysis() for symbol in symbols}
 
         if as_dataframe:
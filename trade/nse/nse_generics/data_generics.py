@@ -5,7 +5,8 @@ import pandas as pd
 from yfinance import Ticker
 
 from trade.calendar import DateObj
-from trade.nse.nse_configs.nse_config import DATE_FMT, NSEConfig
+from trade.exchange import ExchangeContexts
+from trade.nse.nse_configs.nse_config import DATE_FMT, MARKET, NSEConfig
 from trade.nse.nse_configs.nse_indices_config import NSEIndexConfig
 from trade.technicals.indicators import GenericIndicator
 from trade.technicals.option_chain import OptionChain
@@ -45,10 +46,12 @@ class NSEDataGeneric(ABC):
     def set_config(self) -> None:
         match self._ticker_type:
             case "stock":
-                self._config = NSEConfig(self.dated)
+                self._config = ExchangeContexts().config(MARKET, self.dated, NSEConfig)
 
             case "index":
-                self._config = NSEIndexConfig(self.dated)
+                self._config = ExchangeContexts().config(
+                    MARKET, self.dated, NSEIndexConfig
+                )
 
             case _:
                 raise KeyError("Undefined NSE Class.")
@@ -148,16 +151,22 @@ class NSEDataGeneric(ABC):
             concurrent=True,
         )
 
-    def get_curr_bhav(self):
+    def _get_history(self) -> pd.DataFrame:
         curr_date = DateObj(self.dated, date_fmt=DATE_FMT)
         start_date = curr_date - 365
         end_date = curr_date + 1
-        result = self._get_result_data(start_date, end_date)
+        return self._get_result_data(start_date, end_date)
+
+    def get_curr_bhav(self):
+        result = self._get_history()
         self._history = result
         self._set_values(result)
 
     @property
     def history(self) -> pd.DataFrame:
+        if getattr(self, "_history", None) is None:
+            self._history = self._get_history()
+
         return self._history
 
     @property
@@ -1,2 +1,3 @@
 from trade.nse.stocks.nse_all_stocks import AllNSEStocks
 from trade.nse.stocks.nse_stock import NSEStock
+from trade.nse.stocks.stock_universe import StockUniverse
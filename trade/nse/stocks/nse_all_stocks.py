@@ -1,10 +1,29 @@
-import asyncio
-from dataclasses import dataclass
-from typing import Any, List, Optional, Union
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
 
 from trade.nse.nse_configs.nse_config import NSE_TOP
 from trade.nse.nse_generics.all_data_generics import AllDataGenerics
 from trade.nse.stocks.nse_stock import NSEStock
+from trade.nse.stocks.stock_universe import StockUniverse
+from trade.utils import ExecutorService
+
+PROGRESS_TYPE = Callable[[int, int, str], None]
+OHLC_COLS = [
+    "open",
+    "low",
+    "high",
+    "close",
+    "price_diff",
+    "prev_close",
+    "pct_change",
+    "volume",
+    "prev_volume",
+    "volume_diff",
+]
 
 
 @dataclass
@@ -13,21 +32,39 @@ class AllNSEStocks(AllDataGenerics):
     dated: str
     symbols: Optional[List[str]] = None
     nse_top: Optional[int] = None
+    from_bhavcopy: bool = True
+    progress: Optional[PROGRESS_TYPE] = field(default=None, repr=False)
+    failures: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
     _all_ticker_type: str = "stock"
 
-    def __gt__(self, other: Any) -> "AllNSEStocks":
+    def _with_symbols(
+        self, symbols: Union[StockUniverse, List[NSEStock]]
+    ) -> "AllNSEStocks":
+        if isinstance(symbols, StockUniverse):
+            # A view over the same universe needs no config or quotes.
+            stocks = copy(self)
+            stocks.symbols, stocks.failures = symbols, dict(self.failures)
+            return stocks
+
         return AllNSEStocks(
             dated=self.dated,
-            symbols=[i for i in self.symbols if i.pct_change >= other],
+            symbols=symbols,
             nse_top=self.nse_top,
+            from_bhavcopy=self.from_bhavcopy,
+            progress=self.progress,
         )
 
+    def __gt__(self, other: Any) -> "AllNSEStocks":
+        if isinstance(self.symbols, StockUniverse):
+            return self._with_symbols(self.symbols > other)
+
+        return self._with_symbols([i for i in self.symbols if i.pct_change >= other])
+
     def __lt__(self, other: Any) -> "AllNSEStocks":
-        return AllNSEStocks(
-            dated=self.dated,
-            symbols=[i for i in self.symbols if i.pct_change <= other],
-            nse_top=self.nse_top,
-        )
+        if isinstance(self.symbols, StockUniverse):
+            return self._with_symbols(self.symbols < other)
+
+        return self._with_symbols([i for i in self.symbols if i.pct_change <= other])
 
     def __lte__(self, other: Any) -> "AllNSEStocks":
         return self.__lt__(other)
@@ -46,30 +83,126 @@ class AllNSEStocks(AllDataGenerics):
         self.dated = self._config.working_day.curr_bday.as_str
         if self.symbols is None:
             self.symbols = self._config.get_nse_stocks(self.nse_top)
-            self.symbols = asyncio.run(self.get_symbols_concurrently(self.symbols))
 
-    async def get_symbols_concurrently(self, symbols: list):
+        if isinstance(self.symbols, StockUniverse):
+            return
+
+        if self.from_bhavcopy:
+            self.symbols = self.get_universe(self.symbols)
 
-        async def get_nse_stocks(dated: str, symbol: str):
-            return NSEStock(dated=dated, symbol=symbol)
+        elif any(isinstance(i, str) for i in self.symbols):
+            self.symbols = self.get_symbols_concurrently(self.symbols)
 
-        return await asyncio.gather(
-            *[get_nse_stocks(self.dated, symbol) for symbol in symbols]
+    def _row_view(self, universe: StockUniverse, position: int) -> NSEStock:
+        return NSEStock.from_universe(universe, position, self.dated, self._config)
+
+    def get_universe(self, symbols: List[Union[str, NSEStock]]) -> StockUniverse:
+        """
+        Columnar universe of `symbols` built from one frame of bhavcopy
+        quotes, symbols missing from the bhavcopy fall back on their
+        yfinance history. Row views of a single universe are kept as a
+        view of it.
+        """
+
+        universe = getattr(symbols[0], "_universe", None) if symbols else None
+
+        if universe is not None and all(
+            getattr(i, "_universe", None) is universe for i in symbols
+        ):
+            return universe.view(np.asarray([i._position for i in symbols]))
+
+        symbols = [str(i).upper() for i in symbols]
+        quotes = self._config.get_eq_bhav_quotes().drop_duplicates("symbol")
+        missing = set(symbols).difference(quotes.symbol)
+
+        if len(missing) > 0:
+            history = self.get_symbols_concurrently(sorted(missing))
+            history = [{"symbol": i.symbol, **i.ohlc} for i in history]
+            quotes = pd.concat([quotes, pd.DataFrame(history)], ignore_index=True)
+
+        universe = StockUniverse.from_frame(
+            quotes, self._config.get_fno_stocks(), row_factory=self._row_view
         )
+        return universe.take(symbols)
+
+    def as_dataframe(self) -> pd.DataFrame:
+        if not isinstance(self.symbols, StockUniverse):
+            return super().as_dataframe()
+
+        data = self.symbols.as_dataframe()
+        data.insert(1, "dated", self.dated)
+        data["price_diff"] = data.close - data.prev_close
+        data["volume_diff"] = (data.volume / data.prev_volume).round(2)
+        data.loc[data.prev_volume == 0, "volume_diff"] = 0.0
+
+        return data[["symbol", "dated", *OHLC_COLS]]
+
+    def __contains__(self, item: str) -> bool:
+        if isinstance(self.symbols, StockUniverse):
+            return item.upper() in self.symbols
+
+        return super().__contains__(item)
+
+    def _fan_out(self, func: Callable, symbols: List[str], name: str) -> Dict:
+        """
+        `func(symbol)` for every symbol on the shared executor. Failures are
+        kept in `failures` (symbol: error) instead of aborting the batch,
+        `progress(done, total, symbol)` is called as each one completes.
+        """
+
+        results = dict()
+        tasks = ExecutorService().as_completed(func, symbols, name=name)
+
+        for done, result in enumerate(tasks, start=1):
+            if result.ok:
+                results[result.key] = result.value
+                self.failures.pop(result.key, None)
+            else:
+                self.failures[result.key] = repr(result.error)
+
+            if self.progress is not None:
+                self.progress(done, len(symbols), result.key)
+
+        return results
+
+    def get_symbols_concurrently(
+        self, symbols: List[Union[str, NSEStock]]
+    ) -> List[NSEStock]:
+        """Stocks of `symbols` built in parallel, failed ones are left out."""
+
+        names = [i for i in symbols if isinstance(i, str)]
+        stocks = self._fan_out(
+            lambda symbol: NSEStock(symbol=symbol, dated=self.dated),
+            names,
+            "nse-stocks",
+        )
+
+        return [
+            i if isinstance(i, NSEStock) else stocks[i]
+            for i in symbols
+            if isinstance(i, NSEStock) or i in stocks
+        ]
+
+    def get_historical_data(self) -> Dict[str, pd.DataFrame]:
+        """History of every stock, fetched in parallel, keyed by symbol."""
 
-    def get_historical_data(self):
-        return asyncio.run(self.get_history_concurrently())
+        stocks = {str(i): i for i in self.symbols}
+        return self._fan_out(
+            lambda symbol: stocks[symbol].history, list(stocks), "nse-history"
+        )
+
+    def lot_sizes(self) -> Dict[str, Optional[int]]:
+        """Current month lot of every stock, None for those not in F&O."""
 
-    async def get_history_concurrently(self):
-        return await asyncio.gather(*[symbol.history for symbol in self.symbols])
+        return self._config.get_tickers_folots(
+            [str(i) for i in self.symbols], self._config.working_day.as_month_year
+        )
 
     def __getitem__(self, index: int) -> Union["AllNSEStocks", "NSEStock"]:
         if isinstance(index, slice):
             start = index.start if index.start is not None else 0
             stop = index.stop if index.stop is not None else self.nse_top
             step = index.step if index.step is not None else 1
-            return AllNSEStocks(
-                dated=self.dated, symbols=self.symbols[start:stop], nse_top=self.nse_top
-            )
+            return self._with_symbols(self.symbols[start:stop:step])
 
         return self.symbols[index]
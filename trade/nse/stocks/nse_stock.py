@@ -1,11 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from warnings import simplefilter
 
 import pandas as pd
 
 from trade.nse.nse_generics.data_generics import NSEDataGeneric
+from trade.nse.stocks.stock_universe import StockUniverse
 
 MARKET_API_QUOTE_TYPE = Dict[str, Union[list, str, bool]]
 simplefilter(action="ignore", category=pd.errors.SettingWithCopyWarning)
@@ -17,13 +18,46 @@ class NSEStock(NSEDataGeneric):
     symbol: str
     dated: str
     tf: Optional[str] = "1d"
+    quote: Optional[Dict[str, float]] = field(default=None, repr=False)
     _ticker_type: str = "stock"
 
     def __post_init__(self):
         self.set_config()
         self.symbol = self.symbol.upper()
         self._yfsymbol = self.yfin_symbol()
-        self.get_curr_bhav()
+        self._history = None
+
+        # With a (bhavcopy) quote, history is only downloaded on access.
+        if self.quote is None:
+            self.get_curr_bhav()
+        else:
+            self._set_attributes(self.quote)
+
+    @classmethod
+    def from_universe(
+        cls, universe: StockUniverse, position: int, dated: str, config: Any
+    ) -> "NSEStock":
+        """
+        Row view of the stock at `position` of `universe`: quote fields are
+        read from the universe columns, no config lookup or download.
+        """
+
+        stock = cls.__new__(cls)
+        stock.symbol, stock.dated, stock.tf = universe.symbol_at(position), dated, "1d"
+        stock.quote, stock._ticker_type, stock._config = None, "stock", config
+        stock._universe, stock._position, stock._history = universe, position, None
+        stock._yfsymbol = stock.yfin_symbol()
+        return stock
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes missing on the instance, which for a
+        # row view are the quote fields held by its universe.
+        universe = self.__dict__.get("_universe", None)
+
+        if universe is None or not universe.has_column(name):
+            raise AttributeError(name)
+
+        return universe.value_at(name, self._position)
 
     @property
     def lot_size(self) -> Optional[int]:
@@ -36,7 +70,8 @@ class NSEStock(NSEDataGeneric):
     @property
     def strike_multiples(self) -> int:
         if self.is_fno:
-            return self._config.get_strike_mul_by_symbol(self.symbol)
+            multiples = self._config.get_strike_mul_by_symbol(self.symbol)
+            return multiples.get(self.symbol, None)
         return None
 
     @cached_property
@@ -47,6 +82,9 @@ class NSEStock(NSEDataGeneric):
 
     @property
     def is_fno(self) -> bool:
+        if self.__dict__.get("_universe", None) is not None:
+            return self._universe.value_at("is_fno", self._position)
+
         return self.symbol in self._config.get_fno_stocks()
 
     @cached_property
@@ -0,0 +1,163 @@
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+FLOAT_COLUMNS = (
+    "open",
+    "high",
+    "low",
+    "close",
+    "prev_close",
+    "prev_high",
+    "prev_low",
+    "pct_change",
+)
+INT_COLUMNS = ("volume", "prev_volume", "mcap_rank")
+BOOL_COLUMNS = ("is_fno",)
+UNIVERSE_COLUMNS = FLOAT_COLUMNS + INT_COLUMNS + BOOL_COLUMNS
+ROW_FACTORY_TYPE = Callable[["StockUniverse", int], Any]
+UNIVERSE_KEY_TYPE = Union[int, str, slice, np.ndarray, List[int]]
+SYMBOL_NOT_FOUND = "Symbol not found in the universe: {0}"
+
+
+class StockUniverse:
+    """
+    Struct of arrays of a stock universe: one numpy column per quote field
+    (see `UNIVERSE_COLUMNS`) and the symbols, all aligned by position.
+    Filters, comparisons & slices return views that share the base columns
+    and only hold the positions they select. Rows are materialised through
+    `row_factory` (e.g. an `NSEStock` row view) only when indexed or
+    iterated.
+    """
+
+    __slots__ = ("_symbols", "_columns", "_positions", "_rows", "row_factory")
+
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        columns: Dict[str, np.ndarray],
+        rows: Optional[np.ndarray] = None,
+        row_factory: Optional[ROW_FACTORY_TYPE] = None,
+    ):
+        self._symbols = np.asarray(symbols, dtype=object)
+        self._columns = columns
+        self._positions = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self._rows = np.arange(len(self._symbols)) if rows is None else rows
+        self.row_factory = row_factory
+
+    @classmethod
+    def from_frame(
+        cls,
+        data: pd.DataFrame,
+        fno_symbols: Iterable[str] = tuple(),
+        row_factory: Optional[ROW_FACTORY_TYPE] = None,
+    ) -> "StockUniverse":
+        """
+        Universe of a frame holding a `symbol` column and (a subset of)
+        the `UNIVERSE_COLUMNS`, missing ones are zero filled. `sr_no` of
+        the market cap ranked frames is taken as the `mcap_rank`.
+        """
+
+        data = data.rename(columns={"sr_no": "mcap_rank"})
+        symbols = data.symbol.to_numpy(dtype=object)
+        columns = dict()
+
+        for dtype, names in ((float, FLOAT_COLUMNS), (np.int64, INT_COLUMNS)):
+            for name in names:
+                column = data[name] if name in data.columns else 0
+                column = pd.to_numeric(pd.Series(column, index=data.index))
+                columns[name] = column.fillna(0).to_numpy(dtype=dtype)
+
+        columns["is_fno"] = np.isin(symbols, list(fno_symbols))
+
+        return cls(symbols, columns, row_factory=row_factory)
+
+    def view(self, rows: np.ndarray) -> "StockUniverse":
+        universe = StockUniverse.__new__(StockUniverse)
+        universe._symbols, universe._columns = self._symbols, self._columns
+        universe._positions, universe.row_factory = self._positions, self.row_factory
+        universe._rows = rows
+        return universe
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return "StockUniverse(stocks={0}, of={1})".format(len(self), len(self._symbols))
+
+    def __contains__(self, symbol: str) -> bool:
+        position = self._positions.get(symbol, None)
+        return position is not None and bool(np.any(self._rows == position))
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self.row(position) for position in self._rows.tolist())
+
+    def __getitem__(self, key: UNIVERSE_KEY_TYPE) -> Union["StockUniverse", Any]:
+        if isinstance(key, str):
+            return self.row(self.position_of(key))
+
+        if isinstance(key, (int, np.integer)):
+            return self.row(int(self._rows[key]))
+
+        if isinstance(key, np.ndarray) and key.dtype == bool:
+            return self.filter(key)
+
+        return self.view(self._rows[key])
+
+    def __gt__(self, pct_change: float) -> "StockUniverse":
+        return self.filter(self.column("pct_change") >= pct_change)
+
+    def __lt__(self, pct_change: float) -> "StockUniverse":
+        return self.filter(self.column("pct_change") <= pct_change)
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._rows
+
+    @property
+    def symbols(self) -> List[str]:
+        return self._symbols[self._rows].tolist()
+
+    def position_of(self, symbol: str) -> int:
+        if symbol not in self:
+            raise KeyError(SYMBOL_NOT_FOUND.format(symbol))
+
+        return self._positions[symbol]
+
+    def symbol_at(self, position: int) -> str:
+        return self._symbols[position]
+
+    def value_at(self, name: str, position: int) -> Any:
+        return self._columns[name][position].item()
+
+    def has_column(self, name: str) -> bool:
+        return name in self._columns
+
+    def row(self, position: int) -> Any:
+        if self.row_factory is None:
+            return {
+                "symbol": self._symbols[position],
+                **{k: v[position].item() for k, v in self._columns.items()},
+            }
+
+        return self.row_factory(self, position)
+
+    def column(self, name: str) -> np.ndarray:
+        return self._columns[name][self._rows]
+
+    def filter(self, mask: np.ndarray) -> "StockUniverse":
+        """View of the rows where the boolean `mask` (aligned to self) holds."""
+
+        return self.view(self._rows[mask])
+
+    def take(self, symbols: Iterable[str]) -> "StockUniverse":
+        """View of `symbols` in the given order, unknown ones are skipped."""
+
+        positions = [self._positions[i] for i in symbols if i in self._positions]
+        return self.view(np.asarray(positions, dtype=np.int64))
+
+    def as_dataframe(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {"symbol": self.symbols, **{k: self.column(k) for k in self._columns}}
+        )
@@ -1,12 +1,14 @@
 import datetime
 from abc import ABC, abstractclassmethod, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Literal, Tuple, TypeVar, Union
+from typing import Dict, Iterator, List, Literal, Tuple, TypeVar, Union
 
 import pandas as pd
 
 from trade.calendar import WorkingDayDate
+from trade.exchange import PricePanel
 from trade.nse.nse_configs import DATE_FMT
+from trade.nse.nse_generics.all_data_generics import HISTORY_WINDOW
 from trade.nse.stocks import AllNSEStocks
 
 STRATEGY_TYPE = Literal[
@@ -54,16 +56,30 @@ class StockScanMaster(ABC):
 
         return self.stocks.get_history_data(period, interval)
 
+    def historical_panel(self, panel: PricePanel, field: str = "close") -> pd.DataFrame:
+        """
+        `field` of the scanned stocks held by a shared `PricePanel`, as a
+        (session x symbol) frame, in place of per symbol downloads.
+        """
+
+        symbols = [str(i) for i in self.stocks.symbols if str(i) in panel]
+        return panel.field_frame(field, symbols)
+
+    def apply_indicator_set(
+        self, data: pd.DataFrame, indicators: INDICATORS
+    ) -> pd.DataFrame:
+        data = data.copy()
+        for indicator in indicators:
+            data = indicator.apply_indicator(data)
+
+        return data
+
     def apply_indicators(
         self, data: HISTORICAL_DATASET, indicators: INDICATORS
     ) -> HISTORICAL_DATASET:
         result_set = dict()
         for symbol, ohlc_data in data.items():
-            data = ohlc_data.copy()
-            for indicator in indicators:
-                data = indicator.apply_indicator(data)
-
-            result_set.update({symbol: data})
+            result_set.update({symbol: self.apply_indicator_set(ohlc_data, indicators)})
 
         return result_set
 
@@ -75,6 +91,21 @@ class StockScanMaster(ABC):
 
         return data
 
+    def iter_historical_data_with_indicators(
+        self,
+        period: str,
+        interval: str,
+        indicators: INDICATORS,
+        window: int = HISTORY_WINDOW,
+    ) -> Iterator[Tuple[str, pd.DataFrame]]:
+        """
+        Streaming `get_historical_data_with_indicators`, one symbol at a time
+        as its history arrives, for scans over universes too large to hold.
+        """
+
+        for symbol, data in self.stocks.iter_history(period, interval, window=window):
+            yield symbol, self.apply_indicator_set(data, indicators)
+
     @abstractmethod
     def strategy_filters(self, *args, **kwargs):
         raise NotImplemented()
@@ -5,6 +5,7 @@ import pandas_ta as ta
 from numpy import select
 from pandas import DataFrame
 
+from trade.exchange.price_panel import PricePanel
 from trade.technicals.indicators.generic_indicator import GenericIndicator
 
 MOVING_AVERAGE_INTS_TYPE = Union[Tuple[int], List[int]]
@@ -89,6 +90,34 @@ class MovingAverages(GenericIndicator):
     ) -> DataFrame:
         return cls(data, ma, on_col, ma_range).add_moving_averages()[::-1]
 
+    @classmethod
+    def apply_panel(
+        cls,
+        panel: PricePanel,
+        ma: MOVING_AVERAGES = "EMA",
+        on_col: str = "close",
+        ma_range: Optional[MOVING_AVERAGE_INTS_TYPE] = TYPICAL_MOVING_AVERAGES,
+        symbols: Optional[List[str]] = None,
+    ) -> Dict[str, DataFrame]:
+        """
+        Moving averages of every (or the given) panel symbol at once, one
+        (session x symbol) frame per average, e.g. `{"EMA10": ...}`.
+        """
+
+        data = panel.field_frame(on_col, symbols)
+
+        match ma:
+            case ma if ma in ("SMA", "DMA"):
+                return {f"{ma}{i}": data.rolling(window=i).mean() for i in ma_range}
+
+            case ma if ma == "EMA":
+                return {
+                    f"{ma}{i}": data.ewm(span=i, adjust=True).mean() for i in ma_range
+                }
+
+            case _:
+                raise KeyError(INVALID_MOVING_AVERAGES)
+
     @staticmethod
     def get_df_top_values(
         data: DataFrame,
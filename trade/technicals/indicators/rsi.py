@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Union
+from typing import Dict, List, Union
 
 import pandas as pd
 from pandas import DataFrame
 
+from trade.exchange.price_panel import PricePanel
 from trade.technicals.indicators.generic_indicator import GenericIndicator
 
 
@@ -34,3 +35,14 @@ class RSI(GenericIndicator):
         period: int = 14,
     ) -> DataFrame:
         return cls(data, period).calculate_rsi()
+
+    @classmethod
+    def apply_panel(
+        cls, panel: PricePanel, period: int = 14, symbols: List[str] = None
+    ) -> DataFrame:
+        """RSI of every (or the given) panel symbol at once, (session x symbol)."""
+
+        delta = panel.field_frame("close", symbols).diff()
+        roll_up = delta.clip(lower=0).rolling(window=period).mean()
+        roll_down = delta.clip(upper=0).rolling(window=period).mean().abs()
+        return 100.0 - (100.0 / (1.0 + roll_up / roll_down))
@@ -1,10 +1,9 @@
 from abc import ABC, abstractmethod
 from math import ceil
-from typing import Dict, Literal, Optional, Tuple, Union
+from typing import Dict, List, Literal, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
-from numpy import inf
-from pandas import DataFrame, json_normalize
 
 from trade.utils.utility_enabler import UtilityEnabler
 
@@ -40,9 +39,56 @@ QUOTE_OPTION_CHAIN_COLS = [
     "askQty",
     "askPrice",
 ]
+# Quantities NSE sends as integers, kept as such unless a side is missing.
+QUOTE_INT_COLS = frozenset(
+    (
+        "openInterest",
+        "changeinOpenInterest",
+        "totalTradedVolume",
+        "totalBuyQuantity",
+        "totalSellQuantity",
+        "bidQty",
+        "askQty",
+    )
+)
 OPTION_CHAIN_OUTPUT = Dict[
     str, Union[Dict[str, Union[str, int, float]], str, int, float]
 ]
+OPTION_SIDES = ("CE", "PE")
+MAX_PCR_OI = 10.0
+
+
+def parse_option_chain(
+    data: List[dict], expiry: str, fields: Sequence[str] = QUOTE_OPTION_CHAIN_COLS
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Strikes of `expiry` in the NSE `records.data` order & the calls and
+    puts `fields` as (strike x field) float arrays on that strike axis,
+    NaN where a side or a field is missing. Only the records of `expiry`
+    are read, with no flattening of the nested quotes.
+    """
+
+    rows = [i for i in data if i.get("expiryDate") == expiry]
+    strikes = np.array([i["strikePrice"] for i in rows])
+    shape = (len(rows), len(fields))
+    sides = ([i.get(side) or dict() for i in rows] for side in OPTION_SIDES)
+    calls, puts = (
+        np.array(
+            [[quote.get(i, np.nan) for i in fields] for quote in quotes], dtype=float
+        ).reshape(shape)
+        for quotes in sides
+    )
+
+    return strikes, calls, puts
+
+
+def _quote_column(values: np.ndarray, field: str) -> np.ndarray:
+    """A parsed quote field, integer quantities back to int64 when complete."""
+
+    if field in QUOTE_INT_COLS and not np.isnan(values).any():
+        return values.astype(np.int64)
+
+    return values.round(2)
 
 
 class GenericOptionChain(ABC):
@@ -91,12 +137,11 @@ class GenericOptionChain(ABC):
 
     def _extract_data(self, oc_data, expiry) -> None:
         self._curr_expiry(oc_data, expiry)
-        data = oc_data["records"].get("data")
-        data = DataFrame(json_normalize(data))
-        self.data = data.loc[(data.expiryDate == self._curr_expiry), :]
-        self.data.set_index("strikePrice", inplace=True)
+        self.strikes, self.calls, self.puts = parse_option_chain(
+            oc_data["records"].get("data") or [], self._curr_expiry
+        )
 
-        if self.data.empty:
+        if not len(self.strikes):
             raise ValueError(f"No Data for found for Expiry: {self._curr_expiry}.")
 
     def _available_strikes(self, oc_data) -> None:
@@ -115,41 +160,32 @@ class GenericOptionChain(ABC):
 
         return "Invalid"
 
-    def _maintain_calls_puts(self, df, prefix: Literal["CE", "PE"]):
-        df = df.loc[:, df.columns.str.match(f"^({prefix}|expiryDate)")]
-        df.columns = df.columns.str.replace(rf"{prefix}.", "")
-        df = df[QUOTE_OPTION_CHAIN_COLS].round(2)
-        df.columns = ["{0}_{1}".format(prefix, cols) for cols in df.columns]
-        df.reset_index(inplace=True)
-        return df
-
-    def get_processed_option_chain(self) -> Union[dict, None]:
+    def get_processed_option_chain(self) -> Union[pd.DataFrame, None]:
         """
         Method to process Option Chain for a select symbol and
         selected expiry into algo_trade module consumable format.
         The Data Structure has hard coded values as in the data received
         from NSE officially.
         """
-        df = self.data
-        # Common Columns
-        columns = QUOTE_OPTION_CHAIN_COLS
-
-        options = ["Calls", "Puts"]
+        columns = {"strikePrice": self.strikes}
+
+        for prefix, quotes in zip(OPTION_SIDES, (self.calls, self.puts)):
+            columns.update(
+                {
+                    "{0}_{1}".format(prefix, field): _quote_column(quotes[:, i], field)
+                    for i, field in enumerate(QUOTE_OPTION_CHAIN_COLS)
+                }
+            )
 
-        ce_data = self._maintain_calls_puts(df, "CE")
-        pe_data = self._maintain_calls_puts(df, "PE")
+        # Put Call Ration calculation, capped at MAX_PCR_OI.
+        ce_oi, pe_oi = columns["CE_openInterest"], columns["PE_openInterest"]
 
-        # Merge Call & Put data.
-        merged_call_put = pd.merge(ce_data, pe_data, on="strikePrice", how="left")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pcr_oi = pe_oi / ce_oi
 
-        # Put Call Ration calculation.
-        merged_call_put["pcr_oi"] = (
-            merged_call_put.PE_openInterest / merged_call_put.CE_openInterest
-        )
-        merged_call_put["pcr_oi"] = merged_call_put.pcr_oi.replace(inf, 10.0)
-        merged_call_put.loc[merged_call_put.pcr_oi >= 10, "pcr_oi"] = 10.0
+        columns["pcr_oi"] = np.where(pcr_oi >= MAX_PCR_OI, MAX_PCR_OI, pcr_oi.round(2))
 
-        return merged_call_put.round(2)
+        return pd.DataFrame(columns)
 
     @property
     def overall_pcr(self) -> float:
@@ -1,6 +1,12 @@
 from trade.utils import op_utils as operations
+from trade.utils.async_network_tools import AsyncDownloadTools
 from trade.utils.df_market_utils import MarketDFUtils
+from trade.utils.executor_service import BatchStats, ExecutorService, TaskResult
+from trade.utils.history_store import HistoryStore
 from trade.utils.log_configurator import LogConfig as Logger
 from trade.utils.log_configurator import LoggingType
 from trade.utils.network_tools import DownloadTools
+from trade.utils.response_cache import ResponseCache
+from trade.utils.session_pool import SessionPool
 from trade.utils.singleton_meta import SingletonMeta
+from trade.utils.transport import Transport
@@ -0,0 +1,173 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Hashable, Union
+
+import httpx
+from requests import Response
+
+from trade.utils.network_tools import MAX_RETRIES, RETRY_STATUS_CODES, DownloadTools
+from trade.utils.session_pool import REFRESH_STATUS_CODES
+
+CONCURRENCY = int(os.getenv("NSE_CONCURRENCY", 8))
+ASYNC_TIMEOUT = float(os.getenv("NSE_ASYNC_TIMEOUT", 10))
+BATCH_URLS_TYPE = Dict[Hashable, str]
+BATCH_RESULT_TYPE = Dict[Hashable, Union[httpx.Response, Response, Exception]]
+BATCH_JSON_TYPE = Dict[Hashable, Union[dict, Exception]]
+
+
+class AsyncDownloadTools(DownloadTools):
+    """
+    Asyncio counterpart of `DownloadTools.get_request_api` used to fan
+    a batch of API calls out over one client with bounded concurrency.
+    Cookies are seeded from, and refreshed through, the pooled session
+    of the host so sync and async calls share the same cookie jar, and
+    requests are paced by the same process wide rate limiter.
+    """
+
+    def _async_client(self, concurrency: int, timeout: float) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=concurrency, max_keepalive_connections=concurrency
+        )
+        return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+    async def _async_cookies(self, url: str, headers: dict) -> dict:
+        return await asyncio.to_thread(self.get_cookies, url, headers)
+
+    async def aget_request_api(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        headers: dict,
+        semaphore: asyncio.Semaphore,
+    ) -> Union[httpx.Response, Response]:
+        """
+        `get_request_api` over `client`, at most as many in flight as the
+        `semaphore` shared by the batch allows (a semaphore is bound to
+        one event loop, so it is created per batch rather than per host).
+        Reads & writes the same `ResponseCache` as the sync path.
+        """
+
+        if self.transport.is_replaying:
+            result = self.transport.replay_response(url)
+            return self.match_http(result, result.status_code, url)
+
+        cached = self.response_cache.get(url, headers)
+
+        if cached is not None:
+            self.transport.record_response(url, cached)
+            return self.match_http(cached, cached.status_code, url)
+
+        host_session = self.session_pool.get_session(url)
+
+        async with semaphore:
+            for attempt in range(1, MAX_RETRIES + 1):
+                cookies = await self._async_cookies(url, headers)
+                await self.rate_limiter.aacquire(url)
+
+                try:
+                    result = await client.get(url, headers=headers, cookies=cookies)
+
+                except httpx.TransportError:
+                    self.rate_limiter.report(url)
+
+                    if attempt == MAX_RETRIES:
+                        raise
+
+                    continue
+
+                self.rate_limiter.report(url, result.status_code)
+
+                if result.status_code in REFRESH_STATUS_CODES:
+                    host_session.expire_cookies()
+
+                if result.status_code not in RETRY_STATUS_CODES:
+                    break
+
+        self.transport.record_response(url, result)
+        result = self.match_http(result, result.status_code, url)
+        self.response_cache.set(url, headers, result)
+
+        return result
+
+    async def aget_request_api_batch(
+        self,
+        urls: BATCH_URLS_TYPE,
+        headers: dict,
+        concurrency: int = CONCURRENCY,
+        timeout: float = ASYNC_TIMEOUT,
+        return_exceptions: bool = False,
+    ) -> BATCH_RESULT_TYPE:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with self._async_client(concurrency, timeout) as client:
+            responses = await asyncio.gather(
+                *[
+                    self.aget_request_api(client, url, headers, semaphore)
+                    for url in urls.values()
+                ],
+                return_exceptions=return_exceptions,
+            )
+
+        return dict(zip(urls.keys(), responses))
+
+    def get_request_api_batch(
+        self,
+        urls: BATCH_URLS_TYPE,
+        headers: dict,
+        concurrency: int = CONCURRENCY,
+        timeout: float = ASYNC_TIMEOUT,
+        return_exceptions: bool = False,
+    ) -> BATCH_RESULT_TYPE:
+        """
+        Fetch every url of `urls` concurrently, at most `concurrency` in
+        flight, and return the responses under the same keys.
+        With `return_exceptions` failures are returned in place of the
+        response instead of aborting the whole batch. Called from a thread
+        running an event loop (e.g. Jupyter), the batch runs on a worker
+        thread; async callers should await `aget_request_api_batch`.
+        """
+
+        batch = self.aget_request_api_batch(
+            urls, headers, concurrency, timeout, return_exceptions
+        )
+
+        try:
+            asyncio.get_running_loop()
+
+        except RuntimeError:
+            return asyncio.run(batch)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, batch).result()
+
+    async def aget_json_batch(
+        self,
+        urls: BATCH_URLS_TYPE,
+        headers: dict,
+        concurrency: int = CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> BATCH_JSON_TYPE:
+        responses = await self.aget_request_api_batch(
+            urls, headers, concurrency, return_exceptions=return_exceptions
+        )
+        return self._as_json(responses)
+
+    def get_json_batch(
+        self,
+        urls: BATCH_URLS_TYPE,
+        headers: dict,
+        concurrency: int = CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> BATCH_JSON_TYPE:
+        responses = self.get_request_api_batch(
+            urls, headers, concurrency, return_exceptions=return_exceptions
+        )
+        return self._as_json(responses)
+
+    @staticmethod
+    def _as_json(responses: BATCH_RESULT_TYPE) -> BATCH_JSON_TYPE:
+        return {
+            key: response if isinstance(response, Exception) else response.json()
+            for key, response in responses.items()
+        }
@@ -0,0 +1,232 @@
+import atexit
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional
+
+from trade.utils.singleton_meta import SingletonMeta
+
+EXECUTOR_WORKERS = int(os.getenv("EXECUTOR_WORKERS", 16))
+TASK_TIMEOUT = float(os.getenv("TASK_TIMEOUT", 0)) or None
+POLL_INTERVAL = 0.05
+DEFAULT_BATCH = "default"
+TASK_TIMED_OUT = "Task {0} timed out after {1}s."
+INVALID_WORKERS = "Executor workers must be positive. Received: {0}"
+
+
+@dataclass
+class TaskResult:
+    key: Hashable
+    value: Any = None
+    error: Optional[BaseException] = None
+    latency: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchStats:
+    name: str
+    tasks: int = 0
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    latencies: List[float] = field(default_factory=list, repr=False)
+    started_at: float = field(default_factory=monotonic, repr=False)
+    finished_at: Optional[float] = field(default=None, repr=False)
+
+    def record(self, result: TaskResult) -> None:
+        self.latencies.append(result.latency)
+
+        if result.ok:
+            self.completed += 1
+        elif isinstance(result.error, TimeoutError):
+            self.timed_out += 1
+        else:
+            self.failed += 1
+
+    @property
+    def wall_time(self) -> float:
+        finished_at = monotonic() if self.finished_at is None else self.finished_at
+        return finished_at - self.started_at
+
+    @property
+    def mean_latency(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    @property
+    def max_latency(self) -> float:
+        return max(self.latencies, default=0.0)
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * pct / 100))]
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "tasks": self.tasks,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "wall_time": round(self.wall_time, 4),
+            "mean_latency": round(self.mean_latency, 4),
+            "p95_latency": round(self.percentile(95), 4),
+            "max_latency": round(self.max_latency, 4),
+        }
+
+
+class ExecutorService(metaclass=SingletonMeta):
+    """
+    Process wide, bounded thread pool for fanning blocking calls (e.g.
+    downloads per symbol) out. `map` & `as_completed` run a callable over
+    many items, with an optional timeout per task counted from the moment
+    it starts running, and keep the latency stats of the last batch run
+    under each name. Pending tasks are cancelled on shutdown & at exit.
+    """
+
+    def __init__(self, max_workers: int = EXECUTOR_WORKERS):
+        self.max_workers = max_workers
+        self.stats: Dict[str, BatchStats] = dict()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = Lock()
+        atexit.register(self.shutdown, wait=False)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="market-generic"
+                )
+
+            return self._executor
+
+    def resize(self, max_workers: int) -> None:
+        if max_workers <= 0:
+            raise ValueError(INVALID_WORKERS.format(max_workers))
+
+        self.shutdown(wait=True, cancel_futures=False)
+        self.max_workers = max_workers
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        return self.executor.submit(func, *args, **kwargs)
+
+    def as_completed(
+        self,
+        func: Callable,
+        items: Iterable[Any],
+        timeout: Optional[float] = TASK_TIMEOUT,
+        name: str = DEFAULT_BATCH,
+    ) -> Iterator[TaskResult]:
+        """
+        `func(item)` for every item, yielded as `TaskResult`s keyed by the
+        item in completion order. Errors (including a `TimeoutError` for
+        tasks running past `timeout` seconds) are returned, not raised.
+        """
+
+        items = list(items)
+        started: Dict[int, float] = dict()
+        stats = BatchStats(name, tasks=len(items))
+        self.stats[name] = stats
+
+        def run(position: int, item: Any) -> Any:
+            started[position] = monotonic()
+            return func(item)
+
+        futures = {
+            self.submit(run, position, item): position
+            for position, item in enumerate(items)
+        }
+        pending = set(futures)
+
+        try:
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=None if timeout is None else POLL_INTERVAL,
+                    return_when=FIRST_COMPLETED,
+                )
+
+                for future in done:
+                    position = futures[future]
+                    latency = monotonic() - started.get(position, monotonic())
+                    error = future.exception()
+                    result = TaskResult(
+                        items[position],
+                        None if error is not None else future.result(),
+                        error,
+                        latency,
+                    )
+                    stats.record(result)
+                    yield result
+
+                if timeout is None:
+                    continue
+
+                now = monotonic()
+
+                for future in list(pending):
+                    position = futures[future]
+
+                    if position in started and now - started[position] > timeout:
+                        # A running thread can't be stopped, it is abandoned.
+                        future.cancel()
+                        pending.discard(future)
+                        error = TimeoutError(
+                            TASK_TIMED_OUT.format(items[position], timeout)
+                        )
+                        result = TaskResult(
+                            items[position], None, error, now - started[position]
+                        )
+                        stats.record(result)
+                        yield result
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+            stats.finished_at = monotonic()
+
+    def map(
+        self,
+        func: Callable,
+        items: Iterable[Any],
+        timeout: Optional[float] = TASK_TIMEOUT,
+        name: str = DEFAULT_BATCH,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        `func(item)` for every item, in the order of `items`. The first
+        error is raised unless `return_exceptions` is set, in which case
+        errors take the place of the results.
+        """
+
+        items = list(items)
+        results: List[Any] = [None] * len(items)
+        keyed = list(enumerate(items))
+
+        for result in self.as_completed(
+            lambda pair: func(pair[1]), keyed, timeout=timeout, name=name
+        ):
+            position = result.key[0]
+
+            if not result.ok and not return_exceptions:
+                raise result.error
+
+            results[position] = result.value if result.ok else result.error
+
+        return results
@@ -0,0 +1,278 @@
+import json
+import os
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import RLock
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+
+except ImportError:  # pragma: no cover - not a POSIX platform.
+    fcntl = None
+
+from trade.utils.response_cache import CACHE_DIR
+from trade.utils.singleton_meta import SingletonMeta
+
+HISTORY_DIR = Path(os.getenv("HISTORY_DIR", CACHE_DIR / Path("history")))
+HISTORY_ENABLED = os.getenv("HISTORY_STORE", "1") not in ("0", "false", "False")
+HISTORY_INTERVALS = ("1d",)
+HISTORY_SUFFIX = ".parquet"
+HISTORY_MANIFEST = "manifest.json"
+HISTORY_LOCK = ".lock"
+# Download params of `YFinance` by default & params not changing the bars.
+HISTORY_PARAMS = dict(auto_adjust=True, rounding=True)
+HISTORY_UNKEYED_PARAMS = ("start", "end", "period", "progress", "threads", "group_by")
+HISTORY_PRICE_COLUMNS = ("Open", "High", "Low", "Close", "Adj Close")
+# Stored days fetched again by an update, to spot bars restated since.
+HISTORY_OVERLAP = timedelta(days=7)
+DATE_COLUMN = "Date"
+COVERAGE_TYPE = Tuple[date, date]
+
+
+class HistoryStore(metaclass=SingletonMeta):
+    """
+    Local columnar store of downloaded OHLCV bars, on unless disabled
+    (`HISTORY_STORE=0`). Bars are kept as they come from `yf.download`,
+    one parquet file per key & ticker (`<history_dir>/<key>/<ticker>.parquet`),
+    the key being the interval & download params (see `key_of`), so
+    adjusted & raw bars never share a file. A manifest per key records the
+    range of days already fetched for each ticker (holidays included), so
+    that an update only asks for the days after it. Only completed
+    sessions (before today) are stored. Writes hold a lock file of the key,
+    so processes sharing the store merge their manifest entries.
+    """
+
+    def __init__(
+        self, history_dir: Path = HISTORY_DIR, enabled: bool = HISTORY_ENABLED
+    ):
+        self.history_dir = Path(history_dir)
+        self.enabled = enabled
+        self._manifests: Dict[str, Tuple[int, Dict[str, list]]] = dict()
+        self._lock = RLock()
+
+    def supports(self, interval: str) -> bool:
+        return self.enabled and interval in HISTORY_INTERVALS
+
+    @staticmethod
+    def key_of(interval: str, **params) -> str:
+        """
+        Key of `interval` bars downloaded with `params` (`yf.download`
+        keywords), e.g. `1d/auto_adjust=True-rounding=True`.
+        """
+
+        params = {k: v for k, v in params.items() if k not in HISTORY_UNKEYED_PARAMS}
+        params.pop("interval", None)
+        variant = "-".join("{0}={1}".format(k, params[k]) for k in sorted(params))
+        return interval + "/" + variant if variant else interval
+
+    def path_of(self, ticker: str, key: str) -> Path:
+        return self.history_dir / Path(key) / Path(ticker + HISTORY_SUFFIX)
+
+    def _manifest_path(self, key: str) -> Path:
+        return self.history_dir / Path(key) / Path(HISTORY_MANIFEST)
+
+    def _manifest(self, key: str) -> Dict[str, list]:
+        """Manifest of `key`, read again whenever another writer changed it."""
+
+        path = self._manifest_path(key)
+
+        try:
+            modified = path.stat().st_mtime_ns
+
+        except FileNotFoundError:
+            modified = -1
+
+        if key not in self._manifests or self._manifests[key][0] != modified:
+            try:
+                manifest = json.loads(path.read_text())
+
+            except (FileNotFoundError, ValueError):
+                manifest = dict()
+
+            self._manifests[key] = (modified, manifest)
+
+        return self._manifests[key][1]
+
+    @contextmanager
+    def _locked(self, key: str):
+        """The thread lock & (on POSIX) an exclusive lock file of `key`."""
+
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+
+            path = self.history_dir / Path(key) / Path(HISTORY_LOCK)
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(path, "a") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+
+                try:
+                    yield
+
+                finally:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _write_atomic(path: Path, write) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile(dir=path.parent, delete=False) as file:
+            write(file)
+
+        os.replace(file.name, path)
+
+    def coverage(self, ticker: str, key: str) -> Optional[COVERAGE_TYPE]:
+        """First & last day (inclusive) already fetched for `ticker`."""
+
+        with self._lock:
+            covered = self._manifest(key).get(ticker, None)
+
+        if covered is None:
+            return None
+
+        return date.fromisoformat(covered[0]), date.fromisoformat(covered[1])
+
+    def last_session(self, ticker: str, key: str) -> Optional[date]:
+        covered = self.coverage(ticker, key)
+        return None if covered is None else covered[1]
+
+    def missing_from(
+        self, ticker: str, key: str, start: date, end: date
+    ) -> Optional[date]:
+        """
+        First day to fetch to cover `start` up to (excluding) `end`, None
+        when nothing is missing. Days from today on are always missing.
+        """
+
+        covered = self.coverage(ticker, key)
+
+        if covered is None or start < covered[0]:
+            return start
+
+        fetch_from = covered[1] + timedelta(days=1)
+        return fetch_from if fetch_from < end else None
+
+    def read(
+        self,
+        ticker: str,
+        key: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> pd.DataFrame:
+        """Stored bars of `ticker` from `start` up to (excluding) `end`."""
+
+        filters = list()
+
+        if start is not None:
+            filters.append((DATE_COLUMN, ">=", pd.Timestamp(start)))
+
+        if end is not None:
+            filters.append((DATE_COLUMN, "<", pd.Timestamp(end)))
+
+        try:
+            data = pd.read_parquet(self.path_of(ticker, key), filters=filters or None)
+
+        except FileNotFoundError:
+            return pd.DataFrame()
+
+        return data.set_index(DATE_COLUMN)
+
+    def read_many(
+        self,
+        tickers: Iterable[str],
+        key: str,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        return {i: self.read(i, key, start, end) for i in tickers}
+
+    def is_restated(self, ticker: str, key: str, data: pd.DataFrame) -> bool:
+        """
+        Whether the prices of `data` differ from the stored bars of the
+        same days, as adjusted bars do after a split or a dividend.
+        """
+
+        if data.empty:
+            return False
+
+        stored = self.read(ticker, key, data.index[0], data.index[-1] + timedelta(1))
+        days = stored.index.intersection(data.index)
+        columns = [
+            i
+            for i in HISTORY_PRICE_COLUMNS
+            if i in stored.columns and i in data.columns
+        ]
+
+        if days.empty or not columns:
+            return False
+
+        return not np.allclose(
+            stored.loc[days, columns].to_numpy(float),
+            data.loc[days, columns].to_numpy(float),
+            rtol=1e-4,
+            equal_nan=True,
+        )
+
+    def append(
+        self,
+        ticker: str,
+        key: str,
+        data: pd.DataFrame,
+        start: date,
+        end: date,
+        replace: bool = False,
+    ) -> None:
+        """
+        Merge bars fetched for `start` up to (excluding) `end` into the
+        store, or with `replace` make them the stored bars of `ticker`;
+        bars of today or later are left out as still forming.
+        """
+
+        today = pd.Timestamp(date.today())
+        covered_to = min(end, date.today()) - timedelta(days=1)
+
+        if covered_to < start:
+            return
+
+        data = data.loc[data.index < today] if not data.empty else data
+
+        with self._locked(key):
+            stored = pd.DataFrame() if replace else self.read(ticker, key)
+
+            if not data.empty or replace:
+                data = pd.concat([stored, data]) if not stored.empty else data
+                data = data[~data.index.duplicated(keep="last")].sort_index()
+                data.index.name = DATE_COLUMN
+                self._write_atomic(
+                    self.path_of(ticker, key),
+                    lambda file: data.reset_index().to_parquet(file, index=False),
+                )
+
+            manifest = dict(self._manifest(key))
+            covered = None if replace else self.coverage(ticker, key)
+            covered = (start, covered_to) if covered is None else covered
+            manifest[ticker] = [
+                min(start, covered[0]).isoformat(),
+                max(covered_to, covered[1]).isoformat(),
+            ]
+            content = json.dumps(manifest, sort_keys=True).encode("utf-8")
+            self._write_atomic(
+                self._manifest_path(key), lambda file: file.write(content)
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            for interval in HISTORY_INTERVALS:
+                for path in (self.history_dir / Path(interval)).glob("**/*"):
+                    if path.name == HISTORY_MANIFEST or path.suffix == HISTORY_SUFFIX:
+                        path.unlink(missing_ok=True)
+
+            self._manifests.clear()
@@ -1,20 +1,38 @@
 import re
-from typing import Tuple
+from typing import Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
+from requests import Session
+
+from trade.utils.transport import Transport
 
 
 class HtmlParser:
-    def __init__(self, url: str, headers: dict, matching_words: Tuple[str]):
+    def __init__(
+        self,
+        url: str,
+        headers: dict,
+        matching_words: Tuple[str],
+        session: Optional[Session] = None,
+    ):
 
         self.url = url
         self.headers = headers
         self.matching_words = matching_words
+        self.session = session
 
     def get_page_html(self) -> str:
+        transport = Transport()
+
+        if transport.is_replaying:
+            return transport.replay_response(self.url).text
+
+        client = requests if self.session is None else self.session
+        response = client.get(self.url, headers=self.headers)
+        transport.record_response(self.url, response)
 
-        return requests.get(self.url, headers=self.headers).text
+        return response.text
 
     def soup_parser(self) -> BeautifulSoup:
 
@@ -1,23 +1,34 @@
+import codecs
 import csv
 import os
 import warnings
 from abc import ABC
-from io import BytesIO
-from typing import Optional, Tuple
+from contextlib import contextmanager
+from io import BufferedReader, BytesIO
+from typing import IO, Iterator, Optional, Tuple, Union
 from urllib.error import HTTPError
 from urllib.parse import urlparse
-from zipfile import ZipFile
+from zipfile import BadZipFile, ZipFile
 
 import requests
 from pandas import DataFrame, read_csv, read_excel
-from requests import Session
 from requests.exceptions import ConnectionError, InvalidURL, ReadTimeout
 
 from trade.utils.html_parsing import HtmlParser
+from trade.utils.rate_limiter import RateLimiter
+from trade.utils.response_cache import ResponseCache
+from trade.utils.session_pool import REFRESH_STATUS_CODES, SessionPool
+from trade.utils.transport import Transport
 
 warnings.simplefilter(action="ignore", category=FutureWarning)
 
 CHUNK_SIZE = 1024
+SNIFF_SIZE = 8192
+ZIP_SIGNATURE = b"PK\x03\x04"
+XLS_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+XLSX_MEMBER = "[Content_Types].xml"
+MAX_RETRIES = int(os.getenv("MAX_RETRIES", 3))
+RETRY_STATUS_CODES = REFRESH_STATUS_CODES + (429,)
 INVALID_URL = "URL: {0}, Status Code:{1}"
 RECEIVED_STATUS = "Status Code Received: {0}"
 UNKNOWN_CONTENT = "Unknown Content type."
@@ -29,6 +40,22 @@ class CustomHTTPException(Exception):
 
 class DownloadTools(ABC):
 
+    @property
+    def session_pool(self) -> SessionPool:
+        return SessionPool()
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return RateLimiter()
+
+    @property
+    def response_cache(self) -> ResponseCache:
+        return ResponseCache()
+
+    @property
+    def transport(self) -> Transport:
+        return Transport()
+
     def match_http(self, result, status_code: int, url: Optional[str] = None):
         msg = ""
         match status_code:
@@ -50,30 +77,109 @@ class DownloadTools(ABC):
 
     def parse_through_html(self, url: str, headers: dict, tags: Tuple[str]) -> str:
 
-        html_parser = HtmlParser(url, headers, tags)
+        session = self.session_pool.get_session(url).session
+        html_parser = HtmlParser(url, headers, tags, session=session)
 
         return html_parser.get_latest_file()
 
-    def get_cookies(self, base_url: str, headers: dict, timeout: int = 5) -> dict:
+    def get_cookies(
+        self, base_url: str, headers: dict, timeout: int = 5, refresh: bool = False
+    ) -> dict:
+        """
+        Cookies of the pooled session for the host of `base_url`.
+        The host's homepage is only visited when the cookies are
+        missing, older than the pool's TTL or when `refresh` is set.
+        Failed visits are retried at most MAX_RETRIES times, each
+        one paced by the host's rate limiter & back off.
+        """
 
         url = self.extract_domain(base_url)
+        host_session = self.session_pool.get_session(url)
+        fetched_at = host_session.cookies_fetched_at
 
-        session = Session()
-        try:
-            request = session.get(url, headers=headers, timeout=timeout)
+        for attempt in range(1, MAX_RETRIES + 1):
+            if not (refresh or host_session.cookies_expired):
+                return host_session.cookies
 
-        except (ConnectionError, ReadTimeout) as msg:
-            return self.get_cookies(url, headers)
+            # Wait for the host's pacing before taking the session lock,
+            # so threads reading fresh cookies are never held up by it.
+            self.rate_limiter.acquire(url)
 
-        return dict(request.cookies)
+            with host_session.lock:
+                # Another thread refreshed the cookies while this one waited.
+                if host_session.cookies_fetched_at != fetched_at and not (
+                    host_session.cookies_expired
+                ):
+                    return host_session.cookies
+
+                try:
+                    cookies = self.session_pool.refresh_cookies(
+                        host_session, url, headers, timeout
+                    )
+
+                except (ConnectionError, ReadTimeout):
+                    self.rate_limiter.report(url)
+
+                    if attempt == MAX_RETRIES:
+                        raise
+
+                else:
+                    self.rate_limiter.report(url, 200)
+                    return cookies
+
+    def _send_request(
+        self, url: str, headers: dict, cookies: Optional[dict] = None, **kwargs
+    ):
+        host_session = self.session_pool.get_session(url)
+
+        for attempt in range(1, MAX_RETRIES + 1):
+            self.get_cookies(url, headers)
+            self.rate_limiter.acquire(url)
+
+            try:
+                result = host_session.get(
+                    url, headers=headers, cookies=cookies, **kwargs
+                )
+
+            except (ConnectionError, ReadTimeout):
+                self.rate_limiter.report(url)
+
+                if attempt == MAX_RETRIES:
+                    raise
+
+                continue
+
+            self.rate_limiter.report(url, result.status_code)
+
+            if result.status_code in REFRESH_STATUS_CODES:
+                host_session.expire_cookies()
+
+            if result.status_code not in RETRY_STATUS_CODES:
+                break
+
+        return result
 
     def get_request_api(
         self, url: str, headers: dict, cookies: Optional[dict] = None, **kwargs
     ):
 
-        cookies = self.get_cookies(url, headers)
-        result = requests.get(url, headers=headers, cookies=cookies, **kwargs)
-        return self.match_http(result, result.status_code, url)
+        if self.transport.is_replaying:
+            result = self.transport.replay_response(url)
+            return self.match_http(result, result.status_code, url)
+
+        cached = self.response_cache.get(url, headers)
+        result = cached
+
+        if cached is None:
+            result = self._send_request(url, headers, cookies, **kwargs)
+
+        self.transport.record_response(url, result)
+        result = self.match_http(result, result.status_code, url)
+
+        if cached is None:
+            self.response_cache.set(url, headers, result)
+
+        return result
 
     def extract_domain(self, url: str) -> str:
         parsed_url = urlparse(url)
@@ -84,79 +190,112 @@ class DownloadTools(ABC):
     def get_headers(self, url):
         return requests.head(url)
 
-    def download_data(self, url: str, headers: Optional[str] = None) -> DataFrame:
+    def download_data(
+        self, url: str, headers: Optional[str] = None, **read_kwargs
+    ) -> DataFrame:
         """
-        For a given url and file name
-        download data to the provided filename/path.
+        For a given url, the downloaded (zipped) CSV or Excel file as a
+        DataFrame. `read_kwargs` (e.g. `usecols`, `dtype`) go to the parser.
         """
-        domain = self.extract_domain(url)
-        cookies = self.get_cookies(domain, headers)
-        response = self.get_request_api(url, headers, cookies)
-
-        bytes_obj = BytesIO(response.content)
+        response = self.get_request_api(url, headers)
 
-        if self.is_zip(bytes_obj):
-            bytes_obj = self.unzip(bytes_obj)
-
-        try:
-            result = self.read_from_buffer(bytes_obj)
-        except ValueError:
-            result = self.read_from_buffer(response.content)
+        return self.read_from_buffer(BytesIO(response.content), **read_kwargs)
 
-        return result
-
-    def unzip(self, source_buffer: BytesIO) -> bytes:
+    @contextmanager
+    def unzip(self, source_buffer: BytesIO) -> Iterator[IO[bytes]]:
         """
-        Extracts content of the zip file and
-        returns a reference to the extracted CSV file.
+        Stream of the first file in the zip, decompressed as it is read
+        rather than extracted into a buffer. Buffered by `SNIFF_SIZE`, so
+        its head can be peeked at. The archive is closed on exit.
         :param source_buffer: Path to the source Zip Bytes.
-        :return: str
+        :return: Iterator[IO[bytes]]
         """
-        zip_file = ZipFile(source_buffer)
-        file_name = zip_file.namelist()[0]
-        csv_buffer = BytesIO(zip_file.read(file_name))
-        zip_file.close()
+        with ZipFile(source_buffer) as zip_file:
+            with zip_file.open(zip_file.namelist()[0]) as member:
+                yield BufferedReader(member, SNIFF_SIZE)
+
+    def prefix(self, byte_obj: Union[BytesIO, bytes], size: int = SNIFF_SIZE) -> bytes:
+        """First `size` bytes of the content, without copying the rest."""
+
+        if isinstance(byte_obj, BytesIO):
+            with byte_obj.getbuffer() as buffer:
+                return bytes(buffer[:size])
+
+        if isinstance(byte_obj, (bytes, bytearray)):
+            return bytes(byte_obj[:size])
+
+        return b""
 
-        return csv_buffer
+    def is_zip(self, byte_obj: Union[BytesIO, bytes]) -> bool:
+        return self.prefix(byte_obj, len(ZIP_SIGNATURE)) == ZIP_SIGNATURE
 
-    def is_zip(self, byte_obj: BytesIO):
-        zip_signature = b"PK\x03\x04"
+    def is_xls(self, byte_obj: Union[BytesIO, bytes]) -> bool:
+        return self.prefix(byte_obj, len(XLS_SIGNATURE)) == XLS_SIGNATURE
 
-        return byte_obj.getvalue().startswith(zip_signature)
+    def is_xlsx(self, byte_obj: Union[BytesIO, bytes]) -> bool:
+        """A zip holding an OOXML content types part, from its directory only."""
 
-    def is_xlsx(self, byte_obj: BytesIO) -> bool:
-        xlsx_signature = b"PK\x03\x04"
+        if not self.is_zip(byte_obj):
+            return False
+
+        if not isinstance(byte_obj, BytesIO):
+            byte_obj = BytesIO(byte_obj)
 
-        if hasattr(byte_obj, "startswith"):
-            return byte_obj.startswith(xlsx_signature)
+        try:
+            with ZipFile(byte_obj) as zip_file:
+                return XLSX_MEMBER in zip_file.namelist()
 
-        return False
+        except BadZipFile:
+            return False
+
+    def is_csv(self, byte_obj: Union[BytesIO, bytes]) -> bool:
+        """Sniffs only the complete lines of the first `SNIFF_SIZE` bytes."""
+
+        head = self.prefix(byte_obj)
 
-    def is_csv(self, byte_obj: BytesIO):
         try:
-            content = byte_obj.getvalue().decode("utf-8")
-            dialect = csv.Sniffer().sniff(content)
-            # TODO: Handle _csv.Error here.
+            # A multi byte character cut by the prefix is left undecoded.
+            content = codecs.getincrementaldecoder("utf-8")().decode(head)
+
+            if len(head) == SNIFF_SIZE and "\n" in content:
+                content = content[: content.rindex("\n")]
+
+            csv.Sniffer().sniff(content)
             return True
 
-        except (UnicodeDecodeError, csv.Error, AttributeError):
+        except (UnicodeDecodeError, csv.Error):
             return False
 
-    def read_csv(self, bytes_obj: BytesIO) -> DataFrame:
-        return read_csv(bytes_obj)
+    def read_csv(self, bytes_obj: Union[BytesIO, IO[bytes]], **kwargs) -> DataFrame:
+        return read_csv(bytes_obj, **kwargs)
 
-    def read_xlsx(self, bytes_obj: BytesIO) -> DataFrame:
+    def read_xlsx(self, bytes_obj: BytesIO, **kwargs) -> DataFrame:
         try:
-            return read_excel(bytes_obj)
+            return read_excel(bytes_obj, **kwargs)
         except ValueError:
-            return read_excel(bytes_obj, engine="openpyxl")
+            return read_excel(bytes_obj, engine="openpyxl", **kwargs)
+
+    def read_zip(self, bytes_obj: BytesIO, **kwargs) -> DataFrame:
+        """CSV in a zip, sniffed from its head & parsed as it is decompressed."""
+
+        with self.unzip(bytes_obj) as member:
+            if not self.is_csv(member.peek(SNIFF_SIZE)[:SNIFF_SIZE]):
+                raise ValueError(UNKNOWN_CONTENT)
+
+            return self.read_csv(member, **kwargs)
+
+    def read_from_buffer(self, bytes_obj: BytesIO, **kwargs) -> DataFrame:
+        if not isinstance(bytes_obj, BytesIO):
+            bytes_obj = BytesIO(bytes_obj)
+
+        if self.is_xlsx(bytes_obj) or self.is_xls(bytes_obj):
+            return self.read_xlsx(bytes_obj, **kwargs)
 
-    def read_from_buffer(self, bytes_obj: BytesIO):
-        if self.is_csv(bytes_obj):
-            return self.read_csv(bytes_obj)
+        elif self.is_zip(bytes_obj):
+            return self.read_zip(bytes_obj, **kwargs)
 
-        elif self.is_xlsx(bytes_obj):
-            return self.read_xlsx(bytes_obj)
+        elif self.is_csv(bytes_obj):
+            return self.read_csv(bytes_obj, **kwargs)
 
         else:
             raise ValueError(UNKNOWN_CONTENT)
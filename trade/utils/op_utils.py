@@ -1,9 +1,12 @@
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import lru_cache, wraps
 from os import cpu_count
 from re import compile, search
 from time import monotonic_ns
-from typing import List, Union
+from typing import Dict, Hashable, Iterable, List, Union
+
+import numpy as np
+
+from trade.utils.executor_service import ExecutorService
 
 
 def timed_lru_cache(seconds: int = 60, max_size: int = 128, typed: bool = False):
@@ -29,15 +32,33 @@ def timed_lru_cache(seconds: int = 60, max_size: int = 128, typed: bool = False)
 
 def find_least_difference_strike(strikes: List[int]):
 
-    min_diff = float("inf")
+    return min_strike_gaps({None: strikes}).get(None, float("inf"))
+
+
+def min_strike_gaps(strikes: Dict[Hashable, Iterable[float]]) -> Dict[Hashable, float]:
+    """
+    Least gap between the distinct (positive) strikes of every key, in one
+    pass over all the strikes. Keys with less than two strikes are left out.
+    """
 
-    for i in range(len(strikes) - 1):
-        diff = abs(strikes[i] - strikes[i + 1])
+    keys = list(strikes.keys())
+    unique = [np.unique(np.asarray(list(strikes[key]), dtype=float)) for key in keys]
+    unique = [i[i > 0] for i in unique]
+    sizes = np.asarray([len(i) for i in unique], dtype=int)
 
-        if diff < min_diff:
-            min_diff = diff
+    if sizes.sum() == 0:
+        return dict()
 
-    return min_diff
+    values = np.concatenate(unique)
+    groups = np.repeat(np.arange(len(keys)), sizes)
+    gaps = np.diff(values)
+    # Gaps across two keys are masked out.
+    gaps[groups[1:] != groups[:-1]] = np.inf
+    gaps = np.append(gaps, np.inf)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    least = np.minimum.reduceat(gaps, np.minimum(starts, len(gaps) - 1))
+
+    return {keys[i]: float(least[i]) for i in range(len(keys)) if sizes[i] > 1}
 
 
 def contains_sub_string(pattern: str, string: str) -> bool:
@@ -65,14 +86,25 @@ def calculate_pct_diff(
 
 
 def concurrent_execution(func):
+    """
+    With `concurrent=True` and a list (or tuple) as first argument, `func`
+    is fanned out over its items on the shared `ExecutorService` and a
+    dict of item to result is returned. A single item runs inline.
+    """
+
     @wraps(func)
     def wrapper(self, *args, **kwargs):
-        if kwargs.get("concurrent", False):
-            _ = kwargs.pop("concurrent") if "concurrent" in kwargs.keys() else None
-            with ThreadPoolExecutor(max_workers=1000) as executor:
-                return executor.submit(func, self, *args, **kwargs).result()
-
-        else:
-            return func(self, *args, **kwargs)
+        concurrent = kwargs.pop("concurrent", False)
+
+        if concurrent and len(args) > 0 and isinstance(args[0], (list, tuple)):
+            items, args = args[0], args[1:]
+            results = ExecutorService().map(
+                lambda item: func(self, item, *args, **kwargs),
+                items,
+                name=func.__name__,
+            )
+            return dict(zip(items, results))
+
+        return func(self, *args, **kwargs)
 
     return wrapper
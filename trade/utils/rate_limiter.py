@@ -0,0 +1,232 @@
+import asyncio
+import os
+from dataclasses import dataclass, field
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from trade.utils.singleton_meta import SingletonMeta
+
+DEFAULT_CLASS = "default"
+DEFAULT_RATE = float(os.getenv("RATE_LIMIT", 3))
+DEFAULT_CAPACITY = float(os.getenv("RATE_LIMIT_BURST", 6))
+BACKOFF_BASE = float(os.getenv("BACKOFF_BASE", 1))
+BACKOFF_MAX = float(os.getenv("BACKOFF_MAX", 60))
+BACKOFF_STATUS_CODES = (403, 429)
+RATE_LIMITS_TYPE = Dict[str, Dict[str, Dict[str, object]]]
+INVALID_RATE = "Rate & Capacity must be positive. Received rate: {0}, capacity: {1}"
+
+
+@dataclass
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens/second up to `capacity`.
+    Tokens are reserved rather than polled for, so a caller gets back
+    how long to wait before its slot is due.
+    """
+
+    rate: float
+    capacity: float
+    patterns: Tuple[str, ...] = tuple()
+    tokens: float = field(init=False)
+    updated_at: float = field(init=False, default_factory=monotonic)
+    lock: Lock = field(init=False, default_factory=Lock, repr=False)
+
+    def __post_init__(self):
+        if self.rate <= 0 or self.capacity <= 0:
+            raise ValueError(INVALID_RATE.format(self.rate, self.capacity))
+
+        self.patterns = tuple(self.patterns)
+        self.tokens = self.capacity
+
+    def matches(self, url: str) -> bool:
+        return any(pattern in url for pattern in self.patterns)
+
+    def reserve(self, tokens: float = 1) -> float:
+        with self.lock:
+            now = monotonic()
+            elapsed = now - self.updated_at
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+            self.tokens -= tokens
+
+            if self.tokens >= 0:
+                return 0.0
+
+            return -self.tokens / self.rate
+
+
+@dataclass
+class HostCooldown:
+    """Back off state of a host, shared by every worker hitting it."""
+
+    failures: int = 0
+    cooldown_until: float = 0.0
+    lock: Lock = field(default_factory=Lock, repr=False)
+
+    @property
+    def remaining(self) -> float:
+        return max(self.cooldown_until - monotonic(), 0.0)
+
+    @property
+    def cooling_down(self) -> bool:
+        return self.remaining > 0
+
+
+class RateLimiter(metaclass=SingletonMeta):
+    """
+    Process wide limiter keyed by host & endpoint class.
+    Each endpoint class (quotes, option chains, archives...) of a host
+    owns a token bucket, selected by matching the url against its
+    patterns, with the `default` class as fallback.
+    A 403/429 or a timeout puts the whole host into a cooldown which
+    grows exponentially, with jitter, on consecutive failures.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        capacity: float = DEFAULT_CAPACITY,
+        backoff_base: float = BACKOFF_BASE,
+        backoff_max: float = BACKOFF_MAX,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._buckets: Dict[str, Dict[str, TokenBucket]] = dict()
+        self._cooldowns: Dict[str, HostCooldown] = dict()
+        self._lock = Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        parsed_url = urlparse(url)
+        return parsed_url.netloc or parsed_url.path
+
+    def configure(
+        self,
+        host: str,
+        endpoint_class: str = DEFAULT_CLASS,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+        patterns: Optional[List[str]] = None,
+    ) -> TokenBucket:
+        bucket = TokenBucket(
+            self.rate if rate is None else rate,
+            self.capacity if capacity is None else capacity,
+            tuple() if patterns is None else tuple(patterns),
+        )
+
+        with self._lock:
+            buckets = self._buckets.setdefault(host, dict())
+            existing = buckets.get(endpoint_class, None)
+
+            # Re-configuring with the same limits keeps the bucket's state.
+            if existing is not None and (
+                existing.rate,
+                existing.capacity,
+                existing.patterns,
+            ) == (bucket.rate, bucket.capacity, bucket.patterns):
+                return existing
+
+            buckets[endpoint_class] = bucket
+
+        return bucket
+
+    def configure_from(self, rate_limits: RATE_LIMITS_TYPE) -> None:
+        """
+        Configure from a mapping of
+        `{host: {endpoint_class: {"rate":.., "capacity":.., "patterns": [..]}}}`
+        as declared under `RATE-LIMITS` in the market config.
+        """
+
+        for host, endpoint_classes in rate_limits.items():
+            for endpoint_class, params in endpoint_classes.items():
+                self.configure(host, endpoint_class, **params)
+
+    def classify(self, url: str) -> Tuple[str, str]:
+        host = self.host_of(url)
+
+        with self._lock:
+            buckets = list(self._buckets.get(host, dict()).items())
+
+        for endpoint_class, bucket in buckets:
+            if bucket.matches(url):
+                return host, endpoint_class
+
+        return host, DEFAULT_CLASS
+
+    def bucket(self, url: str) -> TokenBucket:
+        host, endpoint_class = self.classify(url)
+
+        with self._lock:
+            buckets = self._buckets.setdefault(host, dict())
+
+            if endpoint_class not in buckets:
+                buckets[endpoint_class] = TokenBucket(self.rate, self.capacity)
+
+            return buckets[endpoint_class]
+
+    def cooldown(self, url: str) -> HostCooldown:
+        host = self.host_of(url)
+
+        with self._lock:
+            return self._cooldowns.setdefault(host, HostCooldown())
+
+    def backoff_delay(self, failures: int) -> float:
+        """Exponential back off with equal jitter."""
+
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (failures - 1))
+        return uniform(delay / 2, delay)
+
+    def wait_time(self, url: str) -> float:
+        return max(self.cooldown(url).remaining, self.bucket(url).reserve())
+
+    def acquire(self, url: str) -> float:
+        wait = self.wait_time(url)
+
+        if wait > 0:
+            sleep(wait)
+
+        return wait
+
+    async def aacquire(self, url: str) -> float:
+        wait = self.wait_time(url)
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        return wait
+
+    def report(self, url: str, status_code: Optional[int] = None) -> None:
+        """
+        Record the outcome of a request. `status_code` as None stands
+        for a timeout or a dropped connection.
+        """
+
+        cooldown = self.cooldown(url)
+
+        with cooldown.lock:
+            if status_code is not None and status_code not in BACKOFF_STATUS_CODES:
+                cooldown.failures = 0
+                return
+
+            cooldown.failures += 1
+            cooldown.cooldown_until = max(
+                cooldown.cooldown_until,
+                monotonic() + self.backoff_delay(cooldown.failures),
+            )
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        return {
+            host: {"failures": cooldown.failures, "cooldown": cooldown.remaining}
+            for host, cooldown in self._cooldowns.items()
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._cooldowns.clear()
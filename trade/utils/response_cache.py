@@ -0,0 +1,206 @@
+import json
+import os
+import zlib
+from dataclasses import dataclass, field
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import time
+from typing import Dict, Optional, Tuple
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from trade.utils.singleton_meta import SingletonMeta
+
+CACHE_DIR = Path(
+    os.getenv("CACHE_DIR", Path.home() / Path(".cache") / Path("market-generic"))
+)
+CACHE_ENABLED = os.getenv("RESPONSE_CACHE", "1") not in ("0", "false", "False")
+CACHE_SUFFIX = ".zcache"
+CACHED_HEADERS = ("Content-Type", "Content-Disposition")
+CACHE_POLICIES_TYPE = Dict[str, Dict[str, object]]
+HEADER_LENGTH_BYTES = 4
+
+
+@dataclass
+class CachePolicy:
+    name: str
+    ttl: int
+    patterns: Tuple[str, ...] = tuple()
+    hits: int = 0
+    misses: int = 0
+
+    def __post_init__(self):
+        self.patterns = tuple(self.patterns)
+
+    def matches(self, url: str) -> bool:
+        return any(pattern in url for pattern in self.patterns)
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    stored_at: float
+    ttl: int
+    content: bytes = field(repr=False)
+
+    @property
+    def expired(self) -> bool:
+        return time() - self.stored_at >= self.ttl
+
+    def as_response(self) -> Response:
+        response = Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response.encoding = "utf-8"
+        return response
+
+    def dumps(self) -> bytes:
+        header = json.dumps(
+            {
+                "url": self.url,
+                "status_code": self.status_code,
+                "headers": self.headers,
+                "stored_at": self.stored_at,
+                "ttl": self.ttl,
+            }
+        ).encode("utf-8")
+        length = len(header).to_bytes(HEADER_LENGTH_BYTES, "big")
+        return zlib.compress(length + header + self.content)
+
+    @classmethod
+    def loads(cls, payload: bytes) -> "CacheEntry":
+        payload = zlib.decompress(payload)
+        length = int.from_bytes(payload[:HEADER_LENGTH_BYTES], "big")
+        header = json.loads(payload[HEADER_LENGTH_BYTES : HEADER_LENGTH_BYTES + length])
+        return cls(**header, content=payload[HEADER_LENGTH_BYTES + length :])
+
+
+class ResponseCache(metaclass=SingletonMeta):
+    """
+    Read through disk cache of HTTP responses.
+    Only urls matching one of the configured policies are cached, each
+    for the policy's TTL, keyed by url & request headers. Payloads are
+    zlib compressed and written atomically (temp file + rename) so that
+    concurrent processes can share a cache directory.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, enabled: bool = CACHE_ENABLED):
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+        self.policies: Dict[str, CachePolicy] = dict()
+        self._lock = Lock()
+
+    def configure(self, name: str, ttl: int, patterns: Tuple[str, ...]) -> None:
+        with self._lock:
+            if name not in self.policies:
+                self.policies[name] = CachePolicy(name, ttl, patterns)
+            else:
+                self.policies[name].ttl = ttl
+                self.policies[name].patterns = tuple(patterns)
+
+    def configure_from(self, policies: CACHE_POLICIES_TYPE) -> None:
+        """
+        Configure from a mapping of `{name: {"ttl": .., "patterns": [..]}}`
+        as declared under `CACHE-POLICIES` in the market config.
+        """
+
+        for name, params in policies.items():
+            self.configure(name, **params)
+
+    def policy_for(self, url: str) -> Optional[CachePolicy]:
+        if not self.enabled:
+            return None
+
+        for policy in self.policies.values():
+            if policy.matches(url):
+                return policy
+
+        return None
+
+    def key(self, url: str, headers: Optional[dict] = None) -> str:
+        headers = dict() if headers is None else headers
+        headers = sorted((str(k).lower(), str(v)) for k, v in headers.items())
+        return sha256(json.dumps([url, headers]).encode("utf-8")).hexdigest()
+
+    def path_of(self, key: str) -> Path:
+        return self.cache_dir / Path(key[:2]) / Path(key + CACHE_SUFFIX)
+
+    def _read(self, path: Path) -> Optional[CacheEntry]:
+        try:
+            return CacheEntry.loads(path.read_bytes())
+
+        except FileNotFoundError:
+            return None
+
+        except (zlib.error, ValueError, TypeError, KeyError):
+            # A corrupt entry is dropped and treated as a miss.
+            path.unlink(missing_ok=True)
+            return None
+
+    def get(self, url: str, headers: Optional[dict] = None) -> Optional[Response]:
+        policy = self.policy_for(url)
+
+        if policy is None:
+            return None
+
+        entry = self._read(self.path_of(self.key(url, headers)))
+
+        with self._lock:
+            if entry is None or entry.expired:
+                policy.misses += 1
+                return None
+
+            policy.hits += 1
+
+        return entry.as_response()
+
+    def set(self, url: str, headers: Optional[dict], response: Response) -> bool:
+        policy = self.policy_for(url)
+
+        if policy is None or response.status_code != 200:
+            return False
+
+        entry = CacheEntry(
+            url=url,
+            status_code=response.status_code,
+            headers={
+                key: response.headers[key]
+                for key in CACHED_HEADERS
+                if key in response.headers
+            },
+            stored_at=time(),
+            ttl=policy.ttl,
+            content=response.content,
+        )
+        path = self.path_of(self.key(url, headers))
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with NamedTemporaryFile(dir=path.parent, delete=False) as file:
+            file.write(entry.dumps())
+
+        os.replace(file.name, path)
+        return True
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                name: {"hits": policy.hits, "misses": policy.misses}
+                for name, policy in self.policies.items()
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for policy in self.policies.values():
+                policy.hits, policy.misses = 0, 0
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*/*" + CACHE_SUFFIX):
+            path.unlink(missing_ok=True)
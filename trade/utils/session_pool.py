@@ -0,0 +1,149 @@
+import os
+from dataclasses import dataclass, field
+from threading import Lock, RLock
+from time import monotonic
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+
+from trade.utils.singleton_meta import SingletonMeta
+
+COOKIE_TTL = int(os.getenv("COOKIE_TTL", 300))
+POOL_CONNECTIONS = int(os.getenv("POOL_CONNECTIONS", 4))
+POOL_MAXSIZE = int(os.getenv("POOL_MAXSIZE", 32))
+REFRESH_STATUS_CODES = (401, 403)
+SESSION_STATS_TYPE = Dict[str, Dict[str, int]]
+
+
+@dataclass
+class HostSession:
+    """Keep-alive session and shared cookie jar for a single host."""
+
+    host: str
+    session: Session
+    cookie_ttl: int = COOKIE_TTL
+    cookies_fetched_at: Optional[float] = None
+    cookie_refreshes: int = 0
+    requests: int = 0
+    lock: RLock = field(default_factory=RLock, repr=False)
+
+    @property
+    def cookies(self) -> dict:
+        return self.session.cookies.get_dict()
+
+    @property
+    def cookies_expired(self) -> bool:
+        if self.cookies_fetched_at is None:
+            return True
+
+        return monotonic() - self.cookies_fetched_at >= self.cookie_ttl
+
+    def _iter_connection_pools(self):
+        for adapter in self.session.adapters.values():
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                yield pools[key]
+
+    @property
+    def connections_opened(self) -> int:
+        return sum(pool.num_connections for pool in self._iter_connection_pools())
+
+    @property
+    def connections_reused(self) -> int:
+        return sum(
+            max(pool.num_requests - pool.num_connections, 0)
+            for pool in self._iter_connection_pools()
+        )
+
+    def expire_cookies(self) -> None:
+        self.cookies_fetched_at = None
+
+    def mark_cookies_refreshed(self) -> None:
+        self.cookies_fetched_at = monotonic()
+        self.cookie_refreshes += 1
+
+    def get(self, url: str, **kwargs) -> Response:
+        self.requests += 1
+        return self.session.get(url, **kwargs)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "cookie_refreshes": self.cookie_refreshes,
+            "connections_opened": self.connections_opened,
+            "connections_reused": self.connections_reused,
+        }
+
+
+class SessionPool(metaclass=SingletonMeta):
+    """
+    Process wide pool of keep-alive sessions, one per host.
+    Cookies are fetched once per host and re-used until the TTL lapses
+    or the host answers with a 401/403.
+    """
+
+    def __init__(
+        self,
+        cookie_ttl: int = COOKIE_TTL,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+    ):
+        self.cookie_ttl = cookie_ttl
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._sessions: Dict[str, HostSession] = dict()
+        self._lock = Lock()
+
+    def __contains__(self, url: str) -> bool:
+        return self.host_of(url) in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        parsed_url = urlparse(url)
+        return parsed_url.netloc or parsed_url.path
+
+    def _create_session(self) -> Session:
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get_session(self, url: str) -> HostSession:
+        host = self.host_of(url)
+
+        with self._lock:
+            if host not in self._sessions:
+                self._sessions[host] = HostSession(
+                    host, self._create_session(), cookie_ttl=self.cookie_ttl
+                )
+
+            return self._sessions[host]
+
+    def refresh_cookies(
+        self, host_session: HostSession, url: str, headers: dict, timeout: int
+    ) -> dict:
+        host_session.session.cookies.clear()
+        host_session.get(url, headers=headers, timeout=timeout)
+        host_session.mark_cookies_refreshed()
+
+        return host_session.cookies
+
+    @property
+    def stats(self) -> SESSION_STATS_TYPE:
+        return {host: session.stats for host, session in self._sessions.items()}
+
+    def close(self) -> None:
+        with self._lock:
+            for host_session in self._sessions.values():
+                host_session.session.close()
+
+            self._sessions.clear()
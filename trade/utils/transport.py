@@ -0,0 +1,158 @@
+import json
+import os
+import zlib
+from contextlib import contextmanager
+from hashlib import sha256
+from io import BytesIO
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any, Literal, Optional, Tuple
+
+from pandas import DataFrame, read_pickle
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from trade.utils.singleton_meta import SingletonMeta
+
+LIVE, RECORD, REPLAY = "live", "record", "replay"
+TRANSPORT_MODES = (LIVE, RECORD, REPLAY)
+TRANSPORT_MODE_TYPE = Literal["live", "record", "replay"]
+TRANSPORT_MODE = os.getenv("TRANSPORT_MODE", LIVE)
+FIXTURE_ARCHIVE = os.getenv("FIXTURE_ARCHIVE", None)
+HTTP, FRAME = "http", "frame"
+RECORDED_HEADERS = ("Content-Type", "Content-Disposition")
+INVALID_MODE = "Invalid transport mode: {0}. Choose from {1}."
+ARCHIVE_NOT_SET = "Fixture archive not set for transport mode: {0}."
+FIXTURE_NOT_FOUND = "No recorded {0} fixture for: {1}"
+
+
+class FixtureNotFound(KeyError):
+    pass
+
+
+class Transport(metaclass=SingletonMeta):
+    """
+    Record/replay switch for everything that leaves the process.
+    In `record` mode every HTTP response & yfinance frame is written
+    to the fixture archive, in `replay` mode they are served from it
+    without touching the network. `live` is a pass through.
+
+    The archive is a directory holding one zlib compressed payload and
+    one json meta file per request, grouped by kind (http/frame).
+    """
+
+    def __init__(
+        self,
+        mode: TRANSPORT_MODE_TYPE = TRANSPORT_MODE,
+        archive: Optional[str] = FIXTURE_ARCHIVE,
+    ):
+        self.mode = LIVE
+        self.archive = None
+        self.set_mode(mode, archive)
+
+    def set_mode(self, mode: TRANSPORT_MODE_TYPE, archive: Optional[str] = None):
+        if mode not in TRANSPORT_MODES:
+            raise ValueError(INVALID_MODE.format(mode, TRANSPORT_MODES))
+
+        if mode != LIVE and archive is None:
+            raise ValueError(ARCHIVE_NOT_SET.format(mode))
+
+        self.mode = mode
+        self.archive = None if archive is None else Path(archive)
+
+    @contextmanager
+    def using(self, mode: TRANSPORT_MODE_TYPE, archive: Optional[str] = None):
+        previous = self.mode, self.archive
+        self.set_mode(mode, archive)
+
+        try:
+            yield self
+        finally:
+            self.mode, self.archive = previous
+
+    def recording(self, archive: str):
+        return self.using(RECORD, archive)
+
+    def replaying(self, archive: str):
+        return self.using(REPLAY, archive)
+
+    @property
+    def is_recording(self) -> bool:
+        return self.mode == RECORD
+
+    @property
+    def is_replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        return sha256(
+            json.dumps(parts, default=str, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _paths(self, kind: str, key: str) -> Tuple[Path, Path]:
+        base = self.archive / Path(kind) / Path(key)
+        return base.with_suffix(".json"), base.with_suffix(".bin")
+
+    def _write(self, kind: str, key: str, meta: dict, payload: bytes) -> None:
+        meta_path, payload_path = self._paths(kind, key)
+        meta_path.parent.mkdir(parents=True, exist_ok=True)
+
+        for path, content in (
+            (payload_path, zlib.compress(payload)),
+            (meta_path, json.dumps(meta, indent=2, default=str).encode("utf-8")),
+        ):
+            with NamedTemporaryFile(dir=path.parent, delete=False) as file:
+                file.write(content)
+
+            os.replace(file.name, path)
+
+    def _read(self, kind: str, key: str, label: str) -> Tuple[dict, bytes]:
+        meta_path, payload_path = self._paths(kind, key)
+
+        if not (meta_path.exists() and payload_path.exists()):
+            raise FixtureNotFound(FIXTURE_NOT_FOUND.format(kind, label))
+
+        meta = json.loads(meta_path.read_text())
+        return meta, zlib.decompress(payload_path.read_bytes())
+
+    def record_response(self, url: str, response: Any) -> None:
+        """Record a requests/httpx response fetched for `url`."""
+
+        if not self.is_recording:
+            return
+
+        meta = {
+            "url": url,
+            "status_code": response.status_code,
+            "headers": {
+                key: response.headers[key]
+                for key in RECORDED_HEADERS
+                if key in response.headers
+            },
+        }
+        self._write(HTTP, self.key(url), meta, response.content)
+
+    def replay_response(self, url: str) -> Response:
+        meta, content = self._read(HTTP, self.key(url), url)
+
+        response = Response()
+        response.url = meta["url"]
+        response.status_code = meta["status_code"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response._content = content
+        response.encoding = "utf-8"
+
+        return response
+
+    def record_frame(self, data: DataFrame, *parts: Any) -> None:
+        if not self.is_recording:
+            return
+
+        buffer = BytesIO()
+        data.to_pickle(buffer, compression=None)
+        self._write(FRAME, self.key(*parts), {"parts": parts}, buffer.getvalue())
+
+    def replay_frame(self, *parts: Any) -> DataFrame:
+        _, content = self._read(FRAME, self.key(*parts), str(parts))
+        return read_pickle(BytesIO(content), compression=None)